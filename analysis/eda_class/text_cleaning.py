@@ -1,4 +1,6 @@
+import re
 from abc import ABC, abstractmethod
+
 import pandas as pd
 
 
@@ -21,13 +23,13 @@ class StripUnitStrategy(TextCleaningStrategy):
 
     def clean_column(self, df: pd.DataFrame, column_name: str) -> pd.DataFrame:
         df = df.copy()
-        df[column_name] = (
-            df[column_name]
-            .astype(str)
-            .str.replace(self.unit_pattern, '', regex=True)
-            .str.strip()
+        # One anchored regex pass pulls out the number in front of the unit (same rule as the
+        # pipeline's NumericUnitParser); groups in the unit pattern are made non-capturing
+        unit = re.sub(r"(?<!\\)\((?!\?)", "(?:", self.unit_pattern)
+        number = df[column_name].astype(str).str.extract(
+            rf"^\s*([-+]?(?:\d+\.?\d*|\.\d+))\s*(?:{unit})?\s*$", expand=False
         )
-        df[column_name] = pd.to_numeric(df[column_name], errors='coerce')
+        df[column_name] = pd.to_numeric(number, errors="coerce")
         return df
 
 
@@ -3,28 +3,55 @@ import os
 from zenml import pipeline
 from zenml.integrations.mlflow.steps import mlflow_model_deployer_step
 
-from pipelines.training_pipeline import ml_pipeline
+from pipelines.training_pipeline import FEATURE_STRATEGIES, PASSTHROUGH_COLUMNS, ml_pipeline
+from steps.data_ingestion_step import data_ingestion_step
 from steps.dynamic_importer import dynamic_importer
+from steps.feature_engineering_step import build_strategies
+from steps.handle_missing_values_step import handle_missing_values_step
 from steps.model_loader import model_loader
 from steps.prediction_service_loader import prediction_service_loader
 from steps.predictor import predictor
+from steps.src.feature_engineering import required_columns
+from steps.warm_start_training_step import warm_start_training_step
 
 # Define path to requirements.txt (used by ZenML if needed for runtime packaging)
 requirements_file = os.path.join(os.path.dirname(__file__), "requirements.txt")
 
 
 @pipeline
-def continuous_deployment_pipeline():
+def continuous_deployment_pipeline(
+    retrain_mode: str = "full",
+    new_data_path: str = None,
+    model_name: str = "prices_predictor",
+):
     """
     Trains and deploys an MLflow model using the active ZenML stack.
 
-    - Triggers model training
-    - Deploys (or redeploys) the trained model using MLflow
+    - Triggers model training: a full ml_pipeline run, or with retrain_mode='warm_start' a refresh of
+      the production model on the listings at new_data_path only
+    - Deploys (or redeploys) the trained model using MLflow; a warm-start run only redeploys when the
+      model was updated, and reports drift through its 'needs_full_refit' output instead
     """
-    trained_model = ml_pipeline()  # Optional: capture for other usage
+    if retrain_mode == "warm_start":
+        production_model = model_loader(model_name=model_name)
+        raw_data = data_ingestion_step(
+            file_path=new_data_path,
+            columns=required_columns(build_strategies(FEATURE_STRATEGIES), PASSTHROUGH_COLUMNS),
+        )
+        new_data, _ = handle_missing_values_step(raw_data, "drop")
+        trained_model, deploy_decision, needs_full_refit = warm_start_training_step(
+            production_model=production_model,
+            new_data=new_data,
+        )
+    elif retrain_mode == "full":
+        trained_model = ml_pipeline()  # Optional: capture for other usage
+        deploy_decision = True
+    else:
+        raise ValueError(f"Unknown retrain_mode '{retrain_mode}'. Available: ['full', 'warm_start']")
+
     mlflow_model_deployer_step(
         model=trained_model,
-        deploy_decision=True,
+        deploy_decision=deploy_decision,
         workers=3,
     )
 
@@ -1,12 +1,36 @@
 from zenml import pipeline, Model
 
-from steps.data_ingestion_step import data_ingestion_step
-from steps.data_splitter_step import data_splitter_step
-from steps.feature_engineering_step import feature_engineering_step
+from steps.data_ingestion_step import CAR_DETAILS_SCHEMA, data_ingestion_step
+from steps.data_split_spec_step import data_split_spec_step
+from steps.feature_engineering_step import build_strategies, feature_engineering_step
+from steps.feature_importance_step import feature_importance_step
 from steps.handle_missing_values_step import handle_missing_values_step
 from steps.model_building_step import model_building_step
 from steps.model_evaluator_step import model_evaluator_step
-from steps.outlier_detection_step import outlier_detection_step
+from steps.outlier_filter_step import outlier_filter_step
+from steps.preprocessing_step import preprocessing_step
+from steps.src.feature_engineering import required_columns
+
+FEATURE_STRATEGIES = [
+    'extract_column',
+    'column_difference',
+    'drop_column',
+    'map_value',
+    'parse_units',
+    'cast_seats',
+    'log_transform',
+]
+
+# Per-column outlier strategy and threshold
+OUTLIER_RULES = {
+    'selling_price': {'method': 'zscore', 'threshold': 3.0},
+    'km_driven': {'method': 'zscore', 'threshold': 3.0},
+    'mileage': {'method': 'zscore', 'threshold': 3.0},
+    'max_power': {'method': 'zscore', 'threshold': 3.0},
+}
+
+# Source columns used by the model without going through a feature strategy
+PASSTHROUGH_COLUMNS = ['selling_price', 'km_driven', 'fuel', 'seller_type', 'transmission', 'seats']
 
 
 @pipeline(
@@ -20,67 +44,67 @@ def ml_pipeline():
     - Apply feature engineering
     - Remove outliers
     - Split data
+    - Preprocess train and test rows once
     - Train model
     - Evaluate performance
+    - Report feature importances
     """
-    # 1. Ingest raw data
+    # 1. Ingest raw data, parsing only the columns the feature strategies and model use
     raw_data = data_ingestion_step(
-        file_path="/mnt/c/Users/ADMIN/source/course/mlops_course/prices-predictor-system-mlflow-zenml/data/archive.zip"
+        file_path="/mnt/c/Users/ADMIN/source/course/mlops_course/prices-predictor-system-mlflow-zenml/data/archive.zip",
+        cache_dir="tmp/ingestion_cache",
+        columns=required_columns(build_strategies(FEATURE_STRATEGIES), PASSTHROUGH_COLUMNS)
     )
  
     # 2. Handle missing values
-    filled_data = handle_missing_values_step(raw_data, "drop")
+    filled_data, imputer_state = handle_missing_values_step(raw_data, "drop")
 
     # 3. Feature engineering
-    engineered_data = feature_engineering_step(filled_data,
-        strategies = ['extract_column',
-    'column_difference',
-    'drop_column',
-    'map_value',
-    'strip_units',
-    'type_cast',
-    'log_transform',
-    'one_hot_encode']
+    # Only rows not seen in earlier runs go through the strategies; full_rebuild=True refits from scratch
+    engineered_data, feature_state = feature_engineering_step(
+        filled_data,
+        strategies=FEATURE_STRATEGIES,
+        incremental=True,
+        full_rebuild=False
     )
 
-    # 4. Outlier removal
-    clean_data = outlier_detection_step(
+    # 4. Outlier removal, all rule columns in one pass
+    clean_data, outlier_report, feature_bounds = outlier_filter_step(
         df=engineered_data,
-        column_name="selling_price"
+        rules=OUTLIER_RULES
     )
 
-    clean_data = outlier_detection_step(
+    # 5. Split dataset: row positions only, the subsets are taken from clean_data where needed
+    split_spec = data_split_spec_step(
         df=clean_data,
-        column_name="km_driven"
-    )
-
-    clean_data = outlier_detection_step(
-        df=clean_data,
-        column_name="mileage"
-    )
-
-    clean_data = outlier_detection_step(
-        df=clean_data,
-        column_name="max_power"
+        target_column="selling_price"
     )
 
-    # 5. Split dataset
-    X_train, X_test, y_train, y_test = data_splitter_step(
+    # 6. Fit the preprocessor once; training, evaluation and feature importances share its matrices
+    preprocessed = preprocessing_step(
         df=clean_data,
-        target_column="selling_price"
+        split_spec=split_spec
     )
 
-    # 6. Train model
+    # 7. Train model
     model = model_building_step(
-        X_train=X_train,
-        y_train=y_train
+        preprocessed=preprocessed,
+        feature_state=feature_state,
+        feature_strategies=FEATURE_STRATEGIES,
+        input_schema=CAR_DETAILS_SCHEMA,
+        feature_bounds=feature_bounds
     )
 
-    # 7. Evaluate model
+    # 8. Evaluate model
     evaluation_metrics, mse = model_evaluator_step(
         trained_model=model,
-        X_test=X_test,
-        y_test=y_test
+        preprocessed=preprocessed
+    )
+
+    # 9. Feature importances
+    importances = feature_importance_step(
+        trained_model=model,
+        preprocessed=preprocessed
     )
 
     return model
@@ -1,5 +1,7 @@
 import click
 from rich import print
+from zenml.client import Client
+from zenml.enums import ExecutionStatus
 from zenml.integrations.mlflow.mlflow_utils import get_tracking_uri
 from zenml.integrations.mlflow.model_deployers.mlflow_model_deployer import MLFlowModelDeployer
 
@@ -9,6 +11,19 @@ from pipelines.deployment_pipeline import (
 )
 
 
+def load_run_output(run, artifact_name: str):
+    """
+    Load a named step output (e.g. the Annotated 'needs_full_refit') of a finished pipeline run.
+    The artifact is looked up by name and producing run instead of through the run's step/output layout.
+    """
+    if run is None or run.status != ExecutionStatus.COMPLETED:
+        raise RuntimeError(f"Cannot read '{artifact_name}': the pipeline run did not complete.")
+    for version in Client().list_artifact_versions(name=artifact_name, sort_by="desc:created", size=50):
+        if version.producer_pipeline_run_id == run.id:
+            return version.load()
+    raise LookupError(f"Pipeline run {run.id} produced no '{artifact_name}' artifact.")
+
+
 @click.command()
 @click.option(
     "--stop-service",
@@ -16,7 +31,13 @@ from pipelines.deployment_pipeline import (
     default=False,
     help="Stop the running MLflow prediction service",
 )
-def run_main(stop_service: bool):
+@click.option(
+    "--warm-start",
+    "new_data_path",
+    default=None,
+    help="Refresh the production model on the new listings at this path instead of retraining from scratch",
+)
+def run_main(stop_service: bool, new_data_path: str):
     """
     CLI entry point for running or stopping the prices predictor pipeline.
     """
@@ -48,7 +69,13 @@ def run_main(stop_service: bool):
         return
 
     # Run training + deployment
-    continuous_deployment_pipeline()
+    if new_data_path:
+        run = continuous_deployment_pipeline(retrain_mode="warm_start", new_data_path=new_data_path)
+        if load_run_output(run, "needs_full_refit"):
+            print("[bold yellow] Drift detected in the new listings, running full training instead.[/bold yellow]")
+            continuous_deployment_pipeline()
+    else:
+        continuous_deployment_pipeline()
 
     # Run inference
     inference_pipeline()
@@ -0,0 +1,66 @@
+import logging
+from typing import Annotated
+
+import pandas as pd
+from .src.data_splitter import (
+    BinnedStratifiedKFoldStrategy,
+    KFoldStrategy,
+    RepeatedKFoldStrategy,
+    TimeOrderedSplitStrategy,
+    cross_validate,
+)
+from .src.model_building import build_regression_pipeline
+from .src.step_cache import cached_step
+from zenml import step
+
+
+@step(enable_cache=False)
+@cached_step(cross_validate, build_regression_pipeline)
+def cross_validation_step(
+    df: pd.DataFrame,
+    target_column: str,
+    strategy: str = "kfold",
+    n_splits: int = 5,
+    n_repeats: int = 3,
+    n_bins: int = 10,
+    time_column: str = "age",
+    time_ascending: bool = False,
+    categorical_encoding: str = "sparse",
+    n_jobs: int = -1,
+) -> Annotated[dict, "cv_results"]:
+    """
+    Cross-validates the training pipeline, folds fitted in parallel on memory-mapped data.
+
+    Parameters:
+    - df (pd.DataFrame): Full dataset including features and target
+    - target_column (str): Name of the target column
+    - strategy (str): 'kfold', 'repeated_kfold', 'binned_stratified' or 'time_ordered'
+    - n_splits, n_repeats, n_bins: Fold settings of the chosen strategy
+    - time_column, time_ascending: Period column for 'time_ordered' ('age' counts backwards in time)
+    - categorical_encoding (str): Encoding used by the pipeline (see build_regression_pipeline)
+    - n_jobs (int): Worker processes (-1 = all cores)
+
+    Returns:
+    - dict: Per-fold metrics plus their mean and standard deviation
+    """
+    strategy_map = {
+        "kfold": lambda: KFoldStrategy(n_splits=n_splits),
+        "repeated_kfold": lambda: RepeatedKFoldStrategy(n_splits=n_splits, n_repeats=n_repeats),
+        "binned_stratified": lambda: BinnedStratifiedKFoldStrategy(n_splits=n_splits, n_bins=n_bins),
+        "time_ordered": lambda: TimeOrderedSplitStrategy(time_column, n_splits=n_splits, ascending=time_ascending),
+    }
+    if strategy not in strategy_map:
+        raise ValueError(f"Unsupported strategy '{strategy}'. Available: {list(strategy_map)}")
+
+    estimator = build_regression_pipeline(df.drop(columns=[target_column]), categorical_encoding=categorical_encoding)
+    folds = cross_validate(estimator, df, target_column, strategy_map[strategy](), n_jobs=n_jobs)
+
+    metrics = folds[["Mean Squared Error", "R-Squared"]]
+    summary = {
+        "strategy": strategy,
+        "folds": folds.to_dict(orient="records"),
+        "mean": metrics.mean().to_dict(),
+        "std": metrics.std().to_dict(),
+    }
+    logging.info(f"Cross-validation summary: mean={summary['mean']}, std={summary['std']}")
+    return summary
@@ -1,24 +1,60 @@
+from typing import Optional
+
 import pandas as pd
 from .src.ingest_data import DataIngestorFactory
 from zenml import step
 
+# Declared dtypes of the cardekho listing columns. Low-cardinality strings become
+# 'category'; numeric columns are narrowed to the smallest safe width. 'name' is a
+# nearly unique listing title and stays a plain string column.
+CAR_DETAILS_SCHEMA = {
+    "year": "integer",
+    "selling_price": "integer",
+    "km_driven": "integer",
+    "fuel": "category",
+    "seller_type": "category",
+    "transmission": "category",
+    "owner": "category",
+    "seats": "float",
+}
+
 
 @step()
-def data_ingestion_step(file_path: str) -> pd.DataFrame:
+def data_ingestion_step(
+    file_path: str,
+    member: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+    optimize_dtypes: bool = True,
+    dtype_backend: Optional[str] = None,
+    columns: Optional[list] = None,
+    filters: Optional[list] = None,
+) -> pd.DataFrame:
     """
-    Step to ingest data from a .zip file using the corresponding DataIngestor.
+    Step to ingest data from a .zip file, a directory of shards or a glob pattern
+    using the corresponding DataIngestor.
 
     Parameters:
-    - file_path (str): Path to the zip file
+    - file_path (str): Path to the zip file, a directory of .zip/.csv shards, or a glob pattern
+    - member (str): CSV member to read when the archive holds several CSV files
+    - cache_dir (str): Directory of the columnar ingestion cache (None disables caching)
+    - optimize_dtypes (bool): Apply CAR_DETAILS_SCHEMA and log a per-column memory report
+    - dtype_backend (str): Optional pandas dtype backend, e.g. 'pyarrow'
+    - columns (list): Columns to parse (None parses every column)
+    - filters (list): Row predicates applied while parsing, e.g. ['year >= 2000', 'seats not null']
 
     Returns:
     - pd.DataFrame: Loaded data
     """
-    # Define the file type (hardcoded as ZIP for this pipeline)
-    ext = ".zip"
-
-    # Select and initialize the appropriate ingestor
-    ingestor = DataIngestorFactory.get_data_ingestor(ext)
+    # Select and initialize the appropriate ingestor for a single archive or a set of shards
+    ingestor = DataIngestorFactory.get_data_ingestor_for_path(
+        file_path,
+        cache_dir=cache_dir,
+        member=member,
+        schema=CAR_DETAILS_SCHEMA if optimize_dtypes else None,
+        dtype_backend=dtype_backend,
+        columns=columns,
+        filters=filters,
+    )
 
     # Load and return the data
     df = ingestor.ingest(file_path)
@@ -0,0 +1,36 @@
+import pandas as pd
+from .src.data_splitter import DataSplitter, SimpleTrainTestSplitStrategy, StratifiedTrainTestSplitStrategy
+from .src.step_cache import cached_step
+from zenml import step
+
+
+@step(enable_cache=False)
+@cached_step(DataSplitter)
+def data_split_spec_step(
+    df: pd.DataFrame, target_column: str, strategy: str = "simple", test_size: float = 0.2, random_state: int = 0
+) -> dict:
+    """
+    Computes a train/test split as a test-row mask only. Downstream steps take their subset
+    from the one stored dataset artifact (see take_split) instead of four copied artifacts.
+
+    Parameters:
+    - df (pd.DataFrame): Full dataset including features and target
+    - target_column (str): Name of the target column
+    - strategy (str): 'simple' or 'stratified'
+    - test_size (float): Proportion of rows in the test set
+    - random_state (int): Seed of the shuffle
+
+    Returns:
+    - dict: Split specification with keys 'test_mask' (bit-packed boolean mask of the test rows,
+      base64-encoded; every other row is a training row), 'n_rows', 'target_column', 'strategy'
+      and 'seed'. Decode it with split_positions or take_split.
+    """
+    strategy_map = {
+        "simple": SimpleTrainTestSplitStrategy,
+        "stratified": StratifiedTrainTestSplitStrategy,
+    }
+    if strategy not in strategy_map:
+        raise ValueError(f"Unsupported strategy '{strategy}'. Available: {list(strategy_map)}")
+
+    splitter = DataSplitter(strategy=strategy_map[strategy](test_size=test_size, random_state=random_state))
+    return splitter.split_spec(df, target_column)
@@ -1,9 +1,12 @@
-import pandas as pd
 from collections import OrderedDict
+from typing import Annotated, Optional, Tuple
+
+import pandas as pd
 from .src.feature_engineering import (
-    FeatureEngineer,
+    FeaturePlan,
     LogTransformation,
     MinMaxScaling,
+    NumericUnitParser,
     OneHotEncoding,
     StandardScaling,
     ColumnDifference,
@@ -15,25 +18,24 @@ from .src.feature_engineering import (
     SplitExtractAndDrop
 
 )
+from .src.feature_store import IncrementalFeatureStore
+from .src.step_cache import cached_step
 from zenml import step
 
 
-@step(enable_cache=False)
-def feature_engineering_step(
-    df: pd.DataFrame, strategies: list
-) -> pd.DataFrame:
+def build_strategies(strategies: list) -> list:
     """
-    Applies a selected feature engineering strategy to specified columns.
+    Build the selected feature engineering strategies in their fixed execution order.
 
     Parameters:
-    - df (pd.DataFrame): Input dataset
-    - strategies (str): Strategy to apply ('log', 'standard_scaling', 'minmax_scaling', 'onehot_encoding',.....)
-
+    - strategies (list): Strategy keys ('extract_column', 'column_difference', 'log_transform', ...)
 
     Returns:
-    - pd.DataFrame: Transformed dataset
-    """
+    - list: FeatureEngineeringStrategy instances, ordered as in custom_strategies
 
+    Raises:
+    - ValueError: If a key has no strategy.
+    """
     custom_strategies = OrderedDict([
         ('extract_column', SplitExtractAndDrop(source_column='name', new_column='brand')),
         ('column_difference', ColumnReplacerWithDifference(constant=2025, column='year', new_name='age')),
@@ -44,25 +46,68 @@ def feature_engineering_step(
             'engine': r'CC',
             'max_power': r'b(h)?p'
         })),
+        ('parse_units', NumericUnitParser({
+            'mileage': r'kmpl|km/kg',
+            'engine': r'CC',
+            'max_power': r'b(h)?p'
+        })),
         ('type_cast', TypeCaster({
             'mileage': 'float',
             'engine': 'float',
             'max_power': 'float',
             'seats': 'str'
         })),
+        # parse_units already yields floats; only seats still needs its categorical cast
+        ('cast_seats', TypeCaster({'seats': 'str'})),
         ('log_transform', LogTransformation(features=['selling_price', 'max_power', 'age'])),
-
     ])
+    unknown = [key for key in strategies if key not in custom_strategies]
+    if unknown:
+        raise ValueError(f"Unknown feature engineering strategies {unknown}; expected keys of {list(custom_strategies)}")
 
-    
+    # Thực hiện theo đúng thứ tự của custom_strategies nếu key có trong strategies
+    return [strategy for key, strategy in custom_strategies.items() if key in strategies]
 
-    
-    df_transformed = df.copy()
 
-    # Thực hiện theo đúng thứ tự của custom_strategies nếu key có trong strategies
-    for key, strategy in custom_strategies.items():
-        if key in strategies:
-            transformer = FeatureEngineer(strategy)
-            df_transformed = transformer.apply_feature_engineering(df_transformed)
+@step(enable_cache=False)
+# The incremental path reads and writes the feature store, so it always executes
+@cached_step(FeaturePlan, IncrementalFeatureStore, bypass=lambda arguments: arguments["incremental"])
+def feature_engineering_step(
+    df: pd.DataFrame,
+    strategies: list,
+    feature_state: Optional[dict] = None,
+    incremental: bool = False,
+    full_rebuild: bool = False,
+    store_dir: str = "tmp/feature_store",
+) -> Tuple[
+    Annotated[pd.DataFrame, "engineered_data"],
+    Annotated[dict, "feature_state"],
+]:
+    """
+    Applies a selected feature engineering strategy to specified columns.
+
+    Parameters:
+    - df (pd.DataFrame): Input dataset
+    - strategies (str): Strategy to apply ('log', 'standard_scaling', 'minmax_scaling', 'onehot_encoding',.....)
+    - feature_state (dict): Fitted state from an earlier run. If given, the plan is applied
+      to df without refitting (e.g. for evaluation or inference batches).
+    - incremental (bool): Reuse the engineered output of rows seen in earlier runs (matched by
+      row content hash) and run the plan only on new or changed rows. The step cache is
+      bypassed, so that the store is always read and updated.
+    - full_rebuild (bool): With incremental, discard the stored rows and refit the plan on df.
+    - store_dir (str): Directory of the incremental feature store.
+
+    Returns:
+    - pd.DataFrame: Transformed dataset
+    - dict: Fitted state of the feature plan
+    """
+    # One defensive copy for the whole chain; adjacent column-local strategies run fused
+    plan = FeaturePlan(build_strategies(strategies))
+    if incremental:
+        return IncrementalFeatureStore(store_dir).transform(df, plan, feature_state, full_rebuild=full_rebuild)
+    if feature_state is None:
+        df_transformed = plan.fit_transform(df)
+    else:
+        df_transformed = plan.set_state(feature_state).transform(df)
 
-    return df_transformed
+    return df_transformed, plan.get_state()
@@ -0,0 +1,27 @@
+import logging
+from typing import Annotated
+
+from sklearn.pipeline import Pipeline
+from .src.preprocessing import PreprocessedData, feature_importances
+from zenml import step
+
+
+@step(enable_cache=False)
+def feature_importance_step(
+    trained_model: Pipeline, preprocessed: PreprocessedData, top_k: int = 20
+) -> Annotated[dict, "feature_importances"]:
+    """
+    Reports which preprocessed columns the model relies on, computed on the shared matrices of
+    preprocessing_step (no preprocessing is re-run).
+
+    Parameters:
+    - trained_model: Pipeline whose final step was trained on preprocessed.X_train
+    - preprocessed: Output of preprocessing_step
+    - top_k: Number of columns to report
+
+    Returns:
+    - dict: Column name -> importance, for the top_k columns, highest first
+    """
+    importances = feature_importances(trained_model.steps[-1][1], preprocessed).head(top_k)
+    logging.info(f"Top {len(importances)} features:\n{importances.to_string()}")
+    return {name: float(value) for name, value in importances.items()}
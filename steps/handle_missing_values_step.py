@@ -1,23 +1,38 @@
+from typing import Annotated, Optional, Tuple
+
 import pandas as pd
 from .src.handle_missing_values import (
     DropMissingValuesStrategy,
     FillMissingValuesStrategy,
+    FittedImputer,
     MissingValueHandler,
 )
+from .src.step_cache import cached_step
 from zenml import step
 
 
 @step(enable_cache=False)
-def handle_missing_values_step(df: pd.DataFrame, strategy: str = "mean") -> pd.DataFrame:
+@cached_step(MissingValueHandler)
+def handle_missing_values_step(
+    df: pd.DataFrame, strategy: str = "mean", imputer_state: Optional[dict] = None
+) -> Tuple[
+    Annotated[pd.DataFrame, "filled_data"],
+    Annotated[dict, "imputer_state"],
+]:
     """
     Handles missing values using the specified strategy.
 
     Parameters:
     - df (pd.DataFrame): Input DataFrame
-    - strategy (str): Strategy to use: 'drop', 'mean', 'median', 'mode', or 'constant'
+    - strategy (str): Strategy to use: 'drop', 'mean', 'median', 'mode', or 'constant', which use
+      statistics of df itself, or 'fitted_mean', 'fitted_median', 'fitted_mode', which fit the
+      statistics once (numeric columns by the named statistic, categorical columns by mode)
+    - imputer_state (dict): Statistics from an earlier run of a fitted strategy. If given, they are
+      applied to df without recomputation (e.g. for inference batches).
 
     Returns:
     - pd.DataFrame: Cleaned DataFrame
+    - dict: Fitted imputation statistics (empty for the non-fitted strategies)
     """
     strategy_map = {
         "drop": DropMissingValuesStrategy(axis=0),
@@ -25,11 +40,18 @@ def handle_missing_values_step(df: pd.DataFrame, strategy: str = "mean") -> pd.D
         "median": FillMissingValuesStrategy(method="median"),
         "mode": FillMissingValuesStrategy(method="mode"),
         "constant": FillMissingValuesStrategy(method="constant"),
+        "fitted_mean": FittedImputer(numeric="mean"),
+        "fitted_median": FittedImputer(numeric="median"),
+        "fitted_mode": FittedImputer(numeric="mode"),
     }
 
     if strategy not in strategy_map:
         raise ValueError(f"Unsupported strategy '{strategy}'. Available: {list(strategy_map)}")
 
+    if imputer_state:
+        imputer = strategy_map[strategy].set_state(imputer_state)
+        return imputer.transform(df), imputer.get_state()
+
     handler = MissingValueHandler(strategy_map[strategy])
     df = handler.handle_missing_values(df)
-    return df
+    return df, strategy_map[strategy].get_state()
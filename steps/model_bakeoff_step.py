@@ -0,0 +1,151 @@
+import logging
+from typing import Annotated, Optional, Tuple
+
+import mlflow
+import pandas as pd
+from sklearn.pipeline import Pipeline
+from zenml import ArtifactConfig, Model, get_step_context, step
+from zenml.client import Client
+from zenml.enums import ModelStages
+
+from .feature_engineering_step import build_strategies
+from .src.data_splitter import take_split
+from .src.model_building import (
+    GradientBoostingStrategy,
+    HistGradientBoostingStrategy,
+    LinearRegressionStrategy,
+    ModelBakeoff,
+    OutOfCoreSGDStrategy,
+)
+from .src.preprocessing import PreprocessedData
+from .src.sklearn_transformers import BoundsGuard, FeaturePlanTransformer, make_serving_pipeline
+
+# Active experiment tracker
+experiment_tracker = Client().active_stack.experiment_tracker
+
+# Candidates available to the bake-off, by name
+BAKEOFF_STRATEGIES = {
+    "linear_regression": LinearRegressionStrategy,
+    "gradient_boosting": GradientBoostingStrategy,
+    "hist_gradient_boosting": HistGradientBoostingStrategy,
+    "sgd": OutOfCoreSGDStrategy,
+}
+
+
+@step(
+    enable_cache=False,
+    experiment_tracker=experiment_tracker.name,
+    model=Model(name="prices_predictor", version=None),
+)
+def model_bakeoff_step(
+    X_train: Optional[pd.DataFrame] = None,
+    y_train: Optional[pd.Series] = None,
+    X_test: Optional[pd.DataFrame] = None,
+    y_test: Optional[pd.Series] = None,
+    df: Optional[pd.DataFrame] = None,
+    split_spec: Optional[dict] = None,
+    preprocessed: Optional[PreprocessedData] = None,
+    feature_state: Optional[dict] = None,
+    feature_strategies: Optional[list] = None,
+    input_schema: Optional[dict] = None,
+    feature_bounds: Optional[dict] = None,
+    guard_policy: str = "clip",
+    candidates: Optional[list] = None,
+    categorical_encoding: str = "dense",
+    latency_weight: float = 0.01,
+    validation_fraction: float = 0.2,
+    promote: bool = True,
+) -> Tuple[
+    Annotated[Pipeline, ArtifactConfig(name="sklearn_pipeline", is_model_artifact=True)],
+    Annotated[dict, "bakeoff_report"],
+]:
+    """
+    Trains several model strategies concurrently on one preprocessed matrix, ranks them on validation
+    rows held out from the train rows (R2 minus a single-row predict latency penalty), refits the best
+    one on all train rows and reports its test metrics.
+
+    Parameters:
+    - X_train, y_train, X_test, y_test: Train and test data, or
+    - df, split_spec: The full dataset and a split specification (data_split_spec_step), or
+    - preprocessed: The output of preprocessing_step; candidates train on its matrices and
+      categorical_encoding is not used. Candidates that need a dense matrix are skipped on a sparse one.
+    - feature_state, feature_strategies, input_schema: As in model_building_step; the winner is
+      wrapped in a serving pipeline that scores raw listings end to end.
+    - feature_bounds, guard_policy: As in model_building_step; a 'guard' step enforces the bounds.
+    - candidates: Names from BAKEOFF_STRATEGIES (default: all of them).
+    - categorical_encoding: Encoding of the shared matrix (see build_regression_pipeline).
+    - latency_weight: R2 given up per millisecond of single-row predict latency.
+    - validation_fraction: Share of train rows held out for ranking the candidates.
+    - promote: Move the model version holding the winner to the 'production' stage. Needs
+      feature_state and feature_strategies, since production serves raw listings.
+
+    Returns:
+    - Pipeline: Winning pipeline ('features' and 'guard' steps when serving raw listings, then
+      'preprocessor' and 'model').
+    - dict: Winner, its test metrics, skipped candidates and per-candidate validation metrics,
+      fit time, predict latency and score, best first.
+    """
+    serve_raw = feature_state is not None and feature_strategies is not None
+    if promote and not serve_raw:
+        raise ValueError("Promoting the bake-off winner needs feature_state and feature_strategies, "
+                         "so that the production model scores raw listings.")
+
+    if preprocessed is None and split_spec is not None:
+        X_train, y_train = take_split(df, split_spec, "train")
+        X_test, y_test = take_split(df, split_spec, "test")
+
+    candidates = candidates or list(BAKEOFF_STRATEGIES)
+    unknown = [name for name in candidates if name not in BAKEOFF_STRATEGIES]
+    if unknown:
+        raise ValueError(f"Unsupported candidates {unknown}. Available: {list(BAKEOFF_STRATEGIES)}")
+
+    bakeoff = ModelBakeoff(
+        {name: BAKEOFF_STRATEGIES[name]() for name in candidates},
+        categorical_encoding=categorical_encoding,
+        latency_weight=latency_weight,
+        validation_fraction=validation_fraction,
+    )
+
+    if not mlflow.active_run():
+        mlflow.start_run()
+
+    try:
+        if preprocessed is not None:
+            pipeline, report = bakeoff.run_on_matrix(preprocessed)
+        else:
+            pipeline, report = bakeoff.run(X_train, y_train, X_test, y_test)
+        for candidate in report["candidates"]:
+            mlflow.log_metrics({
+                f"{candidate['name']}_val_r2": candidate["metrics"]["R-Squared"],
+                f"{candidate['name']}_val_mse": candidate["metrics"]["Mean Squared Error"],
+                f"{candidate['name']}_predict_ms": candidate["predict_ms"],
+                f"{candidate['name']}_score": candidate["score"],
+            })
+        if report["test_metrics"] is not None:
+            mlflow.log_metrics({
+                "test_r2": report["test_metrics"]["R-Squared"],
+                "test_mse": report["test_metrics"]["Mean Squared Error"],
+            })
+        mlflow.log_metric("bakeoff_wall_seconds", report["wall_seconds"])
+        mlflow.set_tag("bakeoff_winner", report["winner"])
+
+        if serve_raw:
+            features = FeaturePlanTransformer(
+                build_strategies(feature_strategies),
+                state=feature_state,
+                schema=input_schema,
+                target_column=(preprocessed.y_train if preprocessed is not None else y_train).name,
+                output_columns=preprocessed.input_columns if preprocessed is not None else list(X_train.columns),
+            ).fit(None)
+            guard = BoundsGuard(feature_bounds, policy=guard_policy).fit(None) if feature_bounds else None
+            pipeline = make_serving_pipeline(features, pipeline, guard)
+            logging.info("Wrapped the winner in a serving pipeline that accepts raw listings.")
+        mlflow.sklearn.log_model(pipeline, "model")
+    finally:
+        mlflow.end_run()
+
+    if promote:
+        get_step_context().model.set_stage(ModelStages.PRODUCTION, force=True)
+        logging.info(f"Promoted the '{report['winner']}' model version to production.")
+
+    return pipeline, report
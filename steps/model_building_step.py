@@ -1,19 +1,32 @@
 import logging
-from typing import Annotated
+import sys
+import time
+from typing import Annotated, Optional
 
 import mlflow
 import pandas as pd
+from mlflow.entities import Metric, Param
+from mlflow.tracking import MlflowClient
 from sklearn.base import RegressorMixin
-from sklearn.compose import ColumnTransformer
-from sklearn.impute import SimpleImputer
 from sklearn.linear_model import LinearRegression
-from sklearn.ensemble import GradientBoostingRegressor
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import OneHotEncoder
 from zenml import ArtifactConfig, step
 from zenml.client import Client
 from zenml import Model
 
+from .feature_engineering_step import build_strategies
+from .src.data_splitter import take_split
+from .src.model_building import (
+    GradientBoostingStrategy,
+    HistGradientBoostingStrategy,
+    ModelBuilder,
+    OutOfCoreSGDStrategy,
+    SuccessiveHalvingSearchStrategy,
+)
+from .src.preprocessing import PreprocessedData
+from .src.sklearn_transformers import BoundsGuard, FeaturePlanTransformer, make_serving_pipeline
+from .src.step_cache import code_version, step_cache
+
 # Active experiment tracker
 experiment_tracker = Client().active_stack.experiment_tracker
 
@@ -26,62 +39,165 @@ model = Model(
 )
 
 
+def log_search_trials(strategy: SuccessiveHalvingSearchStrategy, batch_size: int = 1000):
+    """
+    Log all trials of a finished search to the active MLflow run in a few log_batch calls:
+    per-trial metrics use the trial number as step, the full trial table goes in as a JSON artifact.
+    """
+    run_id = mlflow.active_run().info.run_id
+    timestamp = int(time.time() * 1000)
+    metrics = []
+    for trial in strategy.trials_:
+        if trial["status"] != "completed":
+            continue
+        metrics += [
+            Metric("search_trial_r2", trial["score"], timestamp, trial["trial"]),
+            Metric("search_trial_rows", trial["n_samples"], timestamp, trial["trial"]),
+            Metric("search_trial_fit_seconds", trial["fit_seconds"], timestamp, trial["trial"]),
+        ]
+    params = [Param(f"search_best_{name}", str(value)) for name, value in strategy.best_params_.items()]
+    metrics.append(Metric("search_seconds", strategy.search_seconds_, timestamp, 0))
+
+    client = MlflowClient()
+    for i in range(0, max(len(metrics), 1), batch_size):
+        client.log_batch(run_id, metrics=metrics[i:i + batch_size], params=params if i == 0 else ())
+    mlflow.log_dict({"trials": strategy.trials_}, "search/trials.json")
+    logging.info(f"Logged {len(strategy.trials_)} search trial(s) to MLflow.")
+
+
 @step(enable_cache=False, experiment_tracker=experiment_tracker.name, model=model)
 def model_building_step(
-    X_train: pd.DataFrame, y_train: pd.Series
+    X_train: Optional[pd.DataFrame] = None,
+    y_train: Optional[pd.Series] = None,
+    feature_state: Optional[dict] = None,
+    feature_strategies: Optional[list] = None,
+    input_schema: Optional[dict] = None,
+    categorical_encoding: str = "sparse",
+    feature_bounds: Optional[dict] = None,
+    guard_policy: str = "clip",
+    df: Optional[pd.DataFrame] = None,
+    split_spec: Optional[dict] = None,
+    preprocessed: Optional[PreprocessedData] = None,
+    model_type: str = "gradient_boosting",
+    search_space: Optional[dict] = None,
+    search_budget: Optional[float] = None,
 ) -> Annotated[Pipeline, ArtifactConfig(name="sklearn_pipeline", is_model_artifact=True)]:
     """
-    Builds and trains a Linear Regression model wrapped in a preprocessing pipeline.
+    Builds and trains the selected model strategy (gradient boosting, hist gradient boosting,
+    successive-halving search or SGD) wrapped in its preprocessing pipeline.
+
+    Parameters:
+    - X_train, y_train: Training data, or
+    - df, split_spec: The full dataset and a split specification (data_split_spec_step);
+      the training rows are taken from df here instead of being stored as separate artifacts.
+    - preprocessed: Alternatively, the output of preprocessing_step; only the model is fitted, on
+      its train matrix (the encoding is the one of that step). 'hist_gradient_boosting' needs
+      'ordinal' (native categorical features) or 'dense' and rejects a sparse matrix before training.
+    - feature_state: Fitted feature plan state from feature_engineering_step. Together with
+      feature_strategies, the fitted plan is prepended as a 'features' step so the returned
+      pipeline scores raw listings end to end.
+    - feature_strategies: Strategy keys the feature plan was built from.
+    - input_schema: Ingestion dtype schema applied to raw inputs before the feature plan.
+    - categorical_encoding: 'sparse' (one-hot, CSR all the way into the model), 'dense' (one-hot,
+      dense float64 matrix) or 'ordinal' (one integer code per column, for tree models).
+    - feature_bounds: Fitted bounds from outlier_filter_step. With a raw-input pipeline, a 'guard'
+      step enforces them on engineered features before the model.
+    - guard_policy: 'flag' (log and count violations) or 'clip' (clip values to the bounds).
+    - model_type: 'gradient_boosting' (preprocessing + GradientBoostingRegressor, using
+      categorical_encoding), 'hist_gradient_boosting' (native categorical features, early stopping)
+      'search' (successive-halving search over GradientBoostingRegressor hyperparameters) or 'sgd'
+      (SGDRegressor on hashed categoricals, trained in batches; see out_of_core_training_step for
+      data that does not fit in memory).
+    - search_space: Parameter name -> candidate values for model_type='search'.
+    - search_budget: Wall-clock seconds for model_type='search'.
 
     Returns:
         Trained scikit-learn pipeline.
     """
+    if preprocessed is not None:
+        y_train = preprocessed.y_train
+    elif split_spec is not None:
+        X_train, y_train = take_split(df, split_spec, "train")
+
     # Input validation
-    if not isinstance(X_train, pd.DataFrame):
+    if preprocessed is None and not isinstance(X_train, pd.DataFrame):
         raise TypeError("X_train must be a pandas DataFrame.")
     if not isinstance(y_train, pd.Series):
         raise TypeError("y_train must be a pandas Series.")
 
-    # Column selection
-    cat_cols = X_train.select_dtypes(include=["object", "category"]).columns
-    num_cols = X_train.select_dtypes(exclude=["object", "category"]).columns
-
-    logging.info(f"Categorical columns: {cat_cols.tolist()}")
-    logging.info(f"Numerical columns: {num_cols.tolist()}")
-
-    # Preprocessing pipelines
-    num_transformer = SimpleImputer(strategy="mean")
-    cat_transformer = Pipeline(steps=[
-        ("imputer", SimpleImputer(strategy="most_frequent")),
-        ("onehot", OneHotEncoder(handle_unknown="ignore"))
-    ])
-
-    preprocessor = ColumnTransformer(transformers=[
-        ("num", num_transformer, num_cols),
-        ("cat", cat_transformer, cat_cols),
-    ])
-
-    # Full pipeline
-    pipeline = Pipeline(steps=[
-        ("preprocessor", preprocessor),
-        ("model", GradientBoostingRegressor())
-    ])
+    strategy_map = {
+        "gradient_boosting": lambda: GradientBoostingStrategy(categorical_encoding=categorical_encoding),
+        "hist_gradient_boosting": lambda: HistGradientBoostingStrategy(),
+        "sgd": lambda: OutOfCoreSGDStrategy(),
+        "search": lambda: SuccessiveHalvingSearchStrategy(
+            search_space=search_space, categorical_encoding=categorical_encoding, time_budget=search_budget
+        ),
+    }
+    if model_type not in strategy_map:
+        raise ValueError(f"Unsupported model_type '{model_type}'. Available: {list(strategy_map)}")
+    strategy = strategy_map[model_type]()
+    if preprocessed is not None:
+        strategy.check_matrix(preprocessed)
+    builder = ModelBuilder(strategy)
+
+    # The fitted model pipeline is cached by training data, model settings and code version
+    training_data = {"preprocessed": preprocessed} if preprocessed is not None else {"X_train": X_train, "y_train": y_train}
+    cache_key = step_cache.key(
+        "model_building_step",
+        {
+            **training_data,
+            "model_type": model_type,
+            "categorical_encoding": categorical_encoding,
+            "search_space": search_space,
+            "search_budget": search_budget,
+        },
+        code_version(sys.modules[__name__], ModelBuilder, BoundsGuard),
+    )
 
     # MLflow autologging
     if not mlflow.active_run():
         mlflow.start_run()
 
+    serve_raw = feature_state is not None and feature_strategies is not None
+    # Pipelines composed after fit are not autologged as a whole
+    composed = model_type == "search" or preprocessed is not None
+
     try:
-        mlflow.sklearn.autolog()
-        logging.info("Training GB Regression pipeline...")
-        pipeline.fit(X_train, y_train)
-        logging.info("Model training complete.")
+        cached, pipeline = step_cache.lookup("model_building_step", cache_key)
+        if cached:
+            mlflow.set_tag("step_cache", "hit")
+        else:
+            # The raw-input, search and shared-matrix pipelines are composed after fit, so they are logged explicitly instead
+            mlflow.sklearn.autolog(log_models=not serve_raw and not composed)
+            logging.info(f"Training {model_type} pipeline...")
+            if preprocessed is not None:
+                pipeline = builder.build_model_from_matrix(preprocessed)
+            else:
+                pipeline = builder.build_model(X_train, y_train)
+            logging.info("Model training complete.")
+            step_cache.store(cache_key, pipeline)
+            if model_type == "search":
+                log_search_trials(strategy)
+
+        if not serve_raw and (cached or composed):
+            mlflow.sklearn.log_model(pipeline, "model")
+
+        if serve_raw:
+            features = FeaturePlanTransformer(
+                build_strategies(feature_strategies),
+                state=feature_state,
+                schema=input_schema,
+                target_column=y_train.name,
+                output_columns=preprocessed.input_columns if preprocessed is not None else list(X_train.columns),
+            ).fit(None)
+            guard = BoundsGuard(feature_bounds, policy=guard_policy).fit(None) if feature_bounds else None
+            pipeline = make_serving_pipeline(features, pipeline, guard)
+            mlflow.sklearn.log_model(pipeline, "model")
+            logging.info("Logged serving pipeline that accepts raw listings.")
 
         # Log expected column names
-        onehot = pipeline.named_steps["preprocessor"].transformers_[1][1].named_steps["onehot"]
-        onehot.fit(X_train[cat_cols])
-        expected_cols = num_cols.tolist() + list(onehot.get_feature_names_out(cat_cols))
-        logging.info(f"Pipeline expects columns: {expected_cols}")
+        expected_cols = list(pipeline.named_steps["preprocessor"].get_feature_names_out())
+        logging.info(f"Pipeline expects {len(expected_cols)} columns: {expected_cols[:50]}")
 
     except Exception as e:
         logging.error(f"Training failed: {e}")
@@ -1,45 +1,59 @@
 import logging
-from typing import Tuple
+from typing import Optional, Tuple
 
 import pandas as pd
 from sklearn.pipeline import Pipeline
+from .src.data_splitter import take_split
 from .src.model_evaluator import ModelEvaluator, RegressionModelEvaluationStrategy
+from .src.preprocessing import PreprocessedData
 from zenml import step
 
 
 @step(enable_cache=False)
 def model_evaluator_step(
     trained_model: Pipeline, 
-    X_test: pd.DataFrame, 
-    y_test: pd.Series
+    X_test: Optional[pd.DataFrame] = None, 
+    y_test: Optional[pd.Series] = None,
+    df: Optional[pd.DataFrame] = None,
+    split_spec: Optional[dict] = None,
+    preprocessed: Optional[PreprocessedData] = None
 ) -> Tuple[dict, float]:
     """
     Evaluates a trained regression model using a defined evaluation strategy.
 
     Parameters:
-    - trained_model: Pipeline including preprocessing and model
+    - trained_model: Pipeline including preprocessing and model (and optionally the raw-input
+      'features' and 'guard' steps, which are skipped: test rows are already engineered)
     - X_test: Features for evaluation
     - y_test: Ground truth target values
+    - df, split_spec: Alternatively, the full dataset and a split specification; the test rows are taken from df
+    - preprocessed: Alternatively, the output of preprocessing_step the model was trained on; the
+      model is scored on its test matrix without running the preprocessor again
 
     Returns:
     - dict: Evaluation metrics (e.g., MSE, R2)
     - float: Mean Squared Error as primary metric
     """
-    if not isinstance(X_test, pd.DataFrame):
-        raise TypeError("Expected X_test to be a pandas DataFrame.")
-    if not isinstance(y_test, pd.Series):
-        raise TypeError("Expected y_test to be a pandas Series.")
+    evaluator = ModelEvaluator(strategy=RegressionModelEvaluationStrategy())
 
-    logging.info("Running preprocessing on test data...")
-    X_processed = trained_model.named_steps["preprocessor"].transform(X_test)
+    if preprocessed is not None:
+        if preprocessed.X_test is None:
+            raise ValueError("preprocessed holds no test matrix.")
+        logging.info("Evaluating model performance on the preprocessed test matrix...")
+        metrics = evaluator.evaluate(trained_model.steps[-1][1], preprocessed.X_test, preprocessed.y_test)
+    else:
+        if split_spec is not None:
+            X_test, y_test = take_split(df, split_spec, "test")
 
-    logging.info("Evaluating model performance...")
-    evaluator = ModelEvaluator(strategy=RegressionModelEvaluationStrategy())
-    metrics = evaluator.evaluate(
-        trained_model.named_steps["model"],
-        X_processed,
-        y_test
-    )
+        if not isinstance(X_test, pd.DataFrame):
+            raise TypeError("Expected X_test to be a pandas DataFrame.")
+        if not isinstance(y_test, pd.Series):
+            raise TypeError("Expected y_test to be a pandas Series.")
+
+        # The pipeline from its preprocessor on, which transforms the test rows once inside predict
+        start = [name for name, _ in trained_model.steps].index("preprocessor")
+        logging.info("Evaluating model performance...")
+        metrics = evaluator.evaluate(trained_model[start:], X_test, y_test)
 
     if not isinstance(metrics, dict):
         raise ValueError("Expected evaluation metrics to be a dictionary.")
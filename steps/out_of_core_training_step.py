@@ -0,0 +1,82 @@
+import logging
+from typing import Annotated, Optional
+
+import mlflow
+from sklearn.pipeline import Pipeline
+from zenml import ArtifactConfig, Model, step
+from zenml.client import Client
+
+from .feature_engineering_step import build_strategies
+from .src.feature_engineering import FeaturePlan
+from .src.ingest_data import DataIngestorFactory
+from .src.model_building import OutOfCoreSGDStrategy, stream_engineered_chunks
+from .src.sklearn_transformers import FeaturePlanTransformer, make_serving_pipeline
+
+# Active experiment tracker
+experiment_tracker = Client().active_stack.experiment_tracker
+
+
+@step(
+    enable_cache=False,
+    experiment_tracker=experiment_tracker.name,
+    model=Model(name="prices_predictor", version=None),
+)
+def out_of_core_training_step(
+    file_path: str,
+    feature_strategies: list,
+    feature_state: Optional[dict] = None,
+    input_schema: Optional[dict] = None,
+    target_column: str = "selling_price",
+    chunksize: int = 100_000,
+    n_epochs: int = 3,
+) -> Annotated[Pipeline, ArtifactConfig(name="sklearn_pipeline", is_model_artifact=True)]:
+    """
+    Trains an SGD model on listings that need not fit in memory: the source is streamed chunk by
+    chunk through the feature plan into partial_fit, with hashed categorical features.
+
+    Parameters:
+    - file_path: Zip archive, directory of shards or glob pattern of raw listings.
+    - feature_strategies: Strategy keys of the feature plan.
+    - feature_state: Fitted feature plan state. If None, the plan is fitted on the first chunk.
+    - input_schema: Ingestion dtype schema, applied to every chunk and to serving inputs.
+    - target_column: Target column.
+    - chunksize: Rows per chunk; bounds peak memory.
+    - n_epochs: Passes over the stream.
+
+    Returns:
+        Pipeline that scores raw listings ('features' step followed by the SGD pipeline).
+    """
+    ingestor = DataIngestorFactory.get_data_ingestor_for_path(file_path, schema=input_schema)
+    plan = FeaturePlan(build_strategies(feature_strategies))
+    first_chunk = next(ingestor.ingest_chunks(file_path, chunksize=chunksize))
+    if feature_state is None:
+        engineered = plan.fit_transform(first_chunk)
+    else:
+        engineered = plan.set_state(feature_state).transform(first_chunk)
+    output_columns = [col for col in engineered.columns if col != target_column]
+    del first_chunk, engineered
+
+    if not mlflow.active_run():
+        mlflow.start_run()
+
+    try:
+        strategy = OutOfCoreSGDStrategy(n_epochs=n_epochs, chunk_rows=chunksize)
+        mlflow.log_params({"model_type": "sgd_out_of_core", "chunksize": chunksize, "n_epochs": n_epochs,
+                           "n_features": strategy.n_features})
+        model_pipeline = strategy.build_and_train_from_chunks(
+            lambda: stream_engineered_chunks(file_path, plan, chunksize, ingestor=ingestor), target_column
+        )
+        features = FeaturePlanTransformer(
+            build_strategies(feature_strategies),
+            state=plan.get_state(),
+            schema=input_schema,
+            target_column=target_column,
+            output_columns=output_columns,
+        ).fit(None)
+        pipeline = make_serving_pipeline(features, model_pipeline)
+        mlflow.sklearn.log_model(pipeline, "model")
+        logging.info("Out-of-core training complete; logged serving pipeline that accepts raw listings.")
+    finally:
+        mlflow.end_run()
+
+    return pipeline
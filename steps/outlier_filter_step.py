@@ -0,0 +1,46 @@
+import logging
+from typing import Annotated, Tuple
+
+import pandas as pd
+from .src.outlier_detection import MultiColumnOutlierFilter
+from .src.step_cache import cached_step
+from zenml import step
+
+
+@step(enable_cache=False)
+@cached_step(MultiColumnOutlierFilter)
+def outlier_filter_step(
+    df: pd.DataFrame, rules: dict
+) -> Tuple[
+    Annotated[pd.DataFrame, "clean_data"],
+    Annotated[dict, "outlier_report"],
+    Annotated[dict, "feature_bounds"],
+]:
+    """
+    Removes outliers in several columns in one pass, each column with its own strategy and threshold.
+
+    Parameters:
+    - df (pd.DataFrame): Input dataset
+    - rules (dict): {column: {"method": "zscore" | "iqr", "threshold": float}}
+
+    Returns:
+    - pd.DataFrame: Dataset without rows that are outliers in any rule column
+    - dict: Rows flagged per column, rows removed and the bounds used
+    - dict: Fitted bounds (FeatureBounds.to_dict) for enforcing at inference time
+    """
+    logging.info(f"Starting outlier filtering with DataFrame shape: {df.shape}")
+
+    missing = [col for col in rules if col not in df.columns]
+    if missing:
+        raise ValueError(f"Column(s) {missing} not found in DataFrame.")
+    non_numeric = [col for col in rules if not pd.api.types.is_numeric_dtype(df[col])]
+    if non_numeric:
+        raise TypeError(f"Column(s) {non_numeric} must be numeric.")
+
+    outlier_filter = MultiColumnOutlierFilter(rules).fit(df)
+    df_clean, report = outlier_filter.filter(df)
+
+    for col, count in report["flagged_per_column"].items():
+        logging.info(f"Outliers flagged in '{col}': {count}")
+    logging.info(f"Outlier filtering complete. Removed {report['rows_removed']} rows. Cleaned shape: {df_clean.shape}")
+    return df_clean, report, outlier_filter.export_bounds().to_dict()
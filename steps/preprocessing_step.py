@@ -0,0 +1,49 @@
+import logging
+from typing import Annotated, Optional
+
+import pandas as pd
+from .src.data_splitter import take_split
+from .src.model_building import build_regression_pipeline
+from .src.preprocessing import PreprocessedData
+from .src.step_cache import cached_step
+from zenml import step
+
+
+@step(enable_cache=False)
+@cached_step(PreprocessedData, build_regression_pipeline)
+def preprocessing_step(
+    X_train: Optional[pd.DataFrame] = None,
+    y_train: Optional[pd.Series] = None,
+    X_test: Optional[pd.DataFrame] = None,
+    y_test: Optional[pd.Series] = None,
+    df: Optional[pd.DataFrame] = None,
+    split_spec: Optional[dict] = None,
+    categorical_encoding: str = "sparse",
+) -> Annotated[PreprocessedData, "preprocessed_data"]:
+    """
+    Fits the model preprocessor on the training rows and transforms train and test rows once.
+    model_building_step, model_evaluator_step and feature_importance_step take the resulting
+    matrices instead of running the preprocessor again.
+
+    Parameters:
+    - X_train, y_train, X_test, y_test: Train and test data, or
+    - df, split_spec: The full dataset and a split specification (data_split_spec_step).
+    - categorical_encoding: 'sparse' (one-hot, float32 CSR), 'dense' (one-hot, dense float32 matrix)
+      or 'ordinal' (one code per column; hist_gradient_boosting treats them as native categorical
+      features). hist_gradient_boosting needs 'ordinal' or 'dense' (see build_regression_pipeline).
+
+    Returns:
+    - PreprocessedData: Fitted preprocessor, float32 train/test matrices and targets
+    """
+    if split_spec is not None:
+        X_train, y_train = take_split(df, split_spec, "train")
+        X_test, y_test = take_split(df, split_spec, "test")
+
+    if not isinstance(X_train, pd.DataFrame):
+        raise TypeError("X_train must be a pandas DataFrame.")
+    if not isinstance(y_train, pd.Series):
+        raise TypeError("y_train must be a pandas Series.")
+
+    preprocessor = build_regression_pipeline(X_train, categorical_encoding).named_steps["preprocessor"]
+    logging.info(f"Fitting the {categorical_encoding} preprocessor once for training and evaluation...")
+    return PreprocessedData.fit(preprocessor, X_train, y_train, X_test, y_test)
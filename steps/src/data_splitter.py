@@ -1,8 +1,15 @@
+import base64
 import logging
+import time
 from abc import ABC, abstractmethod
+from typing import Iterator
 
+import numpy as np
 import pandas as pd
-from sklearn.model_selection import train_test_split
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.metrics import mean_squared_error, r2_score
+from sklearn.model_selection import KFold, RepeatedKFold, StratifiedKFold, TimeSeriesSplit, train_test_split
 
 # Configure logging format and level
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -24,6 +31,16 @@ class DataSplittingStrategy(ABC):
         """
         pass
 
+    @abstractmethod
+    def split_indices(self, df: pd.DataFrame, target_column: str) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Row positions of the train and test sets, without materializing them.
+
+        Returns:
+        - Tuple of (train_positions, test_positions) as int arrays
+        """
+        pass
+
 
 # Concrete Strategy: Simple Train-Test Split
 # ------------------------------------------
@@ -56,10 +73,31 @@ class SimpleTrainTestSplitStrategy(DataSplittingStrategy):
         logging.info("Data split completed successfully.")
         return X_train, X_test, y_train, y_test
 
+    def split_indices(self, df: pd.DataFrame, target_column: str) -> tuple[np.ndarray, np.ndarray]:
+        # Shuffling depends only on the row count and seed, so this matches split() row for row.
+        return train_test_split(np.arange(len(df)), test_size=self.test_size, random_state=self.random_state)
+
+def stratification_labels(y: pd.Series, n_bins: int = 10) -> np.ndarray:
+    """
+    Class labels to stratify on. A continuous target (float, or more distinct values than n_bins)
+    is binned into quantiles, since stratifying on nearly unique values is impossible.
+    """
+    if pd.api.types.is_float_dtype(y) or y.nunique() > n_bins:
+        return pd.qcut(y, q=n_bins, labels=False, duplicates="drop").to_numpy()
+    return y.to_numpy()
+
+
 class StratifiedTrainTestSplitStrategy(DataSplittingStrategy):
-    def __init__(self, test_size: float = 0.2, random_state: int = 0):
+    def __init__(self, test_size: float = 0.2, random_state: int = 0, n_bins: int = 10):
+        """
+        Parameters:
+        - test_size (float): Proportion of data to allocate to the test set.
+        - random_state (int): Seed for random number generator.
+        - n_bins (int): Quantile bins used to stratify a continuous target.
+        """
         self.test_size = test_size
         self.random_state = random_state
+        self.n_bins = n_bins
 
     def split(self, df: pd.DataFrame, target_column: str):
         logging.info("Applying stratified train-test split.")
@@ -70,11 +108,90 @@ class StratifiedTrainTestSplitStrategy(DataSplittingStrategy):
             X, y,
             test_size=self.test_size,
             random_state=self.random_state,
-            stratify=y  # giữ tỷ lệ phân bố y
+            stratify=stratification_labels(y, self.n_bins)  # giữ tỷ lệ phân bố y
         )
 
         logging.info("Stratified split completed.")
         return X_train, X_test, y_train, y_test
+
+    def split_indices(self, df: pd.DataFrame, target_column: str) -> tuple[np.ndarray, np.ndarray]:
+        return train_test_split(
+            np.arange(len(df)),
+            test_size=self.test_size,
+            random_state=self.random_state,
+            stratify=stratification_labels(df[target_column], self.n_bins)
+        )
+
+
+# Base interface for cross-validation fold generators
+class CrossValidationStrategy(ABC):
+    @abstractmethod
+    def folds(self, df: pd.DataFrame, target_column: str) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """
+        Yield (train_positions, test_positions) for every fold.
+        """
+        pass
+
+
+class KFoldStrategy(CrossValidationStrategy):
+    def __init__(self, n_splits: int = 5, random_state: int = 0):
+        self.n_splits = n_splits
+        self.random_state = random_state
+
+    def folds(self, df: pd.DataFrame, target_column: str):
+        return KFold(self.n_splits, shuffle=True, random_state=self.random_state).split(np.empty(len(df)))
+
+
+class RepeatedKFoldStrategy(CrossValidationStrategy):
+    def __init__(self, n_splits: int = 5, n_repeats: int = 3, random_state: int = 0):
+        self.n_splits = n_splits
+        self.n_repeats = n_repeats
+        self.random_state = random_state
+
+    def folds(self, df: pd.DataFrame, target_column: str):
+        splitter = RepeatedKFold(n_splits=self.n_splits, n_repeats=self.n_repeats, random_state=self.random_state)
+        return splitter.split(np.empty(len(df)))
+
+
+class BinnedStratifiedKFoldStrategy(CrossValidationStrategy):
+    def __init__(self, n_splits: int = 5, n_bins: int = 10, random_state: int = 0):
+        """
+        K-fold with every fold holding the same share of each target quantile bin.
+        """
+        self.n_splits = n_splits
+        self.n_bins = n_bins
+        self.random_state = random_state
+
+    def folds(self, df: pd.DataFrame, target_column: str):
+        labels = stratification_labels(df[target_column], self.n_bins)
+        splitter = StratifiedKFold(self.n_splits, shuffle=True, random_state=self.random_state)
+        return splitter.split(np.empty(len(df)), labels)
+
+
+class TimeOrderedSplitStrategy(CrossValidationStrategy):
+    def __init__(self, time_column: str = "year", n_splits: int = 5, ascending: bool = True):
+        """
+        Expanding-window folds: each fold trains on earlier periods and tests on the next ones.
+        Rows of one period (e.g. one year) never straddle train and test.
+
+        Parameters:
+        - time_column (str): Column giving the period of each row.
+        - n_splits (int): Number of folds.
+        - ascending (bool): False for columns that count backwards in time (e.g. 'age').
+        """
+        self.time_column = time_column
+        self.n_splits = n_splits
+        self.ascending = ascending
+
+    def folds(self, df: pd.DataFrame, target_column: str):
+        periods = df[self.time_column].to_numpy()
+        distinct = np.unique(periods)
+        # Chronological rank of every row's period
+        row_rank = np.searchsorted(distinct, periods)
+        if not self.ascending:
+            row_rank = len(distinct) - 1 - row_rank
+        for train_periods, test_periods in TimeSeriesSplit(self.n_splits).split(distinct):
+            yield np.flatnonzero(row_rank <= train_periods.max()), np.flatnonzero(np.isin(row_rank, test_periods))
     
 # Context Class to Use a Splitting Strategy
 class DataSplitter:
@@ -111,6 +228,134 @@ class DataSplitter:
         logging.info("Executing data split using current strategy.")
         return self._strategy.split(df, target_column)
 
+    def split_spec(self, df: pd.DataFrame, target_column: str) -> dict:
+        """
+        Compute a compact split specification instead of four new data objects.
+
+        Returns:
+        - dict: Test-row mask (bit-packed, base64) plus the settings that produced it; every
+          other row is a training row (see take_split to materialize a subset from the one stored dataset).
+        """
+        logging.info("Computing index-based split specification.")
+        _, test = self._strategy.split_indices(df, target_column)
+        test_mask = np.zeros(len(df), dtype=bool)
+        test_mask[test] = True
+        return {
+            "strategy": type(self._strategy).__name__,
+            "seed": getattr(self._strategy, "random_state", None),
+            "target_column": target_column,
+            "n_rows": int(len(df)),
+            "test_mask": base64.b64encode(np.packbits(test_mask).tobytes()).decode("ascii"),
+        }
+
+
+def split_positions(split_spec: dict, subset: str = "train") -> np.ndarray:
+    """
+    Row positions of 'train' or 'test' in a split specification, in ascending order.
+    """
+    packed = np.frombuffer(base64.b64decode(split_spec["test_mask"]), dtype=np.uint8)
+    test_mask = np.unpackbits(packed, count=split_spec["n_rows"]).astype(bool)
+    if subset not in ("train", "test"):
+        raise ValueError(f"Unknown subset '{subset}'. Expected 'train' or 'test'.")
+    return np.flatnonzero(test_mask if subset == "test" else ~test_mask)
+
+
+def take_split(df: pd.DataFrame, split_spec: dict, subset: str = "train") -> tuple[pd.DataFrame, pd.Series]:
+    """
+    Materialize one subset of a split specification from the full dataset.
+
+    Parameters:
+    - df (pd.DataFrame): The dataset the specification was computed on.
+    - split_spec (dict): Output of DataSplitter.split_spec.
+    - subset (str): 'train' or 'test'.
+
+    Returns:
+    - Tuple of (X, y)
+    """
+    if len(df) != split_spec["n_rows"]:
+        raise ValueError(f"Split specification was computed on {split_spec['n_rows']} rows, got {len(df)}.")
+    target_column = split_spec["target_column"]
+    rows = df.iloc[split_positions(split_spec, subset)]
+    return rows.drop(columns=[target_column]), rows[target_column]
+
+
+
+def _frame_arrays(df: pd.DataFrame) -> tuple[dict, dict]:
+    # Columns as plain numpy arrays (categoricals as integer codes), which joblib memory-maps
+    # once and hands to every worker read-only instead of pickling the frame per task.
+    arrays, categories = {}, {}
+    for col in df.columns:
+        values = df[col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            arrays[col], categories[col] = values.cat.codes.to_numpy(), values.cat.categories
+        elif values.dtype == object:
+            arrays[col], categories[col] = pd.factorize(values)
+        elif isinstance(values.dtype, np.dtype):
+            arrays[col] = values.to_numpy()
+        else:
+            arrays[col] = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    return arrays, categories
+
+
+def _take_rows(arrays: dict, categories: dict, rows: np.ndarray) -> pd.DataFrame:
+    return pd.DataFrame({
+        col: pd.Categorical.from_codes(values[rows], categories[col]) if col in categories else values[rows]
+        for col, values in arrays.items()
+    })
+
+
+def _run_fold(estimator, arrays: dict, categories: dict, y: np.ndarray, train: np.ndarray, test: np.ndarray, fold: int) -> dict:
+    start = time.perf_counter()
+    model = clone(estimator).fit(_take_rows(arrays, categories, train), y[train])
+    fit_seconds = time.perf_counter() - start
+    y_pred = model.predict(_take_rows(arrays, categories, test))
+    return {
+        "fold": fold,
+        "n_train": int(len(train)),
+        "n_test": int(len(test)),
+        "Mean Squared Error": float(mean_squared_error(y[test], y_pred)),
+        "R-Squared": float(r2_score(y[test], y_pred)),
+        "fit_seconds": fit_seconds,
+    }
+
+
+def cross_validate(
+    estimator,
+    df: pd.DataFrame,
+    target_column: str,
+    strategy: CrossValidationStrategy,
+    n_jobs: int = -1,
+    max_nbytes: str = "1M",
+) -> pd.DataFrame:
+    """
+    Fit and score a fresh clone of estimator on every fold, folds running in parallel processes.
+
+    Parameters:
+    - estimator: Unfitted scikit-learn estimator or pipeline taking a DataFrame.
+    - df (pd.DataFrame): Dataset including features and target.
+    - target_column (str): Target column name.
+    - strategy (CrossValidationStrategy): Fold generator.
+    - n_jobs (int): Worker processes (-1 = all cores).
+    - max_nbytes (str): Arrays larger than this are shared with workers as read-only memory maps.
+
+    Returns:
+    - pd.DataFrame: One row of metrics per fold.
+    """
+    y = df[target_column].to_numpy(dtype=np.float64)
+    arrays, categories = _frame_arrays(df.drop(columns=[target_column]))
+    folds = list(strategy.folds(df, target_column))
+    logging.info(f"Cross-validating {type(strategy).__name__}: {len(folds)} folds, n_jobs={n_jobs}.")
+
+    results = Parallel(n_jobs=n_jobs, max_nbytes=max_nbytes, mmap_mode="r")(
+        delayed(_run_fold)(estimator, arrays, categories, y, train, test, fold)
+        for fold, (train, test) in enumerate(folds)
+    )
+    results = pd.DataFrame(results)
+    logging.info(
+        f"Cross-validation R-Squared: {results['R-Squared'].mean():.4f} +/- {results['R-Squared'].std():.4f}"
+    )
+    return results
+
 
 if __name__ == "__main__":
     pass
@@ -1,9 +1,14 @@
 import logging
+import operator
+import time
 from abc import ABC, abstractmethod
+from unittest import mock
 
 import numpy as np
 import pandas as pd
-from sklearn.preprocessing import MinMaxScaler, OneHotEncoder, StandardScaler
+from sklearn.preprocessing import MinMaxScaler, OneHotEncoder, OrdinalEncoder, StandardScaler
+
+from .text_transforms import LRUMemo, map_unique, parse_numeric_with_unit
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -12,77 +17,275 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(
 # Base class for all feature engineering strategies
 class FeatureEngineeringStrategy(ABC):
     @abstractmethod
-    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+    def apply_transformation(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
         """
         Apply transformation to the provided DataFrame.
 
         Parameters:
         - df (pd.DataFrame): Input dataframe.
+        - inplace (bool): Modify df directly instead of working on a copy.
+
+        Returns:
+        - pd.DataFrame: Transformed dataframe.
+        """
+        pass
+
+    def fit(self, df: pd.DataFrame) -> "FeatureEngineeringStrategy":
+        """
+        Learn the strategy's state from training data. Stateless strategies have nothing to learn.
+
+        Parameters:
+        - df (pd.DataFrame): Training dataframe.
+
+        Returns:
+        - The fitted strategy.
+        """
+        return self
+
+    def transform(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+        """
+        Apply the fitted transformation without refitting.
+
+        Parameters:
+        - df (pd.DataFrame): Input dataframe.
+        - inplace (bool): Modify df directly instead of working on a copy.
 
         Returns:
         - pd.DataFrame: Transformed dataframe.
         """
+        return self.apply_transformation(df, inplace=inplace)
+
+    def get_state(self) -> dict:
+        """
+        Fitted state as a JSON-serializable dict (empty for stateless strategies).
+        """
+        return {}
+
+    def set_state(self, state: dict) -> "FeatureEngineeringStrategy":
+        """
+        Restore a fitted state produced by get_state.
+        """
+        return self
+
+    @abstractmethod
+    def input_columns(self) -> list[str]:
+        """
+        Columns this strategy reads from its input DataFrame.
+        """
         pass
 
+    @abstractmethod
+    def output_columns(self) -> list[str]:
+        """
+        Columns this strategy creates or overwrites.
+        """
+        pass
+
+    def dropped_columns(self) -> list[str]:
+        """
+        Columns this strategy removes from the DataFrame.
+        """
+        return []
+
+    def column_operations(self):
+        """
+        Describe the strategy as column-local operations, so a FeaturePlan can fuse it with its neighbours.
+
+        Returns:
+        - list of (output column, input columns, function) tuples, where the function maps the
+          input Series to the output Series, or None if the strategy is not column-local.
+        """
+        return None
+
 class LogTransformation(FeatureEngineeringStrategy):
     def __init__(self, features: list[str]):
         self.features = features
 
-    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+    def apply_transformation(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
         logging.info(f"Applying log transformation to: {self.features}")
-        df_copy = df.copy()
+        df_copy = df if inplace else df.copy()
         for feature in self.features:
             df_copy[feature] = np.log1p(df_copy[feature])
         logging.info("Log transformation completed.")
         return df_copy
 
+    def input_columns(self) -> list[str]:
+        return list(self.features)
+
+    def output_columns(self) -> list[str]:
+        return list(self.features)
+
+    def column_operations(self):
+        return [(feature, (feature,), np.log1p) for feature in self.features]
+
 # Strategy: Standard Scaling
 class StandardScaling(FeatureEngineeringStrategy):
     def __init__(self, features: list[str]):
         self.features = features
         self.scaler = StandardScaler()
+        self.mean_ = None
+        self.scale_ = None
+
+    def fit(self, df: pd.DataFrame) -> "StandardScaling":
+        self.scaler.fit(df[self.features])
+        self.mean_, self.scale_ = self.scaler.mean_, self.scaler.scale_
+        return self
+
+    def transform(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+        if self.mean_ is None:
+            raise RuntimeError("StandardScaling must be fitted before transform.")
+        df_copy = df if inplace else df.copy()
+        df_copy[self.features] = (df_copy[self.features].to_numpy(dtype=float) - self.mean_) / self.scale_
+        return df_copy
 
-    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+    def apply_transformation(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
         logging.info(f"Applying standard scaling to: {self.features}")
-        df_copy = df.copy()
-        df_copy[self.features] = self.scaler.fit_transform(df_copy[self.features])
+        df_copy = self.fit(df).transform(df, inplace=inplace)
         logging.info("Standard scaling completed.")
         return df_copy
 
+    def get_state(self) -> dict:
+        return {"mean": self.mean_.tolist(), "scale": self.scale_.tolist()}
+
+    def set_state(self, state: dict) -> "StandardScaling":
+        self.mean_, self.scale_ = np.asarray(state["mean"]), np.asarray(state["scale"])
+        return self
+
+    def input_columns(self) -> list[str]:
+        return list(self.features)
+
+    def output_columns(self) -> list[str]:
+        return list(self.features)
+
 
 # Strategy: Min-Max Scaling
 class MinMaxScaling(FeatureEngineeringStrategy):
     def __init__(self, features: list[str], feature_range: tuple = (0, 1)):
         self.features = features
         self.scaler = MinMaxScaler(feature_range=feature_range)
+        self.min_ = None
+        self.scale_ = None
+
+    def fit(self, df: pd.DataFrame) -> "MinMaxScaling":
+        self.scaler.fit(df[self.features])
+        self.min_, self.scale_ = self.scaler.min_, self.scaler.scale_
+        return self
+
+    def transform(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+        if self.min_ is None:
+            raise RuntimeError("MinMaxScaling must be fitted before transform.")
+        df_copy = df if inplace else df.copy()
+        df_copy[self.features] = df_copy[self.features].to_numpy(dtype=float) * self.scale_ + self.min_
+        return df_copy
 
-    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+    def apply_transformation(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
         logging.info(f"Applying Min-Max scaling to: {self.features}, range={self.scaler.feature_range}")
-        df_copy = df.copy()
-        df_copy[self.features] = self.scaler.fit_transform(df_copy[self.features])
+        df_copy = self.fit(df).transform(df, inplace=inplace)
         logging.info("Min-Max scaling completed.")
         return df_copy
 
+    def get_state(self) -> dict:
+        return {"min": self.min_.tolist(), "scale": self.scale_.tolist()}
+
+    def set_state(self, state: dict) -> "MinMaxScaling":
+        self.min_, self.scale_ = np.asarray(state["min"]), np.asarray(state["scale"])
+        return self
+
+    def input_columns(self) -> list[str]:
+        return list(self.features)
+
+    def output_columns(self) -> list[str]:
+        return list(self.features)
+
 
 # Strategy: One-Hot Encoding
 class OneHotEncoding(FeatureEngineeringStrategy):
-    def __init__(self, features: list[str]):
+    ENCODINGS = ("dense", "sparse", "ordinal")
+
+    def __init__(self, features: list[str], encoding: str = "dense"):
+        """
+        Parameters:
+        - features (list[str]): Categorical columns to encode.
+        - encoding (str): 'dense' for float64 indicator columns, 'sparse' for float32 indicator columns
+          backed by pandas SparseDtype (kept as CSR into model training), or 'ordinal' for one int32
+          code column per feature, for tree models. Unknown categories encode as -1 in ordinal mode.
+        """
+        if encoding not in self.ENCODINGS:
+            raise ValueError(f"Unknown encoding '{encoding}'. Expected one of {self.ENCODINGS}.")
         self.features = features
-        self.encoder = OneHotEncoder(sparse=False, drop="first")
+        self.encoding = encoding
+        if encoding == "ordinal":
+            self.encoder = OrdinalEncoder(
+                handle_unknown="use_encoded_value", unknown_value=-1, encoded_missing_value=-1, dtype=np.int32
+            )
+        else:
+            # Unknown categories in later batches encode as all zeros, so the output columns never change.
+            self.encoder = OneHotEncoder(
+                sparse_output=encoding == "sparse",
+                drop="first",
+                handle_unknown="ignore",
+                dtype=np.float32 if encoding == "sparse" else np.float64,
+            )
+
+    def fit(self, df: pd.DataFrame) -> "OneHotEncoding":
+        self.encoder.fit(df[self.features])
+        return self
+
+    def transform(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+        if not hasattr(self.encoder, "categories_"):
+            raise RuntimeError("OneHotEncoding must be fitted before transform.")
+        encoded = self.encoder.transform(df[self.features])
+        if self.encoding == "ordinal":
+            # Codes replace the categorical columns in place of position.
+            df = df if inplace else df.copy()
+            for position, feature in enumerate(self.features):
+                df[feature] = encoded[:, position]
+            return df
+        if self.encoding == "sparse":
+            encoded = pd.DataFrame.sparse.from_spmatrix(
+                encoded, index=df.index, columns=self.encoder.get_feature_names_out(self.features)
+            )
+        else:
+            encoded = pd.DataFrame(
+                encoded, columns=self.encoder.get_feature_names_out(self.features), index=df.index
+            )
+        # pd.concat builds a new frame anyway, so the input is never copied first.
+        return pd.concat([df.drop(columns=self.features), encoded], axis=1)
 
-    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+    def apply_transformation(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
         logging.info(f"Applying one-hot encoding to: {self.features}")
-        df_copy = df.copy()
-        encoded = pd.DataFrame(
-            self.encoder.fit_transform(df_copy[self.features]),
-            columns=self.encoder.get_feature_names_out(self.features),
-            index=df_copy.index
-        )
-        df_copy.drop(columns=self.features, inplace=True)
-        df_transformed = pd.concat([df_copy, encoded], axis=1)
+        df_transformed = self.fit(df).transform(df, inplace=inplace)
         logging.info("One-hot encoding completed.")
         return df_transformed
 
+    def get_state(self) -> dict:
+        return {"categories": [categories.tolist() for categories in self.encoder.categories_]}
+
+    def set_state(self, state: dict) -> "OneHotEncoding":
+        categories = [list(values) for values in state["categories"]]
+        # Fitting on a frame made of the known categories restores the encoder without the training data.
+        n_rows = max(len(values) for values in categories)
+        known = pd.DataFrame({
+            feature: values + values[:1] * (n_rows - len(values))
+            for feature, values in zip(self.features, categories)
+        })
+        self.encoder.set_params(categories=categories)
+        self.encoder.fit(known)
+        return self
+
+    def input_columns(self) -> list[str]:
+        return list(self.features)
+
+    def output_columns(self) -> list[str]:
+        if self.encoding == "ordinal":
+            return list(self.features)
+        if hasattr(self.encoder, "categories_"):
+            return list(self.encoder.get_feature_names_out(self.features))
+        return []
+
+    def dropped_columns(self) -> list[str]:
+        return [] if self.encoding == "ordinal" else list(self.features)
+
 
 # Context class for applying strategies
 class FeatureEngineer:
@@ -103,30 +306,66 @@ class ColumnDifference(FeatureEngineeringStrategy):
         self.col_b = col_b
         self.new_col = new_col
 
-    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+    def apply_transformation(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
         logging.info(f"Creating '{self.new_col}' = {self.col_a} - {self.col_b}")
-        df_copy = df.copy()
+        df_copy = df if inplace else df.copy()
         df_copy[self.new_col] = df_copy[self.col_a] - df_copy[self.col_b]
         return df_copy
+
+    def input_columns(self) -> list[str]:
+        return [self.col_a, self.col_b]
+
+    def output_columns(self) -> list[str]:
+        return [self.new_col]
+
+    def column_operations(self):
+        return [(self.new_col, (self.col_a, self.col_b), operator.sub)]
     
 class ColumnDropper(FeatureEngineeringStrategy):
     def __init__(self, columns: list[str]):
         self.columns = columns
 
-    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+    def apply_transformation(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
         logging.info(f"Dropping columns: {self.columns}")
+        if inplace:
+            df.drop(columns=self.columns, errors='ignore', inplace=True)
+            return df
         return df.drop(columns=self.columns, errors='ignore')
 
+    def input_columns(self) -> list[str]:
+        return []
+
+    def output_columns(self) -> list[str]:
+        return []
+
+    def dropped_columns(self) -> list[str]:
+        return list(self.columns)
+
+    def column_operations(self):
+        return []
+
 class ValueMapper(FeatureEngineeringStrategy):
     def __init__(self, column: str, mapping: dict):
         self.column = column
         self.mapping = mapping
 
-    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+    def apply_transformation(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
         logging.info(f"Mapping values in column '{self.column}': {self.mapping}")
-        df_copy = df.copy()
-        df_copy[self.column] = df_copy[self.column].map(self.mapping)
+        df_copy = df if inplace else df.copy()
+        df_copy[self.column] = self._map(df_copy[self.column])
         return df_copy
+
+    def input_columns(self) -> list[str]:
+        return [self.column]
+
+    def output_columns(self) -> list[str]:
+        return [self.column]
+
+    def _map(self, series: pd.Series) -> pd.Series:
+        return map_unique(series, lambda uniques: uniques.map(self.mapping))
+
+    def column_operations(self):
+        return [(self.column, (self.column,), self._map)]
     
 class UnitRemover(FeatureEngineeringStrategy):
     def __init__(self, column_patterns: dict[str, str]):
@@ -135,13 +374,79 @@ class UnitRemover(FeatureEngineeringStrategy):
         """
         self.column_patterns = column_patterns
 
-    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+    @staticmethod
+    def _strip(series: pd.Series, pattern: str) -> pd.Series:
+        return map_unique(series, lambda uniques: uniques.astype(str).str.replace(pattern, '', regex=True).str.strip())
+
+    def apply_transformation(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
         logging.info(f"Stripping unit patterns: {self.column_patterns}")
-        df_copy = df.copy()
+        df_copy = df if inplace else df.copy()
         for col, pattern in self.column_patterns.items():
-            df_copy[col] = df_copy[col].astype(str).str.replace(pattern, '', regex=True).str.strip()
+            df_copy[col] = self._strip(df_copy[col], pattern)
         return df_copy
+
+    def input_columns(self) -> list[str]:
+        return list(self.column_patterns)
+
+    def output_columns(self) -> list[str]:
+        return list(self.column_patterns)
+
+    def column_operations(self):
+        return [
+            (col, (col,), lambda series, pattern=pattern: self._strip(series, pattern))
+            for col, pattern in self.column_patterns.items()
+        ]
     
+class NumericUnitParser(FeatureEngineeringStrategy):
+    def __init__(self, column_patterns: dict[str, str], dtype: str = "float32", memo_size: int = 100_000):
+        """
+        Parse '<number> <unit>' strings into floats in one vectorized pass per column
+        (replaces UnitRemover followed by TypeCaster to 'float').
+
+        column_patterns: { 'mileage': 'kmpl|km/kg', 'engine': 'CC', ... }
+        dtype: output float dtype
+        memo_size: distinct raw values per column remembered across batches
+        """
+        self.column_patterns = column_patterns
+        self.dtype = dtype
+        self._memos = {col: LRUMemo(memo_size) for col in column_patterns}
+        self.unparsed_counts_ = {}
+
+    def _parse(self, series: pd.Series, col: str) -> pd.Series:
+        if pd.api.types.is_numeric_dtype(series):
+            return series.astype(self.dtype)
+        pattern = self.column_patterns[col]
+        parsed = map_unique(
+            series,
+            lambda uniques: parse_numeric_with_unit(uniques, pattern, dtype=self.dtype)[0],
+            self._memos[col],
+        )
+        n_unparsed = int((parsed.isna() & series.notna()).sum())
+        self.unparsed_counts_[col] = n_unparsed
+        if n_unparsed:
+            logging.warning(f"{n_unparsed} value(s) in '{col}' could not be parsed and were set to NaN.")
+        return parsed
+
+    def apply_transformation(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+        logging.info(f"Parsing numeric values with units: {self.column_patterns}")
+        df_copy = df if inplace else df.copy()
+        for col in self.column_patterns:
+            df_copy[col] = self._parse(df_copy[col], col)
+        return df_copy
+
+    def input_columns(self) -> list[str]:
+        return list(self.column_patterns)
+
+    def output_columns(self) -> list[str]:
+        return list(self.column_patterns)
+
+    def column_operations(self):
+        return [
+            (col, (col,), lambda series, col=col: self._parse(series, col))
+            for col in self.column_patterns
+        ]
+
+
 class TypeCaster(FeatureEngineeringStrategy):
     def __init__(self, type_map: dict[str, str]):
         """
@@ -149,22 +454,39 @@ class TypeCaster(FeatureEngineeringStrategy):
         """
         self.type_map = type_map
 
-    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+    @staticmethod
+    def _cast(series: pd.Series, dtype: str) -> pd.Series:
+        try:
+            if dtype == 'float':
+                return pd.to_numeric(series, errors='coerce')
+            elif dtype == 'str':
+                return series.astype(str)
+            elif dtype == 'int':
+                return pd.to_numeric(series, errors='coerce').astype('Int64')
+            else:
+                return series.astype(dtype)
+        except Exception as e:
+            logging.warning(f"Failed to cast column {series.name} to {dtype}: {e}")
+            return series
+
+    def apply_transformation(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
         logging.info(f"Casting types: {self.type_map}")
-        df_copy = df.copy()
+        df_copy = df if inplace else df.copy()
         for col, dtype in self.type_map.items():
-            try:
-                if dtype == 'float':
-                    df_copy[col] = pd.to_numeric(df_copy[col], errors='coerce')
-                elif dtype == 'str':
-                    df_copy[col] = df_copy[col].astype(str)
-                elif dtype == 'int':
-                    df_copy[col] = pd.to_numeric(df_copy[col], errors='coerce').astype('Int64')
-                else:
-                    df_copy[col] = df_copy[col].astype(dtype)
-            except Exception as e:
-                logging.warning(f"Failed to cast column {col} to {dtype}: {e}")
+            df_copy[col] = self._cast(df_copy[col], dtype)
         return df_copy
+
+    def input_columns(self) -> list[str]:
+        return list(self.type_map)
+
+    def output_columns(self) -> list[str]:
+        return list(self.type_map)
+
+    def column_operations(self):
+        return [
+            (col, (col,), lambda series, dtype=dtype: self._cast(series, dtype))
+            for col, dtype in self.type_map.items()
+        ]
     
 class ColumnReplacerWithDifference(FeatureEngineeringStrategy):
     def __init__(self, constant: int, column: str, new_name: str = None):
@@ -178,9 +500,9 @@ class ColumnReplacerWithDifference(FeatureEngineeringStrategy):
         self.column = column
         self.new_name = new_name or column
 
-    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+    def apply_transformation(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
         logging.info(f"Replacing column '{self.column}' with ({self.constant} - value)")
-        df_copy = df.copy()
+        df_copy = df if inplace else df.copy()
         df_copy[self.new_name] = self.constant - df_copy[self.column]
         if self.new_name != self.column:
             logging.info(f"New column '{self.new_name}' created.")
@@ -188,8 +510,18 @@ class ColumnReplacerWithDifference(FeatureEngineeringStrategy):
             logging.info(f"Column '{self.column}' replaced.")
         return df_copy
 
+    def input_columns(self) -> list[str]:
+        return [self.column]
+
+    def output_columns(self) -> list[str]:
+        return [self.new_name]
+
+    def column_operations(self):
+        return [(self.new_name, (self.column,), lambda series: self.constant - series)]
+
 class SplitExtractAndDrop(FeatureEngineeringStrategy):
-    def __init__(self, source_column: str, new_column: str, split_delimiter: str = ' ', element_index: int = 0):
+    def __init__(self, source_column: str, new_column: str, split_delimiter: str = ' ', element_index: int = 0,
+                 memo_size: int = 100_000):
         """
         Extract part of the string from the original column and drop the original column.
 
@@ -198,18 +530,335 @@ class SplitExtractAndDrop(FeatureEngineeringStrategy):
         new_column: new column name after splitting (eg: 'brand')
         split_delimiter: separator character (default is space)
         element_index: position of element to get (eg: 0 to get first word)
+        memo_size: distinct source values remembered across batches
         """
         self.source_column = source_column
         self.new_column = new_column
         self.split_delimiter = split_delimiter
         self.element_index = element_index
+        self._memo = LRUMemo(memo_size)
+
+    def _extract(self, series: pd.Series) -> pd.Series:
+        # The split runs on distinct names only; brands repeat across thousands of rows.
+        return map_unique(
+            series,
+            lambda uniques: uniques.astype(str).str.split(self.split_delimiter).str.get(self.element_index),
+            self._memo,
+        )
 
-    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+    def apply_transformation(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
         logging.info(f"Extracting '{self.new_column}' from '{self.source_column}' using split('{self.split_delimiter}')[{self.element_index}] and dropping original column.")
-        df_copy = df.copy()
-        df_copy[self.new_column] = df_copy[self.source_column].astype(str).str.split(self.split_delimiter).str.get(self.element_index)
+        df_copy = df if inplace else df.copy()
+        df_copy[self.new_column] = self._extract(df_copy[self.source_column])
         df_copy.drop(columns=[self.source_column], inplace=True)
         return df_copy
 
+    def input_columns(self) -> list[str]:
+        return [self.source_column]
+
+    def output_columns(self) -> list[str]:
+        return [self.new_column]
+
+    def dropped_columns(self) -> list[str]:
+        return [self.source_column]
+
+    def column_operations(self):
+        return [(self.new_column, (self.source_column,), self._extract)]
+
+
+def required_columns(strategies: list[FeatureEngineeringStrategy], keep_columns: list[str] = ()) -> list[str]:
+    """
+    Derive the source columns needed to run a chain of strategies.
+
+    Parameters:
+    - strategies (list): Strategies in the order they will be applied.
+    - keep_columns (list): Source columns used downstream as-is (target, passthrough features).
+
+    Returns:
+    - list[str]: Columns to project at ingestion. Columns created by an earlier
+      strategy are not requested from the source.
+    """
+    sourced = []
+    produced = set()
+    for strategy in strategies:
+        for col in strategy.input_columns():
+            if col not in produced and col not in sourced:
+                sourced.append(col)
+        produced.update(strategy.output_columns())
+
+    created = produced.difference(sourced)
+    kept = [col for col in keep_columns if col not in created]
+    return kept + [col for col in sourced if col not in kept]
+
+# Compiled execution plan for an ordered list of strategies
+class FeaturePlan:
+    def __init__(self, strategies: list[FeatureEngineeringStrategy]):
+        """
+        Compile an ordered list of strategies into execution stages.
+
+        Adjacent column-local strategies (see FeatureEngineeringStrategy.column_operations) are
+        fused into one stage: intermediate Series flow from one operation to the next and every
+        output column is written to the frame once, at the end of the stage. Other strategies
+        run in place on the plan's working frame.
+
+        Parameters:
+        - strategies (list): Strategies in the order they must be applied.
+        """
+        self.strategies = list(strategies)
+        self.stages = []
+        for strategy in self.strategies:
+            kind = "single" if strategy.column_operations() is None else "fused"
+            if kind == "fused" and self.stages and self.stages[-1][0] == "fused":
+                self.stages[-1][1].append(strategy)
+            else:
+                self.stages.append((kind, [strategy]))
+
+    def validate(self, columns) -> None:
+        """
+        Check that every strategy only reads columns available at its position in the plan.
+
+        Raises:
+        - ValueError: If a strategy reads a column that is neither in the input nor produced earlier.
+        """
+        available = set(columns)
+        for strategy in self.strategies:
+            missing = [col for col in strategy.input_columns() if col not in available]
+            if missing:
+                raise ValueError(f"{type(strategy).__name__} reads missing column(s): {missing}")
+            available.update(strategy.output_columns())
+            available.difference_update(strategy.dropped_columns())
+
+    def _run_fused(self, df: pd.DataFrame, strategies: list[FeatureEngineeringStrategy]) -> pd.DataFrame:
+        logging.info(f"Running fused stage: {' -> '.join(type(strategy).__name__ for strategy in strategies)}")
+        pending = {}
+        dropped = set()
+        for strategy in strategies:
+            for output, inputs, func in strategy.column_operations():
+                args = [pending[col] if col in pending else df[col] for col in inputs]
+                pending[output] = func(*args)
+                dropped.discard(output)
+            for col in strategy.dropped_columns():
+                pending.pop(col, None)
+                dropped.add(col)
+
+        df.drop(columns=[col for col in dropped if col in df.columns], inplace=True)
+        for col, series in pending.items():
+            df[col] = series
+        return df
+
+    def _run(self, df: pd.DataFrame, copy: bool, fit: bool) -> pd.DataFrame:
+        self.validate(df.columns)
+        logging.info(
+            f"{'Fitting and applying' if fit else 'Applying fitted'} feature plan: "
+            f"{len(self.strategies)} strategies in {len(self.stages)} stage(s)."
+        )
+        df_transformed = df.copy() if copy else df
+        for kind, strategies in self.stages:
+            if kind == "fused":
+                df_transformed = self._run_fused(df_transformed, strategies)
+            elif fit:
+                df_transformed = strategies[0].apply_transformation(df_transformed, inplace=True)
+            else:
+                df_transformed = strategies[0].transform(df_transformed, inplace=True)
+        return df_transformed
+
+    def fit_transform(self, df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
+        """
+        Fit every stateful strategy on the data it sees at its position in the plan and apply it.
+
+        Parameters:
+        - df (pd.DataFrame): Training dataframe.
+        - copy (bool): Take one defensive copy of df first. With False, df is modified in place.
+
+        Returns:
+        - pd.DataFrame: Transformed dataframe.
+        """
+        return self._run(df, copy=copy, fit=True)
+
+    def transform(self, df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
+        """
+        Apply the fitted plan to a new batch; no strategy is refitted.
+        """
+        return self._run(df, copy=copy, fit=False)
+
+    def apply(self, df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
+        """
+        Run the plan, fitting stateful strategies on df (same as fit_transform).
+        """
+        return self.fit_transform(df, copy=copy)
+
+    def get_state(self) -> dict:
+        """
+        Fitted state of the whole plan as a compact JSON-serializable dict.
+        """
+        return {
+            "strategies": [type(strategy).__name__ for strategy in self.strategies],
+            "states": [strategy.get_state() for strategy in self.strategies],
+        }
+
+    def set_state(self, state: dict) -> "FeaturePlan":
+        """
+        Restore the fitted state produced by get_state on a plan built from the same strategies.
+        """
+        names = [type(strategy).__name__ for strategy in self.strategies]
+        if state["strategies"] != names:
+            raise ValueError(f"Feature state was fitted for {state['strategies']}, not {names}.")
+        for strategy, strategy_state in zip(self.strategies, state["states"]):
+            strategy.set_state(strategy_state)
+        return self
+
+
+def synthetic_listings(n_rows: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Raw cardekho-like listings (the columns of data/archive.zip), for benchmarks and tests.
+    """
+    rng = np.random.default_rng(seed)
+    names = np.array(["Maruti Swift Dzire VDI", "Hyundai i20 Asta", "Honda City 1.5 V MT", "Toyota Innova 2.5 G",
+                      "Mahindra XUV500 W8", "Tata Nexon XZ", "Skoda Rapid 1.5 TDI", "Ford Figo Aspire"])
+    owners = np.array(["First Owner", "Second Owner", "Third Owner", "Fourth & Above Owner"])
+    return pd.DataFrame({
+        "name": names[rng.integers(0, len(names), n_rows)],
+        "year": rng.integers(1995, 2021, n_rows),
+        "selling_price": rng.integers(30_000, 5_000_000, n_rows),
+        "km_driven": rng.integers(1_000, 300_000, n_rows),
+        "fuel": rng.choice(["Diesel", "Petrol", "CNG", "LPG"], n_rows, p=[0.5, 0.45, 0.03, 0.02]),
+        "seller_type": rng.choice(["Individual", "Dealer", "Trustmark Dealer"], n_rows, p=[0.8, 0.17, 0.03]),
+        "transmission": rng.choice(["Manual", "Automatic"], n_rows, p=[0.87, 0.13]),
+        "owner": owners[rng.integers(0, len(owners), n_rows)],
+        "mileage": np.char.add(rng.uniform(10, 28, n_rows).round(1).astype(str), " kmpl"),
+        "engine": np.char.add(rng.integers(796, 2500, n_rows).astype(str), " CC"),
+        "max_power": np.char.add(rng.uniform(40, 200, n_rows).round(2).astype(str), " bhp"),
+        "seats": rng.choice([4.0, 5.0, 7.0], n_rows),
+    })
+
+
+def pipeline_strategies() -> list[FeatureEngineeringStrategy]:
+    """
+    Fresh instances of the strategy chain ml_pipeline runs in feature_engineering_step.
+    """
+    return [
+        SplitExtractAndDrop(source_column='name', new_column='brand'),
+        ColumnReplacerWithDifference(constant=2025, column='year', new_name='age'),
+        ColumnDropper(columns=['year']),
+        ValueMapper('owner', {'First Owner': 1, 'Second Owner': 2, 'Third Owner': 3}),
+        NumericUnitParser({'mileage': r'kmpl|km/kg', 'engine': r'CC', 'max_power': r'b(h)?p'}),
+        TypeCaster({'seats': 'str'}),
+        LogTransformation(features=['selling_price', 'max_power', 'age']),
+    ]
+
+
+def _count_copies(func, *args) -> tuple:
+    # Deep DataFrame.copy calls made while func runs; the patch only lasts for the call
+    original_copy = pd.DataFrame.copy
+    calls = {"count": 0}
+
+    def counting_copy(self, *copy_args, **copy_kwargs):
+        if copy_kwargs.get("deep", copy_args[0] if copy_args else True):
+            calls["count"] += 1
+        return original_copy(self, *copy_args, **copy_kwargs)
+
+    with mock.patch.object(pd.DataFrame, "copy", counting_copy):
+        start = time.perf_counter()
+        result = func(*args)
+        seconds = time.perf_counter() - start
+    return result, calls["count"], seconds
+
+
+def benchmark_unit_parsing(n_rows: int = 10_000_000):
+    """
+    Compare UnitRemover + TypeCaster with the single-pass NumericUnitParser on the unit columns.
+    """
+    df = synthetic_listings(n_rows)[["mileage", "engine", "max_power"]]
+    patterns = {'mileage': r'(kmpl|km/kg)', 'engine': r'CC', 'max_power': r'b(h)?p'}
+
+    logging.disable(logging.INFO)
+    try:
+        start = time.perf_counter()
+        chained = TypeCaster({col: 'float' for col in patterns}).apply_transformation(
+            UnitRemover(patterns).apply_transformation(df)
+        )
+        chain_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        parsed = NumericUnitParser(patterns).apply_transformation(df)
+        parser_seconds = time.perf_counter() - start
+    finally:
+        logging.disable(logging.NOTSET)
+
+    pd.testing.assert_frame_equal(parsed, chained.astype("float32"))
+    logging.info(f"Unit parsing benchmark on {n_rows:,} rows x {len(patterns)} columns:\n"
+                 f"  UnitRemover + TypeCaster: {chain_seconds:.2f}s, {chained.memory_usage(deep=True).sum() / 1e6:.0f} MB\n"
+                 f"  NumericUnitParser       : {parser_seconds:.2f}s, {parsed.memory_usage(deep=True).sum() / 1e6:.0f} MB")
+
+
+def benchmark_feature_plan(n_rows: int = 10_000_000):
+    """
+    Compare the strategy-by-strategy chain with a compiled FeaturePlan on a synthetic frame.
+    """
+    df = synthetic_listings(n_rows)
+
+    def chained(frame):
+        frame = frame.copy()
+        for strategy in pipeline_strategies():
+            frame = FeatureEngineer(strategy).apply_feature_engineering(frame)
+        return frame
+
+    logging.disable(logging.INFO)
+    try:
+        expected, chain_copies, chain_seconds = _count_copies(chained, df)
+        result, plan_copies, plan_seconds = _count_copies(FeaturePlan(pipeline_strategies()).apply, df)
+    finally:
+        logging.disable(logging.NOTSET)
+
+    pd.testing.assert_frame_equal(result, expected)
+    logging.info(f"FeaturePlan benchmark on {n_rows:,} rows:\n"
+                 f"  chained strategies: {chain_copies} DataFrame copies, {chain_seconds:.2f}s\n"
+                 f"  fused FeaturePlan : {plan_copies} DataFrame copies, {plan_seconds:.2f}s")
+
+
+def benchmark_categorical_encoding(n_rows: int = 10_000_000, fit_rows: int = 200_000):
+    """
+    Compare dense, sparse and ordinal OneHotEncoding: encode time, frame memory and model fit time.
+
+    Parameters:
+    - n_rows (int): Rows encoded.
+    - fit_rows (int): Leading rows used to time a GradientBoostingRegressor fit on each encoding.
+    """
+    from sklearn.ensemble import GradientBoostingRegressor
+
+    from .sklearn_transformers import sparse_frame_to_csr
+
+    features = ['brand', 'fuel', 'seller_type', 'transmission', 'seats']
+    logging.disable(logging.INFO)
+    try:
+        df = FeaturePlan(pipeline_strategies()).apply(synthetic_listings(n_rows))
+        y = df.pop('selling_price').to_numpy()[:fit_rows]
+        df['owner'] = df['owner'].fillna(4)  # 'Fourth & Above Owner' is not in the mapping
+        lines = [f"Categorical encoding benchmark on {n_rows:,} rows, {len(features)} categorical columns:"]
+        for encoding in OneHotEncoding.ENCODINGS:
+            start = time.perf_counter()
+            encoded = OneHotEncoding(features, encoding=encoding).apply_transformation(df)
+            encode_seconds = time.perf_counter() - start
+            megabytes = encoded.memory_usage(deep=True).sum() / 1e6
+
+            head = encoded.iloc[:fit_rows]
+            X = sparse_frame_to_csr(head) if encoding == "sparse" else head.to_numpy(dtype=np.float64)
+            start = time.perf_counter()
+            GradientBoostingRegressor(n_estimators=20, random_state=0).fit(X, y)
+            fit_seconds = time.perf_counter() - start
+            lines.append(f"  {encoding:<7}: {encoded.shape[1]:>3} columns, {megabytes:>7.0f} MB, "
+                         f"encode {encode_seconds:.2f}s, fit on {len(head):,} rows {fit_seconds:.2f}s")
+    finally:
+        logging.disable(logging.NOTSET)
+
+    logging.info("\n".join(lines))
+
+
 if __name__ == "__main__":
-    pass
\ No newline at end of file
+    # Run from the repository root: python -m steps.src.feature_engineering [n_rows]
+    import sys
+
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    benchmark_feature_plan(n_rows)
+    benchmark_unit_parsing(n_rows)
+    benchmark_categorical_encoding(n_rows)
@@ -0,0 +1,185 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import uuid
+
+import numpy as np
+import pandas as pd
+from pyarrow import feather
+
+from .feature_engineering import FeaturePlan
+from .ingest_data import reconcile_frames
+from .step_cache import code_version
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+HASH_COLUMN = "__row_hash__"
+
+
+def row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """
+    Content hash of every row (uint64), independent of the index.
+    """
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+def plan_signature(plan: FeaturePlan, columns) -> str:
+    """
+    Fingerprint of a plan's configuration, its code and its input columns. Memos and fitted
+    attributes (leading or trailing underscore) are not configuration; editing a strategy or a
+    helper it uses changes the code version, so rows engineered by the old code are not reused.
+    """
+    config = [
+        (type(strategy).__name__, sorted(
+            (k, repr(v)) for k, v in vars(strategy).items() if not k.startswith("_") and not k.endswith("_")
+        ))
+        for strategy in plan.strategies
+    ]
+    code = code_version(FeaturePlan, *(type(strategy) for strategy in plan.strategies))
+    payload = json.dumps({"strategies": config, "code": code, "columns": list(columns)}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+# Store of engineered rows keyed by the content hash of their raw input row
+class IncrementalFeatureStore:
+    def __init__(self, store_dir: str = "tmp/feature_store", compression: str = "lz4", max_parts: int = 16):
+        """
+        Keep the engineered output of already-seen rows so that only new or changed rows
+        go through the feature plan on the next run.
+
+        Each plan signature gets its own directory of Feather part files (one appended per run)
+        plus a manifest with the plan state used to build them. Changed rows hash differently,
+        so they are re-engineered; their stale versions are dropped when parts are compacted.
+
+        Parameters:
+        - store_dir (str): Root directory of the store.
+        - compression (str): Feather compression codec ('lz4', 'zstd' or 'uncompressed').
+        - max_parts (int): Once a store holds more part files, it is rewritten as one part
+          containing only the rows of the current input.
+        """
+        self.store_dir = store_dir
+        self.compression = compression
+        self.max_parts = max_parts
+
+    def _manifest_path(self, signature: str) -> str:
+        return os.path.join(self.store_dir, signature, "manifest.json")
+
+    def _load_manifest(self, signature: str) -> dict:
+        path = self._manifest_path(signature)
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return json.load(f)
+
+    def _write_manifest(self, signature: str, manifest: dict):
+        path = self._manifest_path(signature)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, path)
+
+    def _write_part(self, signature: str, frame: pd.DataFrame) -> str:
+        name = f"part-{uuid.uuid4().hex}.feather"
+        path = os.path.join(self.store_dir, signature, name)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        feather.write_feather(frame.reset_index(drop=True), tmp_path, compression=self.compression)
+        os.replace(tmp_path, path)
+        return name
+
+    def _read_parts(self, signature: str, parts: list, wanted: np.ndarray) -> list:
+        frames = []
+        for name in parts:
+            path = os.path.join(self.store_dir, signature, name)
+            frame = feather.read_table(path, memory_map=True).to_pandas()
+            frame = frame[np.isin(frame[HASH_COLUMN].to_numpy(), wanted)]
+            if len(frame):
+                frames.append(frame)
+        return frames
+
+    def _stored_hashes(self, signature: str, parts: list) -> np.ndarray:
+        hashes = [
+            feather.read_table(os.path.join(self.store_dir, signature, name), columns=[HASH_COLUMN])
+            .column(0).to_numpy()
+            for name in parts
+        ]
+        return np.concatenate(hashes) if hashes else np.array([], dtype=np.uint64)
+
+    def transform(
+        self,
+        df: pd.DataFrame,
+        plan: FeaturePlan,
+        feature_state: dict = None,
+        full_rebuild: bool = False,
+    ) -> tuple[pd.DataFrame, dict]:
+        """
+        Engineer df, running the plan only on rows the store has not seen.
+
+        Parameters:
+        - df (pd.DataFrame): Full raw input (history plus appended rows).
+        - plan (FeaturePlan): Plan to run on new rows.
+        - feature_state (dict): Fitted plan state. Defaults to the state the store was built with;
+          a different state invalidates the store.
+        - full_rebuild (bool): Discard the stored rows and refit/rebuild from df.
+
+        Returns:
+        - tuple: (engineered frame in df's row order and index, plan state)
+        """
+        signature = plan_signature(plan, df.columns)
+        store_path = os.path.join(self.store_dir, signature)
+        manifest = None if full_rebuild else self._load_manifest(signature)
+        if manifest is not None and feature_state is not None and manifest["state"] != feature_state:
+            logging.info("Feature state differs from the stored one. Rebuilding the feature store.")
+            manifest = None
+        if manifest is None and os.path.exists(store_path):
+            shutil.rmtree(store_path)
+        os.makedirs(store_path, exist_ok=True)
+
+        hashes = row_hashes(df)
+        parts = manifest["parts"] if manifest is not None else []
+        is_new = ~np.isin(hashes, self._stored_hashes(signature, parts))
+        n_new = int(is_new.sum())
+        logging.info(f"Feature store: {len(df) - n_new} stored row(s) reused, {n_new} new or changed row(s) to engineer.")
+
+        # Stored rows were built with the stored state, so new rows are engineered with it too.
+        state = manifest["state"] if manifest is not None else feature_state
+        new_rows = df[is_new]
+        if state is None:
+            engineered = plan.fit_transform(new_rows)
+            state = plan.get_state()
+        else:
+            engineered = plan.set_state(state).transform(new_rows)
+
+        frames = self._read_parts(signature, parts, hashes[~is_new]) if n_new < len(df) else []
+        if n_new:
+            engineered = engineered.assign(**{HASH_COLUMN: hashes[is_new]})
+            engineered = engineered.drop_duplicates(subset=HASH_COLUMN)
+            parts = parts + [self._write_part(signature, engineered)]
+            frames.append(engineered)
+
+        if not frames:
+            result = plan.transform(df.iloc[:0]).set_index(df.index)
+            combined = result.set_axis(pd.Index(hashes, name=HASH_COLUMN))
+        else:
+            combined = pd.concat(reconcile_frames(frames), ignore_index=True, copy=False)
+            combined = combined.drop_duplicates(subset=HASH_COLUMN).set_index(HASH_COLUMN)
+            result = combined.reindex(hashes)
+            result.index = df.index
+
+        stale = []
+        if len(parts) > self.max_parts:
+            # Rows no longer in the input (e.g. older versions of changed rows) are dropped here.
+            logging.info(f"Compacting feature store {signature} ({len(parts)} parts).")
+            stale, parts = parts, [self._write_part(signature, combined.reset_index())]
+
+        # The manifest only ever lists complete parts; superseded parts go after it is written.
+        self._write_manifest(signature, {"state": state, "parts": parts})
+        for name in stale:
+            os.remove(os.path.join(store_path, name))
+        return result, state
+
+
+if __name__ == "__main__":
+    pass
@@ -1,7 +1,11 @@
 import logging
+import warnings
 from abc import ABC, abstractmethod
+import numpy as np
 import pandas as pd
 
+from .sketches import StreamingStatistics
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
@@ -21,6 +25,88 @@ class MissingValueHandlingStrategy(ABC):
         """
         pass
 
+    def fit(self, df: pd.DataFrame) -> "MissingValueHandlingStrategy":
+        """
+        Learn the statistics used to fill later batches. Stateless strategies have nothing to learn.
+        """
+        return self
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Apply the strategy with fitted statistics. Stateless strategies just handle the batch.
+        """
+        return self.handle(df)
+
+    def get_state(self) -> dict:
+        """
+        Fitted statistics as a JSON-serializable dict (empty for stateless strategies).
+        """
+        return {}
+
+    def set_state(self, state: dict) -> "MissingValueHandlingStrategy":
+        """
+        Restore statistics produced by get_state.
+        """
+        return self
+
+
+def _column_modes(df: pd.DataFrame) -> dict:
+    # Categorical columns: bincount over the existing codes. Others: pandas' hash-table mode.
+    # Ties resolve to the smallest value, like Series.mode().iloc[0].
+    modes = {}
+    for col in df.columns:
+        values = df[col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            codes = values.cat.codes.to_numpy()
+            counts = np.bincount(codes[codes >= 0], minlength=len(values.cat.categories))
+            if counts.any():
+                tied = values.cat.categories[counts == counts.max()]
+                modes[col] = tied.sort_values()[0]
+        else:
+            mode = values.mode(dropna=True)
+            if len(mode):
+                modes[col] = mode.iloc[0]
+    return modes
+
+
+def _column_statistics(df: pd.DataFrame, numeric: str, categorical: str = None) -> dict:
+    # All numeric columns are reduced together as one float64 block in a single pass.
+    numeric_cols = df.select_dtypes(include="number").columns
+    other_cols = df.columns.difference(numeric_cols, sort=False)
+    statistics = {}
+    if len(numeric_cols):
+        if numeric == "mode":
+            statistics.update(_column_modes(df[numeric_cols]))
+        else:
+            reduce = {"mean": np.nanmean, "median": np.nanmedian}[numeric]
+            values = df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+            with np.errstate(invalid="ignore"), warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN columns give NaN, skipped below
+                stats = reduce(values, axis=0)
+            statistics.update({col: stat.item() for col, stat in zip(numeric_cols, stats) if not np.isnan(stat)})
+    if categorical == "mode" and len(other_cols):
+        statistics.update(_column_modes(df[other_cols]))
+    # Plain Python scalars keep the statistics JSON-serializable
+    return {col: value.item() if isinstance(value, np.generic) else value for col, value in statistics.items()}
+
+
+def _fill(df: pd.DataFrame, statistics: dict) -> pd.DataFrame:
+    values = {col: value for col, value in statistics.items() if col in df.columns}
+    # Fill values typed like their column, so e.g. float32 columns are not upcast by fillna
+    values = {
+        col: df[col].dtype.type(value) if isinstance(df[col].dtype, np.dtype) and df[col].dtype.kind == "f" else value
+        for col, value in values.items()
+    }
+    # A categorical column only accepts fill values that are among its categories
+    extended = {
+        col: df[col].cat.add_categories([value])
+        for col, value in values.items()
+        if isinstance(df[col].dtype, pd.CategoricalDtype) and value not in df[col].cat.categories
+    }
+    if extended:
+        df = df.assign(**extended)
+    return df.fillna(value=values)
+
 
 # Strategy: Drop rows or columns with missing values
 class DropMissingValuesStrategy(MissingValueHandlingStrategy):
@@ -60,29 +146,77 @@ class FillMissingValuesStrategy(MissingValueHandlingStrategy):
 
     def handle(self, df: pd.DataFrame) -> pd.DataFrame:
         logging.info(f"Filling missing values using method: {self.method}")
-        df_cleaned = df.copy()
-
-        if self.method == "mean":
-            numeric_cols = df_cleaned.select_dtypes(include="number").columns
-            df_cleaned[numeric_cols] = df_cleaned[numeric_cols].fillna(df[numeric_cols].mean())
 
-        elif self.method == "median":
-            numeric_cols = df_cleaned.select_dtypes(include="number").columns
-            df_cleaned[numeric_cols] = df_cleaned[numeric_cols].fillna(df[numeric_cols].median())
+        if self.method in ("mean", "median"):
+            df_cleaned = _fill(df, _column_statistics(df, numeric=self.method))
 
         elif self.method == "mode":
-            for col in df_cleaned.columns:
-                df_cleaned[col].fillna(df[col].mode().iloc[0], inplace=True)
+            df_cleaned = _fill(df, _column_statistics(df, numeric="mode", categorical="mode"))
 
         elif self.method == "constant":
-            df_cleaned.fillna(self.fill_value, inplace=True)
+            df_cleaned = df.fillna(self.fill_value)
 
         else:
             logging.warning(f"Unknown method '{self.method}'. No values were filled.")
+            df_cleaned = df.copy()
 
         return df_cleaned
 
 
+# Strategy: Fill missing values with statistics fitted once and reused on later batches
+class FittedImputer(MissingValueHandlingStrategy):
+    def __init__(self, numeric: str = "mean", categorical: str = "mode"):
+        """
+        Initialize an imputer whose statistics are learned on training data only.
+
+        Parameters:
+        - numeric (str): Statistic for numeric columns: 'mean', 'median' or 'mode'.
+        - categorical (str): 'mode' to fill non-numeric columns with their most frequent value,
+          or None to leave them untouched.
+        """
+        if numeric not in ("mean", "median", "mode"):
+            raise ValueError(f"Unsupported numeric statistic '{numeric}'.")
+        self.numeric = numeric
+        self.categorical = categorical
+        self.statistics_ = None
+
+    def fit(self, df: pd.DataFrame) -> "FittedImputer":
+        self.statistics_ = _column_statistics(df, numeric=self.numeric, categorical=self.categorical)
+        logging.info(f"Fitted imputation statistics for {len(self.statistics_)} column(s).")
+        return self
+
+    def fit_statistics(self, statistics: StreamingStatistics) -> "FittedImputer":
+        """
+        Fit from statistics streamed over chunks (see sketches.stream_statistics), for data that
+        does not fit in memory. Means are exact; medians carry the quantile sketch's rank error.
+        """
+        if self.numeric == "mode":
+            raise ValueError("numeric='mode' needs exact value counts; stream with 'mean' or 'median'.")
+        numeric = statistics.mean() if self.numeric == "mean" else statistics.quantile(0.5)
+        fills = numeric.dropna().to_dict()
+        if self.categorical == "mode":
+            fills.update(statistics.mode().to_dict())
+        self.statistics_ = {col: value.item() if isinstance(value, np.generic) else value for col, value in fills.items()}
+        logging.info(f"Fitted imputation statistics for {len(self.statistics_)} column(s) from streamed chunks.")
+        return self
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        if self.statistics_ is None:
+            raise RuntimeError("FittedImputer must be fitted before transform.")
+        return _fill(df, self.statistics_)
+
+    def handle(self, df: pd.DataFrame) -> pd.DataFrame:
+        logging.info(f"Fitting imputer (numeric={self.numeric}, categorical={self.categorical}) and filling missing values.")
+        return self.fit(df).transform(df)
+
+    def get_state(self) -> dict:
+        return {"statistics": dict(self.statistics_ or {})}
+
+    def set_state(self, state: dict) -> "FittedImputer":
+        self.statistics_ = dict(state["statistics"])
+        return self
+
+
 # Context class to use a specific missing value handling strategy
 class MissingValueHandler:
     def __init__(self, strategy: MissingValueHandlingStrategy):
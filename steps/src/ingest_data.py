@@ -1,8 +1,227 @@
+import glob
+import hashlib
+import json
+import logging
+import operator
 import os
+import re
+import time
 import zipfile
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Iterator
 
+import numpy as np
 import pandas as pd
+import pyarrow.feather as feather
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+def normalize_column_name(name: str) -> str:
+    """
+    Canonical column name used to reconcile headers across shards ('Selling Price ' -> 'selling_price').
+    """
+    return re.sub(r"[\s\-]+", "_", str(name).strip()).lower()
+
+
+def _csv_members(zip_ref: zipfile.ZipFile) -> list[str]:
+    return [
+        info.filename for info in zip_ref.infolist()
+        if not info.is_dir()
+        and info.filename.endswith(".csv")
+        and not info.filename.startswith("__MACOSX/")
+    ]
+
+
+def _is_pattern(path: str) -> bool:
+    return any(char in path for char in "*?[")
+
+
+def source_files(path: str) -> list[str]:
+    """
+    Resolve a file, directory or glob pattern into the sorted list of .zip/.csv files it covers.
+    """
+    if os.path.isdir(path):
+        files = glob.glob(os.path.join(path, "*.zip")) + glob.glob(os.path.join(path, "*.csv"))
+    elif _is_pattern(path):
+        files = [f for f in glob.glob(path) if f.endswith((".zip", ".csv"))]
+    else:
+        files = [path]
+    return sorted(files)
+
+
+def discover_shards(path: str) -> list[tuple]:
+    """
+    List every CSV shard under a file, directory or glob pattern.
+
+    Returns:
+    - list of (file path, member) tuples; member is None for plain .csv files.
+    """
+    shards = []
+    for file_path in source_files(path):
+        if file_path.endswith(".zip"):
+            with zipfile.ZipFile(file_path, "r") as zip_ref:
+                shards.extend((file_path, member) for member in _csv_members(zip_ref))
+        else:
+            shards.append((file_path, None))
+    return shards
+
+
+def reconcile_frames(frames: list[pd.DataFrame]) -> list[pd.DataFrame]:
+    """
+    Align shards on the union of their columns and on one common dtype per column.
+
+    Categorical columns get the union of all shard categories, mixed numeric columns
+    are promoted (e.g. int + float -> float), and anything else falls back to object.
+    Integer columns missing from some shards become float (missing rows are NaN).
+    Shards already matching the common layout are returned without a copy.
+    """
+    columns = list(dict.fromkeys(col for frame in frames for col in frame.columns))
+
+    targets = {}
+    for col in columns:
+        dtypes = [frame[col].dtype for frame in frames if col in frame.columns]
+        if any(isinstance(dtype, pd.CategoricalDtype) for dtype in dtypes):
+            categories = pd.Index([])
+            for frame in frames:
+                if col in frame.columns:
+                    values = frame[col]
+                    values = values.cat.categories if isinstance(values.dtype, pd.CategoricalDtype) else values.dropna().unique()
+                    categories = categories.append(pd.Index(values).difference(categories))
+            targets[col] = pd.CategoricalDtype(categories)
+        elif all(dtype == dtypes[0] for dtype in dtypes):
+            targets[col] = dtypes[0]
+        elif all(isinstance(dtype, np.dtype) and dtype.kind in "iuf" for dtype in dtypes):
+            targets[col] = np.result_type(*dtypes)
+        else:
+            targets[col] = np.dtype("object")
+        # Shards without the column get NaN, which integer and bool columns cannot hold
+        if len(dtypes) < len(frames) and isinstance(targets[col], np.dtype) and targets[col].kind in "iub":
+            targets[col] = np.result_type(targets[col], np.float64) if targets[col].kind in "iu" else np.dtype("object")
+
+    reconciled = []
+    for frame in frames:
+        if list(frame.columns) != columns:
+            frame = frame.reindex(columns=columns, copy=False)
+        mismatched = {col: dtype for col, dtype in targets.items() if frame[col].dtype != dtype}
+        if mismatched:
+            frame = frame.astype(mismatched, copy=False)
+        reconciled.append(frame)
+    return reconciled
+
+
+def infer_schema(df: pd.DataFrame, max_category_ratio: float = 0.5) -> dict:
+    """
+    Derive a dtype schema from a sample frame.
+
+    Parameters:
+    - df (pd.DataFrame): Sample of the data to ingest.
+    - max_category_ratio (float): String columns with fewer distinct values than this
+      fraction of rows are declared 'category'.
+
+    Returns:
+    - dict: Mapping of column name to 'category', 'integer' or 'float'.
+    """
+    schema = {}
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_integer_dtype(series):
+            schema[col] = "integer"
+        elif pd.api.types.is_float_dtype(series):
+            schema[col] = "float"
+        elif series.nunique(dropna=True) < max_category_ratio * max(len(series), 1):
+            schema[col] = "category"
+    return schema
+
+
+def optimize_dtypes(df: pd.DataFrame, schema: dict) -> pd.DataFrame:
+    """
+    Cast columns to the dtypes declared in a schema.
+
+    Parameters:
+    - df (pd.DataFrame): Frame as parsed by pd.read_csv.
+    - schema (dict): Mapping of column name to 'integer' (narrowest safe integer),
+      'float' (float32) or any pandas dtype string such as 'category'.
+
+    Returns:
+    - pd.DataFrame: Frame with the declared dtypes. Columns missing from the frame are ignored.
+    """
+    df = df.copy(deep=False)
+    for col, kind in schema.items():
+        if col not in df.columns:
+            continue
+        if kind == "integer":
+            df[col] = pd.to_numeric(df[col], downcast="integer")
+        elif kind == "float":
+            df[col] = pd.to_numeric(df[col], downcast="float")
+        else:
+            df[col] = df[col].astype(kind)
+    return df
+
+
+def memory_report(before: pd.DataFrame, after: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compare per-column memory usage of a frame before and after dtype optimization.
+
+    Returns:
+    - pd.DataFrame: One row per column plus a 'TOTAL' row, with dtypes, bytes and savings.
+    """
+    bytes_before = before.memory_usage(index=False, deep=True)
+    bytes_after = after.memory_usage(index=False, deep=True).reindex(bytes_before.index)
+    report = pd.DataFrame({
+        "dtype_before": before.dtypes.astype(str),
+        "dtype_after": after.dtypes.reindex(before.columns).astype(str),
+        "bytes_before": bytes_before,
+        "bytes_after": bytes_after,
+    })
+    report.loc["TOTAL"] = ["", "", bytes_before.sum(), bytes_after.sum()]
+    report["saved_pct"] = (100 * (1 - report["bytes_after"] / report["bytes_before"])).round(1)
+    return report
+
+
+_COMPARISONS = {
+    ">=": operator.ge,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    "<": operator.lt,
+}
+_COMPARISON_FILTER = re.compile(r"^\s*([\w.]+)\s*(>=|<=|==|!=|>|<)\s*(.+?)\s*$")
+_NULL_FILTER = re.compile(r"^\s*([\w.]+)\s+(is\s+null|not\s+null|is\s+not\s+null)\s*$", re.IGNORECASE)
+
+
+def parse_row_filter(expression: str):
+    """
+    Parse a simple row predicate such as 'year >= 2000', "fuel == 'Diesel'" or 'seats not null'.
+
+    Returns:
+    - Tuple of (column name, callable mapping a DataFrame to a boolean mask).
+    """
+    match = _NULL_FILTER.match(expression)
+    if match:
+        column, check = match.group(1), match.group(2).lower()
+        if check == "is null":
+            return column, lambda df: df[column].isna()
+        return column, lambda df: df[column].notna()
+
+    match = _COMPARISON_FILTER.match(expression)
+    if not match:
+        raise ValueError(f"Unsupported row filter '{expression}'.")
+
+    column, op, raw_value = match.groups()
+    if raw_value[:1] in ("'", '"') and raw_value[-1:] == raw_value[:1]:
+        value = raw_value[1:-1]
+    else:
+        try:
+            value = float(raw_value)
+        except ValueError:
+            value = raw_value
+    compare = _COMPARISONS[op]
+    return column, lambda df: compare(df[column], value)
 
 
 # Base class for data ingestion strategies
@@ -20,47 +239,409 @@ class DataIngestor(ABC):
         """
         pass
 
+    @abstractmethod
+    def ingest_chunks(self, file_path: str, chunksize: int = 100_000) -> Iterator[pd.DataFrame]:
+        """
+        Ingest data from the specified file path as a stream of DataFrame chunks.
+
+        Parameters:
+        - file_path (str): Path to the input file.
+        - chunksize (int): Number of rows per chunk.
+
+        Returns:
+        - Iterator[pd.DataFrame]: Chunks of the loaded data.
+        """
+        pass
 
-# Strategy: Ingest from ZIP file containing one CSV
+
+# Strategy: Stream a CSV member straight out of a ZIP file
 class ZipDataIngestor(DataIngestor):
+    def __init__(
+        self,
+        member: str = None,
+        schema=None,
+        dtype_backend: str = None,
+        columns: list[str] = None,
+        filters: list[str] = None,
+        normalize_columns: bool = False,
+        **read_csv_kwargs,
+    ):
+        """
+        Read a CSV member through ZipFile.open, without extracting the archive to disk.
+
+        Parameters:
+        - member (str): Name of the CSV member to read. Required when the archive holds several CSVs.
+        - schema (dict | str): Column dtype schema applied after parsing (see optimize_dtypes),
+          or 'auto' to infer one with infer_schema.
+        - dtype_backend (str): Passed to pd.read_csv, e.g. 'pyarrow' for Arrow-backed dtypes.
+        - columns (list[str]): Projection; only these columns are parsed.
+        - filters (list[str]): Row predicates (see parse_row_filter) applied chunk by chunk while parsing.
+        - normalize_columns (bool): Rename headers with normalize_column_name before projecting and filtering.
+        - read_csv_kwargs: Extra keyword arguments forwarded to pd.read_csv.
+        """
+        self.member = member
+        self.columns = columns
+        self.filters = filters
+        self.normalize_columns = normalize_columns
+        self.schema = schema
+        self.dtype_backend = dtype_backend
+        self.read_csv_kwargs = read_csv_kwargs
+        self.memory_report_ = None
+        # Schema inferred from the first chunk of a chunked read with schema='auto'
+        self.chunk_schema_ = None
+
+    def _resolve_member(self, zip_ref: zipfile.ZipFile) -> str:
+        csv_members = _csv_members(zip_ref)
+
+        if self.member is not None:
+            if self.member not in csv_members:
+                raise FileNotFoundError(f"CSV member '{self.member}' not found in the ZIP archive.")
+            return self.member
+
+        if not csv_members:
+            raise FileNotFoundError("No CSV file found in the ZIP archive.")
+        if len(csv_members) > 1:
+            raise ValueError("Multiple CSV files found. Specify the target file.")
+        return csv_members[0]
+
+    def _read_csv(self, csv_file, predicates: list = (), **kwargs):
+        if self.dtype_backend is not None:
+            kwargs["dtype_backend"] = self.dtype_backend
+        if self.columns is not None:
+            # Filter columns must be parsed even when they are not projected.
+            filter_columns = [column for column, _ in predicates if column not in self.columns]
+            wanted = list(self.columns) + filter_columns
+            if self.normalize_columns:
+                kwargs["usecols"] = lambda name: normalize_column_name(name) in wanted
+            else:
+                kwargs["usecols"] = wanted
+        return pd.read_csv(csv_file, **self.read_csv_kwargs, **kwargs)
+
+    def _normalize(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        if self.normalize_columns:
+            chunk.columns = [normalize_column_name(col) for col in chunk.columns]
+        return chunk
+
+    def _filter_chunk(self, chunk: pd.DataFrame, predicates: list) -> pd.DataFrame:
+        mask = None
+        for _, predicate in predicates:
+            condition = predicate(chunk).fillna(False).to_numpy(dtype=bool)
+            mask = condition if mask is None else mask & condition
+        if mask is not None:
+            chunk = chunk[mask]
+        if self.columns is not None and len(chunk.columns) > len(self.columns):
+            chunk = chunk[[col for col in chunk.columns if col in self.columns]]
+        return chunk
+
+    def _read_filtered(self, csv_file, chunksize: int = 100_000) -> pd.DataFrame:
+        predicates = [parse_row_filter(expression) for expression in self.filters or []]
+        if not predicates:
+            return self._normalize(self._read_csv(csv_file))
+
+        # Rows are filtered chunk by chunk, so rejected rows never accumulate in memory.
+        with self._read_csv(csv_file, predicates, chunksize=chunksize) as reader:
+            chunks = [self._filter_chunk(self._normalize(chunk), predicates) for chunk in reader]
+        df = pd.concat(chunks)
+        logging.info(f"Row filters {self.filters} kept {len(df)} rows.")
+        return df
+
+    def _iter_chunks(self, csv_file, chunksize: int) -> Iterator[pd.DataFrame]:
+        predicates = [parse_row_filter(expression) for expression in self.filters or []]
+        with self._read_csv(csv_file, predicates, chunksize=chunksize) as reader:
+            for chunk in reader:
+                chunk = self._filter_chunk(self._normalize(chunk), predicates)
+                if self.schema == "auto" and self.chunk_schema_ is None and len(chunk):
+                    # Inferred once, so that a column gets the same dtype in every chunk
+                    self.chunk_schema_ = infer_schema(chunk)
+                yield self._apply_schema(chunk, self.chunk_schema_)
+
+    def _apply_schema(self, df: pd.DataFrame, inferred: dict = None) -> pd.DataFrame:
+        if self.schema is None:
+            return df
+        if self.schema == "auto":
+            schema = inferred if inferred is not None else infer_schema(df)
+        else:
+            schema = self.schema
+        return optimize_dtypes(df, schema)
+
     def ingest(self, file_path: str) -> pd.DataFrame:
         if not file_path.endswith(".zip"):
             raise ValueError("Expected a .zip file.")
 
-        extract_dir = "tmp/extracted_data"
-        os.makedirs(extract_dir, exist_ok=True)
+        with zipfile.ZipFile(file_path, "r") as zip_ref:
+            member = self._resolve_member(zip_ref)
+            with zip_ref.open(member) as csv_file:
+                raw = self._read_filtered(csv_file)
+
+        df = self._apply_schema(raw)
+        if df is not raw:
+            self.memory_report_ = memory_report(raw, df)
+            logging.info(f"Ingestion memory report:\n{self.memory_report_.to_string()}")
+        return df
 
+    def ingest_chunks(self, file_path: str, chunksize: int = 100_000) -> Iterator[pd.DataFrame]:
+        if not file_path.endswith(".zip"):
+            raise ValueError("Expected a .zip file.")
+
+        # The archive stays open only while the caller consumes the iterator,
+        # so peak memory is bounded by chunksize rather than by archive size.
+        self.chunk_schema_ = None
         with zipfile.ZipFile(file_path, "r") as zip_ref:
-            zip_ref.extractall(extract_dir)
+            member = self._resolve_member(zip_ref)
+            with zip_ref.open(member) as csv_file:
+                yield from self._iter_chunks(csv_file, chunksize)
 
-        csv_files = [f for f in os.listdir(extract_dir) if f.endswith(".csv")]
 
-        if not csv_files:
-            raise FileNotFoundError("No CSV file found in the ZIP archive.")
-        if len(csv_files) > 1:
-            raise ValueError("Multiple CSV files found. Specify the target file.")
+def _parse_shard(shard: tuple, options: dict) -> tuple:
+    # Runs in a worker process: parse one shard with the shared read options.
+    file_path, member = shard
+    reader = ZipDataIngestor(**options)
+    start = time.perf_counter()
+    if member is None:
+        nbytes = os.path.getsize(file_path)
+        with open(file_path, "rb") as csv_file:
+            df = reader._read_filtered(csv_file)
+    else:
+        with zipfile.ZipFile(file_path, "r") as zip_ref:
+            nbytes = zip_ref.getinfo(member).file_size
+            with zip_ref.open(member) as csv_file:
+                df = reader._read_filtered(csv_file)
+    df = reader._apply_schema(df)
+    seconds = time.perf_counter() - start
+
+    name = file_path if member is None else f"{file_path}::{member}"
+    stats = {
+        "shard": name,
+        "rows": len(df),
+        "mbytes": nbytes / 1e6,
+        "seconds": seconds,
+        "mb_per_s": nbytes / 1e6 / seconds if seconds else float("inf"),
+        "rows_per_s": len(df) / seconds if seconds else float("inf"),
+    }
+    return df, stats
 
-        csv_path = os.path.join(extract_dir, csv_files[0])
-        df = pd.read_csv(csv_path)
+
+# Strategy: Parse every CSV shard of a directory or glob in parallel
+class MultiFileDataIngestor(DataIngestor):
+    def __init__(self, max_workers: int = None, **options):
+        """
+        Ingest all CSV members of all ZIP/CSV files under a directory or glob pattern.
+
+        Parameters:
+        - max_workers (int): Size of the process pool parsing the shards (None = CPU count).
+        - options: Read options shared by every shard (schema, columns, filters, dtype_backend, ...),
+          as accepted by ZipDataIngestor. Headers are normalized with normalize_column_name.
+        """
+        options.setdefault("normalize_columns", True)
+        self.max_workers = max_workers
+        self.options = options
+        self.shard_report_ = None
+
+    def ingest(self, file_path: str) -> pd.DataFrame:
+        shards = discover_shards(file_path)
+        if not shards:
+            raise FileNotFoundError(f"No CSV shards found under '{file_path}'.")
+
+        logging.info(f"Parsing {len(shards)} CSV shard(s) from '{file_path}'.")
+        if len(shards) == 1 or self.max_workers == 1:
+            results = [_parse_shard(shard, self.options) for shard in shards]
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                results = list(executor.map(_parse_shard, shards, repeat(self.options)))
+
+        frames = reconcile_frames([df for df, _ in results])
+        self.shard_report_ = pd.DataFrame([stats for _, stats in results]).round(3)
+        logging.info(f"Shard parse throughput:\n{self.shard_report_.to_string(index=False)}")
+
+        return pd.concat(frames, ignore_index=True, copy=False)
+
+    def ingest_chunks(self, file_path: str, chunksize: int = 100_000) -> Iterator[pd.DataFrame]:
+        # Shards are streamed one after another through one reader, so a schema inferred from the
+        # first chunk applies to every shard. Integer widths may still differ (see reconcile_frames).
+        reader = ZipDataIngestor(**self.options)
+        for path, member in discover_shards(file_path):
+            if member is None:
+                with open(path, "rb") as csv_file:
+                    yield from reader._iter_chunks(csv_file, chunksize)
+            else:
+                with zipfile.ZipFile(path, "r") as zip_ref, zip_ref.open(member) as csv_file:
+                    yield from reader._iter_chunks(csv_file, chunksize)
+
+
+# Strategy: Serve repeated ingestions from a content-addressed columnar cache
+class CachedDataIngestor(DataIngestor):
+    def __init__(
+        self,
+        ingestor: DataIngestor,
+        cache_dir: str = "tmp/ingestion_cache",
+        max_cache_bytes: int = 2 * 1024 ** 3,
+        compression: str = "uncompressed",
+    ):
+        """
+        Wrap another ingestor and keep its parsed output as Feather files keyed by source content.
+
+        Parameters:
+        - ingestor (DataIngestor): Ingestor used on a cache miss.
+        - cache_dir (str): Directory holding the cached Feather files.
+        - max_cache_bytes (int): Size limit of the cache; least recently used files are evicted first.
+        - compression (str): Feather compression codec ('uncompressed', 'lz4' or 'zstd'). Uncompressed
+          files are memory-mapped on a cache hit, so Arrow buffers are used in place without parsing
+          or an extra read copy; 'lz4' and 'zstd' files are smaller on disk but fully decompressed
+          into memory on every read.
+        """
+        self._ingestor = ingestor
+        self.cache_dir = cache_dir
+        self.max_cache_bytes = max_cache_bytes
+        self.compression = compression
+
+    def _content_hash(self, file_path: str, stat: os.stat_result) -> str:
+        # The content hash is remembered per (path, size, mtime), so an unchanged
+        # archive is not re-read just to be fingerprinted.
+        index_path = os.path.join(self.cache_dir, "fingerprints.json")
+        index = {}
+        if os.path.exists(index_path):
+            with open(index_path) as f:
+                index = json.load(f)
+
+        stat_key = f"{os.path.abspath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+        if stat_key in index:
+            return index[stat_key]
+
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        index[stat_key] = digest.hexdigest()
+
+        tmp_path = f"{index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(index, f)
+        os.replace(tmp_path, index_path)
+        return index[stat_key]
+
+    def _cache_key(self, file_path: str) -> str:
+        # Directories and glob patterns are fingerprinted file by file.
+        fingerprints = []
+        for path in source_files(file_path):
+            stat = os.stat(path)
+            fingerprints.append(f"{self._content_hash(path, stat)}|{stat.st_size}")
+        if not fingerprints:
+            raise FileNotFoundError(f"No source files found under '{file_path}'.")
+        content_hash = ",".join(fingerprints)
+        # The wrapped ingestor's configuration is part of the key, so a different
+        # member or read option never serves a stale frame. Fitted attributes
+        # (trailing underscore) are run results, not configuration.
+        settings = sorted((k, v) for k, v in vars(self._ingestor).items() if not k.endswith("_"))
+        config = f"{type(self._ingestor).__name__}|{settings!r}"
+        return hashlib.sha256(f"{content_hash}|{config}".encode()).hexdigest()[:32]
+
+    def _evict(self, keep: str):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".feather"):
+                path = os.path.join(self.cache_dir, name)
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_cache_bytes:
+                break
+            if path == keep:
+                continue
+            logging.info(f"Evicting cached dataset: {path}")
+            os.remove(path)
+            total -= size
+
+    def ingest(self, file_path: str) -> pd.DataFrame:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        cache_path = os.path.join(self.cache_dir, f"{self._cache_key(file_path)}.feather")
+
+        if os.path.exists(cache_path):
+            logging.info(f"Ingestion cache hit: {cache_path}")
+            os.utime(cache_path)  # mark as recently used for LRU eviction
+            # Memory mapping only saves work for uncompressed files; compressed buffers are decompressed here
+            return feather.read_table(cache_path, memory_map=True).to_pandas()
+
+        logging.info(f"Ingestion cache miss for '{file_path}'. Parsing source.")
+        df = self._ingestor.ingest(file_path)
+
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            feather.write_feather(df, tmp_path, compression=self.compression)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logging.warning(f"Could not cache ingested data: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return df
+
+        self._evict(keep=cache_path)
         return df
 
+    def ingest_chunks(self, file_path: str, chunksize: int = 100_000) -> Iterator[pd.DataFrame]:
+        return self._ingestor.ingest_chunks(file_path, chunksize=chunksize)
+
 
 # Factory to return the appropriate DataIngestor
 class DataIngestorFactory:
     @staticmethod
-    def get_data_ingestor(file_extension: str) -> DataIngestor:
+    def get_data_ingestor(
+        file_extension: str,
+        cache_dir: str = None,
+        max_cache_bytes: int = 2 * 1024 ** 3,
+        **options,
+    ) -> DataIngestor:
         """
         Get the right DataIngestor based on file type.
 
         Parameters:
         - file_extension (str): Extension like '.zip', '.csv', etc.
+        - cache_dir (str): If set, wrap the ingestor in a CachedDataIngestor using this directory.
+        - max_cache_bytes (int): Size limit of the ingestion cache.
+        - options: Keyword arguments forwarded to the ingestor (e.g. member='data.csv').
 
         Returns:
         - DataIngestor instance.
         """
         if file_extension == ".zip":
-            return ZipDataIngestor()
-        raise ValueError(f"No ingestor implemented for '{file_extension}' files.")
+            ingestor = ZipDataIngestor(**options)
+        else:
+            raise ValueError(f"No ingestor implemented for '{file_extension}' files.")
+
+        if cache_dir is not None:
+            return CachedDataIngestor(ingestor, cache_dir=cache_dir, max_cache_bytes=max_cache_bytes)
+        return ingestor
+
+    @staticmethod
+    def get_data_ingestor_for_path(
+        file_path: str,
+        cache_dir: str = None,
+        max_cache_bytes: int = 2 * 1024 ** 3,
+        **options,
+    ) -> DataIngestor:
+        """
+        Get the right DataIngestor for a path: a single file, a directory of shards or a glob pattern.
+
+        Parameters:
+        - file_path (str): File, directory or glob pattern (e.g. 'data/daily/*.zip').
+        - cache_dir (str): If set, wrap the ingestor in a CachedDataIngestor using this directory.
+        - max_cache_bytes (int): Size limit of the ingestion cache.
+        - options: Keyword arguments forwarded to the ingestor.
+
+        Returns:
+        - DataIngestor instance.
+        """
+        if not (os.path.isdir(file_path) or _is_pattern(file_path)):
+            return DataIngestorFactory.get_data_ingestor(
+                os.path.splitext(file_path)[1], cache_dir=cache_dir, max_cache_bytes=max_cache_bytes, **options
+            )
+
+        options.pop("member", None)
+        ingestor = MultiFileDataIngestor(**options)
+        if cache_dir is not None:
+            return CachedDataIngestor(ingestor, cache_dir=cache_dir, max_cache_bytes=max_cache_bytes)
+        return ingestor
 
 
 
@@ -1,12 +1,29 @@
 import logging
+import math
+import multiprocessing
+import os
+import time
 from abc import ABC, abstractmethod
-from typing import Any
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator
 
+import numpy as np
 import pandas as pd
-from sklearn.base import RegressorMixin
-from sklearn.linear_model import LinearRegression
+from sklearn.base import RegressorMixin, clone
+from sklearn.compose import ColumnTransformer
+from sklearn.ensemble import GradientBoostingRegressor, HistGradientBoostingRegressor
+from sklearn.impute import SimpleImputer
+from sklearn.linear_model import LinearRegression, SGDRegressor
+from sklearn.metrics import r2_score
+from sklearn.model_selection import ParameterGrid, ParameterSampler
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import StandardScaler
+from sklearn.preprocessing import OneHotEncoder, OrdinalEncoder, StandardScaler
+
+from .feature_engineering import FeaturePlan
+from .ingest_data import DataIngestor, ZipDataIngestor
+from .model_evaluator import ModelEvaluator, RegressionModelEvaluationStrategy
+from .preprocessing import PreprocessedData
+from .sklearn_transformers import HashedFeatureEncoder, SparseFrameToCSR, SparseMaxAbsScaler
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -14,6 +31,9 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(
 
 # Abstract interface for any model building strategy
 class ModelBuildingStrategy(ABC):
+    # Whether build_regressor() can be fitted on a sparse (CSR) matrix
+    accepts_sparse = True
+
     @abstractmethod
     def build_and_train_model(self, X_train: pd.DataFrame, y_train: pd.Series) -> RegressorMixin:
         """
@@ -28,6 +48,34 @@ class ModelBuildingStrategy(ABC):
         """
         pass
 
+    @abstractmethod
+    def build_regressor(self) -> RegressorMixin:
+        """
+        Unfitted final estimator of this strategy, for training on an already preprocessed matrix
+        (see ModelBakeoff).
+        """
+        pass
+
+    def check_matrix(self, data: PreprocessedData):
+        """
+        Raise a ValueError if build_regressor() cannot be fitted on data's matrix type.
+        """
+        if data.is_sparse and not self.accepts_sparse:
+            raise ValueError(f"{type(self).__name__} cannot be trained on a sparse matrix. "
+                             f"Preprocess with categorical_encoding='ordinal' or 'dense'.")
+
+    def train_on_matrix(self, data: PreprocessedData) -> Pipeline:
+        """
+        Fit build_regressor() on an already preprocessed train matrix.
+
+        Returns:
+        - Pipeline with the shared (already fitted) 'preprocessor' and the fitted 'model'
+        """
+        self.check_matrix(data)
+        logging.info(f"Training {type(self).__name__} on the shared {data.X_train.shape} matrix...")
+        model = self.build_regressor().fit(data.X_train, data.y_train.to_numpy())
+        return Pipeline(steps=[("preprocessor", data.preprocessor), ("model", model)])
+
 
 # Concrete strategy: Linear Regression with standard scaling
 class LinearRegressionStrategy(ModelBuildingStrategy):
@@ -50,6 +98,679 @@ class LinearRegressionStrategy(ModelBuildingStrategy):
 
         return model_pipeline
 
+    def build_regressor(self) -> LinearRegression:
+        # No scaler: scaling without centering (the only option that keeps a sparse matrix sparse)
+        # blows up rare one-hot columns
+        return LinearRegression()
+
+
+def build_regression_pipeline(
+    X: pd.DataFrame, categorical_encoding: str = "sparse", regressor: RegressorMixin = None
+) -> Pipeline:
+    """
+    Unfitted preprocessing + regressor pipeline for the columns of X.
+
+    Parameters:
+    - X: Feature frame the pipeline will be fitted on (only its dtypes are used).
+    - categorical_encoding: 'sparse' (one-hot, CSR all the way into the model), 'dense' (one-hot,
+      dense float64 matrix) or 'ordinal' (one integer code per column, for tree models).
+    - regressor: Final estimator (default: GradientBoostingRegressor()).
+
+    Returns:
+    - Pipeline with 'preprocessor' and 'model' steps
+    """
+    # Column selection; SparseDtype columns (e.g. from OneHotEncoding(encoding="sparse")) bypass imputation
+    sparse_cols = [col for col, dtype in X.dtypes.items() if isinstance(dtype, pd.SparseDtype)]
+    cat_cols = X.select_dtypes(include=["object", "category"]).columns
+    num_cols = X.select_dtypes(exclude=["object", "category"]).columns.difference(sparse_cols, sort=False)
+
+    logging.info(f"Categorical columns: {cat_cols.tolist()}")
+    logging.info(f"Numerical columns: {num_cols.tolist()}")
+
+    # Preprocessing pipelines
+    num_transformer = SimpleImputer(strategy="mean")
+    if categorical_encoding == "ordinal":
+        encoder = OrdinalEncoder(handle_unknown="use_encoded_value", unknown_value=-1)
+    elif categorical_encoding in ("sparse", "dense"):
+        encoder = OneHotEncoder(handle_unknown="ignore", sparse_output=categorical_encoding == "sparse")
+    else:
+        raise ValueError(f"Unknown categorical_encoding '{categorical_encoding}'.")
+    cat_transformer = Pipeline(steps=[
+        ("imputer", SimpleImputer(strategy="most_frequent")),
+        ("onehot", encoder)
+    ])
+
+    transformers = [
+        ("num", num_transformer, num_cols),
+        ("cat", cat_transformer, cat_cols),
+    ]
+    if sparse_cols:
+        logging.info(f"Sparse columns passed through as CSR: {len(sparse_cols)}")
+        transformers.append(("sparse", SparseFrameToCSR(), sparse_cols))
+
+    # sparse_threshold=1.0 keeps the stacked output CSR whenever any block is sparse
+    preprocessor = ColumnTransformer(
+        transformers=transformers,
+        sparse_threshold=1.0 if categorical_encoding == "sparse" else 0.0,
+    )
+
+    return Pipeline(steps=[
+        ("preprocessor", preprocessor),
+        ("model", regressor if regressor is not None else GradientBoostingRegressor())
+    ])
+
+
+# Concrete strategy: the default preprocessing + GradientBoostingRegressor pipeline
+class GradientBoostingStrategy(ModelBuildingStrategy):
+    def __init__(self, categorical_encoding: str = "sparse", **params):
+        """
+        Parameters:
+        - categorical_encoding (str): See build_regression_pipeline.
+        - params: GradientBoostingRegressor hyperparameters.
+        """
+        self.categorical_encoding = categorical_encoding
+        self.params = params
+
+    def build_and_train_model(self, X_train: pd.DataFrame, y_train: pd.Series) -> Pipeline:
+        pipeline = build_regression_pipeline(
+            X_train, categorical_encoding=self.categorical_encoding, regressor=GradientBoostingRegressor(**self.params)
+        )
+        logging.info("Training GB Regression pipeline...")
+        pipeline.fit(X_train, y_train)
+        logging.info("Training completed.")
+        return pipeline
+
+    def build_regressor(self) -> GradientBoostingRegressor:
+        return GradientBoostingRegressor(**self.params)
+
+
+def _native_categorical_mask(preprocessor, n_features: int) -> np.ndarray:
+    """
+    Output columns of a build_regression_pipeline preprocessor that hold ordinal category codes
+    HistGradientBoostingRegressor can treat as native categorical features (at most 255 levels).
+    Unknown categories are encoded as -1, which the model routes as missing.
+    """
+    mask = np.zeros(n_features, dtype=bool)
+    cat = getattr(preprocessor, "named_transformers_", {}).get("cat")
+    encoder = cat.steps[-1][1] if isinstance(cat, Pipeline) else cat
+    if isinstance(encoder, OrdinalEncoder):
+        columns = np.arange(n_features)[preprocessor.output_indices_["cat"]]
+        mask[columns] = [len(categories) <= 255 for categories in encoder.categories_]
+    return mask
+
+
+# Concrete strategy: HistGradientBoostingRegressor on native categorical features
+class HistGradientBoostingStrategy(ModelBuildingStrategy):
+    accepts_sparse = False
+
+    def __init__(
+        self,
+        max_iter: int = 1000,
+        learning_rate: float = 0.1,
+        max_leaf_nodes: int = 31,
+        early_stopping: bool = True,
+        validation_fraction: float = 0.1,
+        n_iter_no_change: int = 20,
+        random_state: int = 0,
+    ):
+        """
+        Categorical columns are ordinal-encoded and handed to the model as native categorical
+        features (no one-hot). Missing values are handled by the model, so there is no imputer.
+        Histograms are built on all cores (OpenMP), and training stops once the held-out
+        validation score has not improved for n_iter_no_change iterations.
+
+        Parameters:
+        - max_iter (int): Upper bound on boosting iterations.
+        - learning_rate (float): Shrinkage.
+        - max_leaf_nodes (int): Leaves per tree.
+        - early_stopping (bool): Stop on the validation score.
+        - validation_fraction (float): Share of training rows held out for early stopping.
+        - n_iter_no_change (int): Patience of early stopping.
+        - random_state (int): Seed of the validation split.
+        """
+        self.max_iter = max_iter
+        self.learning_rate = learning_rate
+        self.max_leaf_nodes = max_leaf_nodes
+        self.early_stopping = early_stopping
+        self.validation_fraction = validation_fraction
+        self.n_iter_no_change = n_iter_no_change
+        self.random_state = random_state
+
+    def build_pipeline(self, X: pd.DataFrame) -> Pipeline:
+        cat_cols = list(X.select_dtypes(include=["object", "category"]).columns)
+        num_cols = [col for col in X.columns if col not in cat_cols]
+        # Native categorical support is limited to max_bins (255) levels; wider columns stay ordinal numbers.
+        native = [X[col].nunique() <= 255 for col in cat_cols]
+        if not all(native):
+            logging.warning(f"Treating high-cardinality columns as ordinal: {[c for c, n in zip(cat_cols, native) if not n]}")
+
+        preprocessor = ColumnTransformer(transformers=[
+            ("num", "passthrough", num_cols),
+            # Unknown and missing categories both become NaN, which the model routes as missing
+            ("cat", OrdinalEncoder(handle_unknown="use_encoded_value", unknown_value=np.nan, encoded_missing_value=np.nan), cat_cols),
+        ])
+        model = HistGradientBoostingRegressor(
+            max_iter=self.max_iter,
+            learning_rate=self.learning_rate,
+            max_leaf_nodes=self.max_leaf_nodes,
+            early_stopping=self.early_stopping,
+            validation_fraction=self.validation_fraction,
+            n_iter_no_change=self.n_iter_no_change,
+            random_state=self.random_state,
+            categorical_features=np.array([False] * len(num_cols) + native),
+        )
+        return Pipeline(steps=[("preprocessor", preprocessor), ("model", model)])
+
+    def build_and_train_model(self, X_train: pd.DataFrame, y_train: pd.Series) -> Pipeline:
+        if not isinstance(X_train, pd.DataFrame):
+            raise TypeError("Expected X_train to be a pandas DataFrame.")
+        if not isinstance(y_train, pd.Series):
+            raise TypeError("Expected y_train to be a pandas Series.")
+
+        pipeline = self.build_pipeline(X_train)
+        logging.info("Training HistGradientBoosting pipeline...")
+        pipeline.fit(X_train, y_train)
+        logging.info(f"Training completed after {pipeline.named_steps['model'].n_iter_} iterations.")
+        return pipeline
+
+    def train_on_matrix(self, data: PreprocessedData) -> Pipeline:
+        # Ordinal-encoded columns of the shared matrix (categorical_encoding='ordinal') stay native categorical features
+        self.check_matrix(data)
+        mask = _native_categorical_mask(data.preprocessor, data.X_train.shape[1])
+        logging.info(f"Training HistGradientBoosting on the shared {data.X_train.shape} matrix "
+                     f"with {int(mask.sum())} native categorical column(s)...")
+        model = self.build_regressor().set_params(categorical_features=mask if mask.any() else None)
+        model.fit(data.X_train, data.y_train.to_numpy())
+        logging.info(f"Training completed after {model.n_iter_} iterations.")
+        return Pipeline(steps=[("preprocessor", data.preprocessor), ("model", model)])
+
+    def build_regressor(self) -> HistGradientBoostingRegressor:
+        # Without categorical features: on a one-hot matrix every column is numeric
+        return HistGradientBoostingRegressor(
+            max_iter=self.max_iter,
+            learning_rate=self.learning_rate,
+            max_leaf_nodes=self.max_leaf_nodes,
+            early_stopping=self.early_stopping,
+            validation_fraction=self.validation_fraction,
+            n_iter_no_change=self.n_iter_no_change,
+            random_state=self.random_state,
+        )
+
+
+# Default search space of SuccessiveHalvingSearchStrategy (GradientBoostingRegressor hyperparameters)
+DEFAULT_SEARCH_SPACE = {
+    "n_estimators": [100, 300],
+    "learning_rate": [0.05, 0.1, 0.2],
+    "max_depth": [3, 5],
+    "subsample": [0.8, 1.0],
+}
+
+# Preprocessed (fit, validation) matrices of a worker process, set once by _init_worker
+_WORKER_DATA = {}
+
+
+def _init_worker(X_fit, y_fit, X_val, y_val):
+    _WORKER_DATA.update(X_fit=X_fit, y_fit=y_fit, X_val=X_val, y_val=y_val)
+
+
+def _run_trial(estimator: RegressorMixin, params: dict, n_samples: int) -> tuple[float, float]:
+    """
+    Fit a candidate on the first n_samples (pre-shuffled) rows and score it on the validation rows.
+
+    Returns:
+    - tuple: (validation R2, fit seconds)
+    """
+    model = clone(estimator).set_params(**params)
+    start = time.perf_counter()
+    model.fit(_WORKER_DATA["X_fit"][:n_samples], _WORKER_DATA["y_fit"][:n_samples])
+    fit_seconds = time.perf_counter() - start
+    return float(r2_score(_WORKER_DATA["y_val"], model.predict(_WORKER_DATA["X_val"]))), fit_seconds
+
+
+def _shutdown_workers(executor: ProcessPoolExecutor, workers: list, terminate: bool = False):
+    """
+    Cancel queued tasks and stop the worker processes. Running fits cannot be interrupted, so with
+    terminate=True (time budget exhausted, error) their workers are killed instead of left running.
+
+    Parameters:
+    - executor (ProcessPoolExecutor): Executor of the search.
+    - workers (list): Its worker processes (see _new_children).
+    - terminate (bool): Kill workers that are still running a trial.
+    """
+    executor.shutdown(wait=not terminate, cancel_futures=True)
+    if terminate:
+        for process in workers:
+            process.terminate()
+        for process in workers:
+            process.join()
+
+
+def _new_children(known: set) -> list:
+    # Child processes started since known was taken; the executor starts its workers from this thread
+    return [process for process in multiprocessing.active_children() if process not in known]
+
+
+# Concrete strategy: successive-halving hyperparameter search on a shared preprocessed matrix
+class SuccessiveHalvingSearchStrategy(ModelBuildingStrategy):
+    def __init__(
+        self,
+        search_space: dict = None,
+        estimator: RegressorMixin = None,
+        categorical_encoding: str = "sparse",
+        n_candidates: int = None,
+        factor: int = 3,
+        min_resources: int = None,
+        validation_fraction: float = 0.2,
+        time_budget: float = None,
+        max_workers: int = None,
+        random_state: int = 0,
+    ):
+        """
+        Successive halving over a declared search space: every candidate is trained on a small
+        sample of the training rows, the best 1/factor advance to the next rung with factor times
+        more rows, until one candidate is left or all rows are used. The winner is refitted on all
+        training rows.
+
+        The preprocessor is fitted once and the resulting matrix is shipped once to each worker
+        process; trials only slice it. Workers are spawned rather than forked so they do not
+        inherit MLflow autologging from the caller. Every trial is recorded in trials_.
+
+        Parameters:
+        - search_space (dict): Parameter name -> list of values (or scipy distribution when
+          n_candidates is set). Defaults to DEFAULT_SEARCH_SPACE.
+        - estimator: Unfitted regressor the candidates are cloned from
+          (default: GradientBoostingRegressor(random_state=random_state)).
+        - categorical_encoding (str): See build_regression_pipeline.
+        - n_candidates (int): Sample this many candidates instead of the full grid.
+        - factor (int): Halving rate (candidates kept and resource growth per rung).
+        - min_resources (int): Training rows of the first rung (default: chosen so the last rung uses all rows).
+        - validation_fraction (float): Share of training rows held out for scoring trials.
+        - time_budget (float): Wall-clock seconds for the search. Once exceeded, queued trials are
+          cancelled and the best candidate of the last fully completed rung is refitted; trials
+          that finished in the interrupted rung are recorded but not compared against it. If the
+          first rung did not complete, the best of its finished trials is used (the first
+          candidate if none finished). Workers still running a trial are terminated.
+        - max_workers (int): Worker processes (default: os.cpu_count()).
+        - random_state (int): Seed of candidate sampling and row shuffling.
+        """
+        if factor < 2:
+            raise ValueError(f"factor must be at least 2, got {factor}.")
+        self.search_space = search_space if search_space is not None else DEFAULT_SEARCH_SPACE
+        self.estimator = estimator if estimator is not None else GradientBoostingRegressor(random_state=random_state)
+        self.categorical_encoding = categorical_encoding
+        self.n_candidates = n_candidates
+        self.factor = factor
+        self.min_resources = min_resources
+        self.validation_fraction = validation_fraction
+        self.time_budget = time_budget
+        self.max_workers = max_workers
+        self.random_state = random_state
+
+    def _candidates(self) -> list:
+        if self.n_candidates is None:
+            return list(ParameterGrid(self.search_space))
+        return list(ParameterSampler(self.search_space, self.n_candidates, random_state=self.random_state))
+
+    def _n_rungs(self, n_candidates: int) -> int:
+        # Rungs until one candidate is left, counted on integers (a float log can round up to an extra rung)
+        n_rungs = 0
+        while n_candidates > 1:
+            n_candidates = math.ceil(n_candidates / self.factor)
+            n_rungs += 1
+        return n_rungs
+
+    def _run_rung(self, executor, candidates, n_samples, rung, deadline) -> list:
+        futures = {executor.submit(_run_trial, self.estimator, params, n_samples): params for params in candidates}
+        pending = set(futures)
+        while pending:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                break
+
+        results = []
+        for future, params in futures.items():
+            trial = {"trial": len(self.trials_), "rung": rung, "n_samples": n_samples, "params": params}
+            if future.done() and not future.cancelled():
+                score, fit_seconds = future.result()
+                trial.update(status="completed", score=score, fit_seconds=fit_seconds)
+                results.append((score, params))
+            else:
+                future.cancel()
+                trial.update(status="cancelled", score=None, fit_seconds=None)
+            self.trials_.append(trial)
+        return results
+
+    def build_and_train_model(self, X_train: pd.DataFrame, y_train: pd.Series) -> Pipeline:
+        if not isinstance(X_train, pd.DataFrame):
+            raise TypeError("Expected X_train to be a pandas DataFrame.")
+        if not isinstance(y_train, pd.Series):
+            raise TypeError("Expected y_train to be a pandas Series.")
+
+        preprocessor = build_regression_pipeline(X_train, self.categorical_encoding).named_steps["preprocessor"]
+        return self.train_on_matrix(PreprocessedData.fit(preprocessor, X_train, y_train))
+
+    def train_on_matrix(self, data: PreprocessedData) -> Pipeline:
+        self.check_matrix(data)
+        start = time.monotonic()
+        deadline = None if self.time_budget is None else start + self.time_budget
+        X, y = data.X_train, data.y_train.to_numpy()
+
+        # Shuffle once so that every rung trains on a prefix of the same row order
+        order = np.random.default_rng(self.random_state).permutation(len(y))
+        n_val = int(len(y) * self.validation_fraction)
+        val_rows, fit_rows = order[:n_val], order[n_val:]
+        X_fit, y_fit, X_val, y_val = X[fit_rows], y[fit_rows], X[val_rows], y[val_rows]
+
+        candidates = self._candidates()
+        # The last rung leaves one candidate, which is refitted on all rows rather than trained in a rung
+        n_rungs = self._n_rungs(len(candidates))
+        n_samples = self.min_resources or max(len(fit_rows) // self.factor ** max(n_rungs - 1, 0), 1)
+        logging.info(f"Successive halving over {len(candidates)} candidates, {n_rungs} rung(s), "
+                     f"{n_samples}-{len(fit_rows)} rows per trial.")
+
+        self.trials_ = []
+        best = None
+        if n_rungs:
+            known_children = set(multiprocessing.active_children())
+            executor = ProcessPoolExecutor(
+                max_workers=self.max_workers or os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(X_fit, y_fit, X_val, y_val),
+            )
+            interrupted = True
+            try:
+                for rung in range(n_rungs):
+                    results = self._run_rung(executor, candidates, n_samples, rung, deadline)
+                    results.sort(key=lambda result: result[0], reverse=True)
+                    if len(results) < len(candidates):
+                        logging.warning(f"Search time budget of {self.time_budget}s exhausted in rung {rung} "
+                                        f"after {len(results)} of {len(candidates)} trial(s).")
+                        # Trials that finish first are the cheapest, not the best, so a partial rung
+                        # only decides when no rung completed
+                        if best is None and results:
+                            best = results[0]
+                        break
+                    best = results[0]
+                    logging.info(f"Rung {rung}: {len(results)} trial(s) on {n_samples} rows, best R2 {best[0]:.4f}.")
+                    candidates = [params for _, params in results[:math.ceil(len(results) / self.factor)]]
+                    if len(candidates) == 1 or n_samples >= len(fit_rows):
+                        interrupted = False
+                        break
+                    n_samples = len(fit_rows) if rung + 2 == n_rungs else min(n_samples * self.factor, len(fit_rows))
+            finally:
+                _shutdown_workers(executor, _new_children(known_children), terminate=interrupted)
+
+        if best is None:
+            if n_rungs:
+                logging.warning("No search trial completed within the time budget. Using the first candidate.")
+            self.best_score_, self.best_params_ = None, candidates[0]
+        else:
+            self.best_score_, self.best_params_ = best
+        logging.info(f"Refitting best candidate on all {len(y)} rows: {self.best_params_}")
+        model = self.build_regressor().fit(X, y)
+        self.search_seconds_ = time.monotonic() - start
+        return Pipeline(steps=[("preprocessor", data.preprocessor), ("model", model)])
+
+    def build_regressor(self) -> RegressorMixin:
+        # The best candidate once a search has run, the base estimator before
+        model = clone(self.estimator)
+        return model.set_params(**self.best_params_) if hasattr(self, "best_params_") else model
+
+
+def stream_engineered_chunks(
+    file_path: str, plan: FeaturePlan, chunksize: int = 100_000, ingestor: DataIngestor = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Ingest file_path chunk by chunk and run every chunk through a fitted feature plan.
+
+    Parameters:
+    - file_path (str): Source the ingestor can stream (see DataIngestor.ingest_chunks).
+    - plan (FeaturePlan): Fitted plan (fit_transform on a sample, or set_state with a stored state).
+    - chunksize (int): Rows per chunk.
+    - ingestor (DataIngestor): Defaults to ZipDataIngestor().
+    """
+    ingestor = ingestor if ingestor is not None else ZipDataIngestor()
+    for chunk in ingestor.ingest_chunks(file_path, chunksize=chunksize):
+        yield plan.transform(chunk, copy=False)
+
+
+# Concrete strategy: SGDRegressor trained chunk by chunk, for data that does not fit in memory
+class OutOfCoreSGDStrategy(ModelBuildingStrategy):
+    def __init__(
+        self,
+        n_features: int = 2**16,
+        n_epochs: int = 3,
+        alpha: float = 1e-5,
+        eta0: float = 0.01,
+        chunk_rows: int = 100_000,
+        random_state: int = 0,
+    ):
+        """
+        Linear model over standardized numeric columns and hashed categorical columns. Categorical
+        columns need no fitted vocabulary, and the scaler is fitted incrementally in a first pass,
+        so only one chunk is held in memory at a time.
+
+        Parameters:
+        - n_features (int): Hashed categorical columns (see hash_categoricals).
+        - n_epochs (int): Passes over the stream with partial_fit (rows are shuffled within each chunk).
+        - alpha (float): L2 regularization.
+        - eta0 (float): Initial learning rate (inverse scaling schedule).
+        - chunk_rows (int): Rows per batch when training from an in-memory frame.
+        - random_state (int): Seed of the model and the within-chunk shuffling.
+        """
+        self.n_features = n_features
+        self.n_epochs = n_epochs
+        self.alpha = alpha
+        self.eta0 = eta0
+        self.chunk_rows = chunk_rows
+        self.random_state = random_state
+
+    def _fit_stream(self, make_batches: Callable[[], Iterable[tuple]]) -> Pipeline:
+        encoder, rows, y_sum = None, 0, 0.0
+        for X, y in make_batches():
+            if encoder is None:
+                categorical = list(X.select_dtypes(include=["object", "category"]).columns)
+                numeric = [col for col in X.columns if col not in categorical]
+                encoder = HashedFeatureEncoder(numeric, categorical, n_features=self.n_features)
+            encoder.partial_fit(X)
+            rows += len(X)
+            y_sum += float(y.sum())
+        if encoder is None:
+            raise ValueError("Cannot train on an empty chunk stream.")
+        logging.info(f"Fitted scaling on {rows} rows; training SGDRegressor for {self.n_epochs} epoch(s).")
+
+        # SGD starts from a zero intercept, so it trains on the centered target and gets the mean back at the end
+        y_mean = y_sum / rows
+        model = SGDRegressor(alpha=self.alpha, eta0=self.eta0, learning_rate="invscaling", random_state=self.random_state)
+        rng = np.random.default_rng(self.random_state)
+        for epoch in range(self.n_epochs):
+            for X, y in make_batches():
+                order = rng.permutation(len(y))
+                model.partial_fit(encoder.transform(X.iloc[order]), y[order] - y_mean)
+        model.intercept_ += y_mean
+        return Pipeline(steps=[("preprocessor", encoder), ("model", model)])
+
+    def build_and_train_from_chunks(
+        self, make_chunks: Callable[[], Iterable[pd.DataFrame]], target_column: str
+    ) -> Pipeline:
+        """
+        Train on engineered chunks (e.g. from stream_engineered_chunks).
+
+        Parameters:
+        - make_chunks: Zero-argument callable returning a fresh chunk iterator; the stream is read
+          once for scaling and once per epoch. Rows with a missing target are skipped.
+        - target_column (str): Target column of the chunks.
+
+        Returns:
+        - Pipeline with 'preprocessor' (HashedFeatureEncoder) and 'model' steps
+        """
+        def batches():
+            for chunk in make_chunks():
+                chunk = chunk[chunk[target_column].notna()]
+                if len(chunk):
+                    yield chunk.drop(columns=[target_column]), chunk[target_column].to_numpy(dtype=np.float64)
+
+        return self._fit_stream(batches)
+
+    def build_and_train_model(self, X_train: pd.DataFrame, y_train: pd.Series) -> Pipeline:
+        if not isinstance(X_train, pd.DataFrame):
+            raise TypeError("Expected X_train to be a pandas DataFrame.")
+        if not isinstance(y_train, pd.Series):
+            raise TypeError("Expected y_train to be a pandas Series.")
+
+        y = y_train.to_numpy(dtype=np.float64)
+        logging.info("Training SGD Regression pipeline in batches...")
+        return self._fit_stream(lambda: (
+            (X_train.iloc[start:start + self.chunk_rows], y[start:start + self.chunk_rows])
+            for start in range(0, len(y), self.chunk_rows)
+        ))
+
+    def build_regressor(self) -> Pipeline:
+        # In memory, plain fit() runs the epochs and learns the intercept with the coefficients.
+        # Max-abs scaling leaves one-hot columns at 0/1 and brings numeric ones into [-1, 1].
+        return Pipeline([
+            ("scaler", SparseMaxAbsScaler()),
+            ("regressor", SGDRegressor(alpha=self.alpha, eta0=self.eta0, max_iter=1000, random_state=self.random_state)),
+        ])
+
+
+def _run_candidate(estimator: RegressorMixin, latency_repeats: int = 50) -> tuple:
+    """
+    Fit a bake-off candidate on the worker's fit matrix and evaluate it on the validation matrix.
+
+    Returns:
+    - tuple: (evaluation metrics, fit seconds, median single-row predict milliseconds). The fitted
+      estimator stays in the worker; only the winner is refitted, in the parent.
+    """
+    start = time.perf_counter()
+    model = clone(estimator).fit(_WORKER_DATA["X_fit"], _WORKER_DATA["y_fit"])
+    fit_seconds = time.perf_counter() - start
+
+    evaluator = ModelEvaluator(RegressionModelEvaluationStrategy())
+    metrics = evaluator.evaluate(model, _WORKER_DATA["X_val"], _WORKER_DATA["y_val"])
+    row = _WORKER_DATA["X_val"][:1]
+    latencies = []
+    for _ in range(latency_repeats):
+        start = time.perf_counter()
+        model.predict(row)
+        latencies.append(time.perf_counter() - start)
+    return metrics, fit_seconds, float(np.median(latencies) * 1e3)
+
+
+# Trains several strategies side by side on one preprocessed matrix and picks a winner
+class ModelBakeoff:
+    def __init__(
+        self,
+        strategies: dict,
+        categorical_encoding: str = "dense",
+        latency_weight: float = 0.01,
+        validation_fraction: float = 0.2,
+        max_workers: int = None,
+        random_state: int = 0,
+    ):
+        """
+        The preprocessor is fitted once; validation rows are held out from the train matrix, and the
+        fit and validation matrices are shipped once to each worker process. Every candidate fits only
+        its final estimator (build_regressor) on them, all at the same time, and is ranked on its
+        validation score = R2 - latency_weight * single-row predict ms. The winner is refitted on all
+        train rows; the test rows are only used to report its metrics.
+
+        Parameters:
+        - strategies (dict): Candidate name -> ModelBuildingStrategy. Candidates that cannot take a
+          sparse matrix (accepts_sparse) are skipped when the shared matrix is sparse.
+        - categorical_encoding (str): Encoding of the shared matrix (see build_regression_pipeline).
+          'dense' by default, since HistGradientBoostingRegressor does not take sparse input.
+        - latency_weight (float): R2 given up per millisecond of single-row predict latency.
+        - validation_fraction (float): Share of train rows held out for ranking the candidates.
+        - max_workers (int): Worker processes (default: one per candidate, at most os.cpu_count()).
+        - random_state (int): Seed of the validation split.
+        """
+        self.strategies = strategies
+        self.categorical_encoding = categorical_encoding
+        self.latency_weight = latency_weight
+        self.validation_fraction = validation_fraction
+        self.max_workers = max_workers
+        self.random_state = random_state
+
+    def run(
+        self, X_train: pd.DataFrame, y_train: pd.Series, X_test: pd.DataFrame = None, y_test: pd.Series = None
+    ) -> tuple:
+        """
+        Returns:
+        - tuple: (winning pipeline with 'preprocessor' and 'model' steps; report with the winner's
+          name, its test metrics (None without test rows), the wall-clock time, the skipped candidates
+          and one entry per candidate with its validation metrics, best first)
+        """
+        preprocessor = build_regression_pipeline(X_train, self.categorical_encoding).named_steps["preprocessor"]
+        return self.run_on_matrix(PreprocessedData.fit(preprocessor, X_train, y_train, X_test, y_test))
+
+    def run_on_matrix(self, data: PreprocessedData) -> tuple:
+        """
+        run() on already preprocessed train and test matrices; categorical_encoding is not used.
+        """
+        skipped = [name for name, strategy in self.strategies.items() if data.is_sparse and not strategy.accepts_sparse]
+        if skipped:
+            logging.warning(f"Skipping candidates that need a dense matrix: {skipped}. "
+                            f"Use a dense or ordinal categorical encoding to include them.")
+        estimators = {
+            name: strategy.build_regressor() for name, strategy in self.strategies.items() if name not in skipped
+        }
+        if not estimators:
+            raise ValueError(f"None of the candidates {list(self.strategies)} can be trained on a sparse matrix.")
+
+        X, y = data.X_train, data.y_train.to_numpy()
+        order = np.random.default_rng(self.random_state).permutation(len(y))
+        n_val = max(int(len(y) * self.validation_fraction), 1)
+        val_rows, fit_rows = order[:n_val], order[n_val:]
+
+        start = time.perf_counter()
+        executor = ProcessPoolExecutor(
+            max_workers=self.max_workers or min(len(estimators), os.cpu_count()),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(X[fit_rows], y[fit_rows], X[val_rows], y[val_rows]),
+        )
+        with executor:
+            futures = {name: executor.submit(_run_candidate, estimator) for name, estimator in estimators.items()}
+            results = {name: future.result() for name, future in futures.items()}
+        wall_seconds = time.perf_counter() - start
+
+        candidates = [
+            {
+                "name": name,
+                "metrics": metrics,
+                "fit_seconds": fit_seconds,
+                "predict_ms": predict_ms,
+                "score": metrics["R-Squared"] - self.latency_weight * predict_ms,
+            }
+            for name, (metrics, fit_seconds, predict_ms) in results.items()
+        ]
+        candidates.sort(key=lambda candidate: candidate["score"], reverse=True)
+        winner = candidates[0]["name"]
+        logging.info(f"Bake-off of {len(candidates)} candidates took {wall_seconds:.2f}s "
+                     f"(fit times add up to {sum(c['fit_seconds'] for c in candidates):.2f}s). Winner: {winner}")
+        for c in candidates:
+            logging.info(f"  {c['name']:<24} score {c['score']:.4f}, validation R2 {c['metrics']['R-Squared']:.4f}, "
+                         f"fit {c['fit_seconds']:.2f}s, predict {c['predict_ms']:.2f}ms")
+
+        logging.info(f"Refitting {winner} on all {len(y)} train rows.")
+        model = clone(estimators[winner]).fit(X, y)
+        test_metrics = None
+        if data.X_test is not None:
+            test_metrics = ModelEvaluator(RegressionModelEvaluationStrategy()).evaluate(model, data.X_test, data.y_test)
+
+        pipeline = Pipeline(steps=[("preprocessor", data.preprocessor), ("model", model)])
+        report = {
+            "winner": winner,
+            "test_metrics": test_metrics,
+            "wall_seconds": wall_seconds,
+            "skipped": skipped,
+            "candidates": candidates,
+        }
+        return pipeline, report
+
 
 # Context class: uses a model strategy to build and train models
 class ModelBuilder:
@@ -64,6 +785,115 @@ class ModelBuilder:
         logging.info("Starting model training using selected strategy.")
         return self._strategy.build_and_train_model(X_train, y_train)
 
+    def build_model_from_matrix(self, data: PreprocessedData) -> Pipeline:
+        logging.info("Starting model training on the shared preprocessed matrix.")
+        return self._strategy.train_on_matrix(data)
+
+
+def benchmark_model_strategies(file_path: str = "data/archive.zip", repeat: int = 3):
+    """
+    Compare the GradientBoosting and HistGradientBoosting strategies on the car details data:
+    fit time, predict latency (one row and the whole test set) and test accuracy.
+    """
+    from sklearn.metrics import mean_squared_error, r2_score
+    from sklearn.model_selection import train_test_split
+
+    from .feature_engineering import FeaturePlan, pipeline_strategies
+    from .ingest_data import ZipDataIngestor
+
+    logging.disable(logging.WARNING)
+    try:
+        df = FeaturePlan(pipeline_strategies()).apply(ZipDataIngestor().ingest(file_path).dropna())
+        X, y = df.drop(columns=["selling_price"]), df["selling_price"]
+        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=0)
+
+        lines = [f"Model strategy benchmark: {len(X_train):,} train rows, {len(X_test):,} test rows:"]
+        for name, strategy in [("GradientBoosting", GradientBoostingStrategy()), ("HistGradientBoosting", HistGradientBoostingStrategy())]:
+            start = time.perf_counter()
+            model = ModelBuilder(strategy).build_model(X_train, y_train)
+            fit_seconds = time.perf_counter() - start
+
+            row = X_test.iloc[:1]
+            start = time.perf_counter()
+            for _ in range(repeat * 10):
+                model.predict(row)
+            row_ms = (time.perf_counter() - start) / (repeat * 10) * 1e3
+
+            start = time.perf_counter()
+            for _ in range(repeat):
+                y_pred = model.predict(X_test)
+            batch_ms = (time.perf_counter() - start) / repeat * 1e3
+
+            lines.append(f"  {name:<20}: fit {fit_seconds:.2f}s, predict 1 row {row_ms:.2f}ms, "
+                         f"{len(X_test):,} rows {batch_ms:.1f}ms, R2 {r2_score(y_test, y_pred):.4f}, "
+                         f"MSE {mean_squared_error(y_test, y_pred):.4f}")
+    finally:
+        logging.disable(logging.NOTSET)
+
+    logging.info("\n".join(lines))
+
+
+def _out_of_core_run(mode: str, file_path: str, chunksize: int) -> tuple:
+    # One benchmark path in a fresh process, so that its peak RSS is its own. ru_maxrss is
+    # inherited across fork + exec on Linux, so the peak is read from VmHWM instead.
+    from .feature_engineering import pipeline_strategies
+
+    logging.disable(logging.WARNING)
+    start = time.perf_counter()
+    plan, strategy = FeaturePlan(pipeline_strategies()), OutOfCoreSGDStrategy(chunk_rows=chunksize)
+    if mode == "in_memory":
+        df = plan.fit_transform(ZipDataIngestor().ingest(file_path))
+        strategy.build_and_train_model(df.drop(columns=["selling_price"]), df["selling_price"])
+    elif mode == "out_of_core":
+        plan.fit_transform(next(ZipDataIngestor().ingest_chunks(file_path, chunksize=chunksize)))
+        strategy.build_and_train_from_chunks(
+            lambda: stream_engineered_chunks(file_path, plan, chunksize), "selling_price"
+        )
+    seconds = time.perf_counter() - start
+    with open("/proc/self/status") as f:
+        peak_kb = next(int(line.split()[1]) for line in f if line.startswith("VmHWM:"))
+    return seconds, peak_kb / 1024
+
+
+def benchmark_out_of_core(n_rows: int = 2_000_000, chunksize: int = 100_000, file_path: str = "data/archive.zip"):
+    """
+    Train OutOfCoreSGDStrategy on the car details listings replicated to n_rows, once from a fully
+    ingested frame and once from a chunk stream: rows/sec (ingestion and features included) and peak RSS
+    (Linux only).
+    """
+    import tempfile
+
+    logging.disable(logging.WARNING)
+    try:
+        raw = ZipDataIngestor().ingest(file_path)
+    finally:
+        logging.disable(logging.NOTSET)
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "listings.zip")
+        replicated = raw.iloc[np.arange(n_rows) % len(raw)]
+        replicated.to_csv(path, index=False, compression={"method": "zip", "archive_name": "listings.csv"})
+        del replicated
+
+        lines = [f"Out-of-core benchmark: {n_rows:,} rows, chunks of {chunksize:,}, "
+                 f"{OutOfCoreSGDStrategy().n_epochs} epochs:"]
+        baseline_mb = None
+        for mode in ("baseline", "in_memory", "out_of_core"):
+            # A fresh process per path; 'baseline' only measures the imports
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                seconds, peak_mb = executor.submit(_out_of_core_run, mode, path, chunksize).result()
+            if mode == "baseline":
+                baseline_mb = peak_mb
+                lines.append(f"  {'imports only':<12}: peak RSS {peak_mb:,.0f} MB")
+            else:
+                lines.append(f"  {mode:<12}: {seconds:.1f}s, {n_rows / seconds:,.0f} rows/s, "
+                             f"peak RSS {peak_mb:,.0f} MB (+{peak_mb - baseline_mb:,.0f} MB over imports)")
+    logging.info("\n".join(lines))
+
 
 if __name__ == "__main__":
-    pass
+    # Run from the repository root: python -m steps.src.model_building [n_rows]
+    import sys
+
+    benchmark_model_strategies()
+    benchmark_out_of_core(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000)
@@ -6,6 +6,8 @@ import numpy as np
 import pandas as pd
 import seaborn as sns
 
+from .sketches import StreamingStatistics
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
@@ -22,32 +24,167 @@ class OutlierDetectionStrategy(ABC):
         """
         pass
 
+    @abstractmethod
+    def bounds(self, df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Per-column (lower, upper) bounds; values outside them are outliers.
+
+        Returns:
+            tuple: Two float64 arrays aligned with df.columns.
+        """
+        pass
+
 
 # Strategy: Z-score based outlier detection
 class ZScoreOutlierDetection(OutlierDetectionStrategy):
-    def __init__(self, threshold: float = 3.0):
+    def __init__(self, threshold: float = 3.0, statistics: StreamingStatistics = None):
+        """
+        Parameters:
+        - threshold (float): Absolute z-score above which a value is an outlier.
+        - statistics (StreamingStatistics): Mean/std computed over a chunk stream. If given, every
+          frame (or chunk) is scored against them instead of its own mean and std.
+        """
         self.threshold = threshold
+        self.statistics = statistics
 
     def detect_outliers(self, df: pd.DataFrame) -> pd.DataFrame:
         logging.info(f"Detecting outliers using Z-score (threshold={self.threshold})")
-        z_scores = np.abs((df - df.mean()) / df.std())
+        if self.statistics is not None:
+            mean, std = self.statistics.mean().reindex(df.columns), self.statistics.std().reindex(df.columns)
+        else:
+            mean, std = df.mean(), df.std()
+        z_scores = np.abs((df - mean) / std)
         return z_scores > self.threshold
 
+    def bounds(self, df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+        if self.statistics is not None:
+            mean = self.statistics.mean().reindex(df.columns).to_numpy()
+            std = self.statistics.std().reindex(df.columns).to_numpy()
+        else:
+            values = df.to_numpy(dtype=np.float64, na_value=np.nan)
+            mean, std = np.nanmean(values, axis=0), np.nanstd(values, axis=0, ddof=1)
+        return mean - self.threshold * std, mean + self.threshold * std
+
 
 # Strategy: IQR-based outlier detection
 class IQROutlierDetection(OutlierDetectionStrategy):
+    def __init__(self, threshold: float = 1.5, statistics: StreamingStatistics = None):
+        """
+        Parameters:
+        - threshold (float): IQR multiplier; values beyond Q1 - threshold*IQR or Q3 + threshold*IQR are outliers.
+        - statistics (StreamingStatistics): Quantile sketches computed over a chunk stream. If given,
+          Q1/Q3 come from the sketches (rank error: see QuantileSketch) instead of the frame.
+        """
+        self.threshold = threshold
+        self.statistics = statistics
+
     def detect_outliers(self, df: pd.DataFrame) -> pd.DataFrame:
         logging.info("Detecting outliers using IQR method.")
-        Q1 = df.quantile(0.25)
-        Q3 = df.quantile(0.75)
+        if self.statistics is not None:
+            Q1 = self.statistics.quantile(0.25).reindex(df.columns)
+            Q3 = self.statistics.quantile(0.75).reindex(df.columns)
+        else:
+            Q1 = df.quantile(0.25)
+            Q3 = df.quantile(0.75)
         IQR = Q3 - Q1
-        return (df < (Q1 - 1.5 * IQR)) | (df > (Q3 + 1.5 * IQR))
+        return (df < (Q1 - self.threshold * IQR)) | (df > (Q3 + self.threshold * IQR))
+
+    def bounds(self, df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+        if self.statistics is not None:
+            q1 = self.statistics.quantile(0.25).reindex(df.columns).to_numpy()
+            q3 = self.statistics.quantile(0.75).reindex(df.columns).to_numpy()
+        else:
+            q1, q3 = np.nanpercentile(df.to_numpy(dtype=np.float64, na_value=np.nan), [25, 75], axis=0)
+        iqr = q3 - q1
+        return q1 - self.threshold * iqr, q3 + self.threshold * iqr
+
+
+# Fitted per-feature bounds, kept as two aligned float64 arrays
+class FeatureBounds:
+    def __init__(self, columns: list[str], lower, upper):
+        self.columns = list(columns)
+        self.lower = np.asarray(lower, dtype=np.float64)
+        self.upper = np.asarray(upper, dtype=np.float64)
+
+    def to_dict(self) -> dict:
+        """
+        Compact artifact: column names plus a 2 x n_columns [lower, upper] array.
+        """
+        return {"columns": self.columns, "bounds": np.vstack([self.lower, self.upper]).tolist()}
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "FeatureBounds":
+        lower, upper = state["bounds"]
+        return cls(state["columns"], lower, upper)
+
+
+# Vectorized guard that checks batches against fitted bounds
+class BoundsValidator:
+    POLICIES = ("flag", "clip")
+
+    def __init__(self, bounds: FeatureBounds, policy: str = "flag"):
+        """
+        Parameters:
+        - bounds (FeatureBounds): Bounds fitted on training data. Columns absent from a batch are skipped.
+        - policy (str): 'flag' keeps values and only reports them; 'clip' clips them to the bounds.
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown policy '{policy}'. Available: {self.POLICIES}")
+        self.bounds = bounds
+        self.policy = policy
+        # Running totals across batches, for monitoring
+        self.rows_seen_ = 0
+        self.violation_counts_ = dict.fromkeys(bounds.columns, 0)
+
+    def validate(self, df: pd.DataFrame) -> tuple[pd.DataFrame, np.ndarray, dict]:
+        """
+        Check a whole batch with one vectorized comparison.
+
+        Returns:
+        - tuple: (batch, clipped if policy='clip'; boolean rows x checked-columns violation array;
+          violation counts per checked column for this batch)
+        """
+        present = [position for position, col in enumerate(self.bounds.columns) if col in df.columns]
+        columns = [self.bounds.columns[position] for position in present]
+        lower, upper = self.bounds.lower[present], self.bounds.upper[present]
+
+        # Plain numpy columns are read without conversion; only nullable extension columns pay for it
+        values = np.column_stack([
+            df[col].to_numpy() if isinstance(df[col].dtype, np.dtype) else df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            for col in columns
+        ]) if columns else np.empty((len(df), 0))
+        with np.errstate(invalid="ignore"):
+            violations = (values < lower) | (values > upper)
+        counts = dict(zip(columns, violations.sum(axis=0).tolist()))
+
+        self.rows_seen_ += len(df)
+        for col, count in counts.items():
+            self.violation_counts_[col] += count
+
+        if any(counts.values()):
+            violated = {col: count for col, count in counts.items() if count}
+            logging.warning(f"Out-of-bounds values in batch of {len(df)} rows: {violated}")
+            if self.policy == "clip":
+                clipped = np.clip(values, lower, upper)
+                changed = violations.any(axis=0)
+                df = df.assign(**{
+                    col: clipped[:, position].astype(df[col].dtype, copy=False)
+                    for position, col in enumerate(columns) if changed[position]
+                })
+        return df, violations, counts
 
 
 # Context: Outlier detector using a chosen strategy
 class OutlierDetector:
-    def __init__(self, strategy: OutlierDetectionStrategy):
+    def __init__(self, strategy: OutlierDetectionStrategy, statistics: StreamingStatistics = None):
+        """
+        Parameters:
+        - strategy (OutlierDetectionStrategy): Detection strategy.
+        - statistics (StreamingStatistics): If given, method='cap' clips at the sketched 1st/99th
+          percentiles, so chunks of a larger-than-memory dataset are capped consistently.
+        """
         self._strategy = strategy
+        self._statistics = statistics
 
     def set_strategy(self, strategy: OutlierDetectionStrategy):
         logging.info("Outlier detection strategy updated.")
@@ -57,6 +194,14 @@ class OutlierDetector:
         logging.info("Running outlier detection.")
         return self._strategy.detect_outliers(df)
 
+    def export_bounds(self, df: pd.DataFrame) -> FeatureBounds:
+        """
+        Fit the strategy's bounds on the numeric columns of df, for reuse at inference time.
+        """
+        numeric = df.select_dtypes(include="number")
+        lower, upper = self._strategy.bounds(numeric)
+        return FeatureBounds(list(numeric.columns), lower, upper)
+
     def handle_outliers(self, df: pd.DataFrame, method: str = "remove") -> pd.DataFrame:
         outliers = self.detect_outliers(df)
 
@@ -66,8 +211,12 @@ class OutlierDetector:
 
         elif method == "cap":
             logging.info("Capping outliers at 1st and 99th percentiles.")
-            lower = df.quantile(0.01)
-            upper = df.quantile(0.99)
+            if self._statistics is not None:
+                lower = self._statistics.quantile(0.01).reindex(df.columns)
+                upper = self._statistics.quantile(0.99).reindex(df.columns)
+            else:
+                lower = df.quantile(0.01)
+                upper = df.quantile(0.99)
             return df.clip(lower=lower, upper=upper, axis=1)
 
         logging.warning(f"Unknown handling method '{method}'. No changes applied.")
@@ -83,6 +232,69 @@ class OutlierDetector:
         logging.info("Boxplot visualization completed.")
 
 
+# Outlier filter over several columns, each with its own strategy and threshold
+class MultiColumnOutlierFilter:
+    STRATEGIES = {"zscore": ZScoreOutlierDetection, "iqr": IQROutlierDetection}
+
+    def __init__(self, rules: dict, statistics: StreamingStatistics = None):
+        """
+        Parameters:
+        - rules (dict): {column: {"method": "zscore" | "iqr", "threshold": float}}. A bare method
+          name uses that strategy's default threshold (3.0 for zscore, 1.5 for iqr).
+        - statistics (StreamingStatistics): Optional streamed statistics to take the bounds from.
+        """
+        self.rules = rules
+        self.statistics = statistics
+        self.columns = list(rules)
+        self.lower_ = None
+        self.upper_ = None
+
+    def _strategy(self, rule) -> OutlierDetectionStrategy:
+        rule = {"method": rule} if isinstance(rule, str) else dict(rule)
+        method = rule.pop("method", "zscore")
+        if method not in self.STRATEGIES:
+            raise ValueError(f"Unknown outlier method '{method}'. Available: {list(self.STRATEGIES)}")
+        return self.STRATEGIES[method](statistics=self.statistics, **rule)
+
+    def fit(self, df: pd.DataFrame) -> "MultiColumnOutlierFilter":
+        lower, upper = np.empty(len(self.columns)), np.empty(len(self.columns))
+        for position, col in enumerate(self.columns):
+            low, high = self._strategy(self.rules[col]).bounds(df[[col]])
+            lower[position], upper[position] = low[0], high[0]
+        self.lower_, self.upper_ = lower, upper
+        return self
+
+    def export_bounds(self) -> FeatureBounds:
+        if self.lower_ is None:
+            raise RuntimeError("MultiColumnOutlierFilter must be fitted before use.")
+        return FeatureBounds(self.columns, self.lower_, self.upper_)
+
+    def outlier_flags(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Boolean (rows x columns) array of values outside the fitted bounds, from one vectorized comparison.
+        """
+        if self.lower_ is None:
+            raise RuntimeError("MultiColumnOutlierFilter must be fitted before use.")
+        values = df[self.columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        return (values < self.lower_) | (values > self.upper_)
+
+    def filter(self, df: pd.DataFrame) -> tuple[pd.DataFrame, dict]:
+        """
+        Drop every row with an outlier in any rule column, applying one combined mask.
+
+        Returns:
+        - tuple: (filtered frame, report with rows flagged per column and rows removed in total)
+        """
+        flags = self.outlier_flags(df)
+        keep = ~flags.any(axis=1)
+        report = {
+            "rows_in": int(len(df)),
+            "rows_removed": int((~keep).sum()),
+            "flagged_per_column": dict(zip(self.columns, flags.sum(axis=0).tolist())),
+            "bounds": {col: [float(low), float(high)] for col, low, high in zip(self.columns, self.lower_, self.upper_)},
+        }
+        return df[keep], report
+
 
 if __name__ == "__main__":
     pass
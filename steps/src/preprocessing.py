@@ -0,0 +1,111 @@
+import logging
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.base import RegressorMixin, TransformerMixin
+from sklearn.inspection import permutation_importance
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+def compact_matrix(X):
+    """
+    float32 copy of a preprocessor output: CSR stays CSR, anything else becomes a dense ndarray.
+    """
+    if sparse.issparse(X):
+        return sparse.csr_matrix(X, dtype=np.float32)
+    return np.asarray(X, dtype=np.float32)
+
+
+# Fitted preprocessor together with its output on the train and test rows
+class PreprocessedData:
+    def __init__(self, preprocessor: TransformerMixin, X_train, y_train: pd.Series, X_test=None, y_test: pd.Series = None):
+        """
+        Shared by training, hyperparameter search, evaluation and feature importance reporting, so
+        that the preprocessor runs once per row instead of once per consumer.
+
+        Parameters:
+        - preprocessor: Fitted preprocessor (e.g. the 'preprocessor' step of build_regression_pipeline).
+        - X_train, X_test: Its output on the train and test rows (float32 CSR or dense).
+        - y_train, y_test: Targets, in the row order of the matrices.
+        """
+        self.preprocessor = preprocessor
+        self.X_train = X_train
+        self.y_train = y_train
+        self.X_test = X_test
+        self.y_test = y_test
+
+    @classmethod
+    def fit(
+        cls,
+        preprocessor: TransformerMixin,
+        X_train: pd.DataFrame,
+        y_train: pd.Series,
+        X_test: pd.DataFrame = None,
+        y_test: pd.Series = None,
+    ) -> "PreprocessedData":
+        """
+        Fit the preprocessor on the train rows and transform train and test rows once.
+        """
+        X_train_matrix = compact_matrix(preprocessor.fit_transform(X_train))
+        X_test_matrix = compact_matrix(preprocessor.transform(X_test)) if X_test is not None else None
+        data = cls(preprocessor, X_train_matrix, y_train, X_test_matrix, y_test)
+        logging.info(f"Preprocessed {X_train_matrix.shape[0]} train and {0 if X_test is None else len(X_test)} test "
+                     f"row(s) into {X_train_matrix.shape[1]} {'sparse' if data.is_sparse else 'dense'} "
+                     f"float32 column(s), {data.nbytes / 1024 ** 2:.1f} MB.")
+        return data
+
+    @property
+    def is_sparse(self) -> bool:
+        return sparse.issparse(self.X_train)
+
+    @property
+    def input_columns(self) -> list:
+        return list(self.preprocessor.feature_names_in_)
+
+    @property
+    def feature_names(self) -> list:
+        return list(self.preprocessor.get_feature_names_out())
+
+    @property
+    def nbytes(self) -> int:
+        def size(X):
+            if X is None:
+                return 0
+            if sparse.issparse(X):
+                return X.data.nbytes + X.indices.nbytes + X.indptr.nbytes
+            return X.nbytes
+        return size(self.X_train) + size(self.X_test)
+
+
+def feature_importances(
+    model: RegressorMixin, data: PreprocessedData, n_repeats: int = 5, random_state: int = 0
+) -> pd.Series:
+    """
+    Importance of every preprocessed column for a model trained on data.X_train, highest first.
+
+    Uses the model's own feature_importances_ (tree ensembles) or absolute coef_ (linear models);
+    other models (e.g. HistGradientBoostingRegressor) get the permutation importance on the test matrix.
+    """
+    final = model
+    while hasattr(final, "steps"):
+        final = final.steps[-1][1]
+    if hasattr(final, "feature_importances_"):
+        values = final.feature_importances_
+    elif hasattr(final, "coef_"):
+        values = np.abs(np.ravel(final.coef_))
+    else:
+        if data.X_test is None:
+            raise ValueError("Permutation importance needs the test matrix.")
+        # Permuting columns needs a dense matrix
+        X_test = data.X_test.toarray() if data.is_sparse else data.X_test
+        values = permutation_importance(
+            model, X_test, data.y_test, n_repeats=n_repeats, random_state=random_state
+        ).importances_mean
+    return pd.Series(values, index=data.feature_names, name="importance").sort_values(ascending=False)
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,308 @@
+import logging
+import math
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+# Mean and variance over a stream (Welford / Chan et al. parallel update), one slot per column
+class RunningMoments:
+    def __init__(self, n_columns: int = 1):
+        self.count = np.zeros(n_columns, dtype=np.int64)
+        self.mean = np.zeros(n_columns, dtype=np.float64)
+        self.m2 = np.zeros(n_columns, dtype=np.float64)
+
+    def _combine(self, count: np.ndarray, mean: np.ndarray, m2: np.ndarray):
+        total = self.count + count
+        with np.errstate(invalid="ignore", divide="ignore"):
+            delta = mean - self.mean
+            weight = np.where(total > 0, count / np.maximum(total, 1), 0.0)
+            self.mean = np.where(count > 0, self.mean + delta * weight, self.mean)
+            self.m2 = np.where(count > 0, self.m2 + m2 + delta ** 2 * self.count * weight, self.m2)
+        self.count = total
+
+    def update(self, values: np.ndarray) -> "RunningMoments":
+        """
+        Add a batch of rows (2D, one column per slot; NaNs are skipped). The batch is reduced
+        with numpy first and then merged, so the cost is one vectorized pass per chunk.
+        """
+        values = np.asarray(values, dtype=np.float64).reshape(len(values), -1)
+        valid = ~np.isnan(values)
+        count = valid.sum(axis=0)
+        filled = np.where(valid, values, 0.0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(count > 0, filled.sum(axis=0) / np.maximum(count, 1), 0.0)
+        m2 = (np.where(valid, values - mean, 0.0) ** 2).sum(axis=0)
+        self._combine(count, mean, m2)
+        return self
+
+    def merge(self, other: "RunningMoments") -> "RunningMoments":
+        self._combine(other.count, other.mean, other.m2)
+        return self
+
+    def variance(self, ddof: int = 1) -> np.ndarray:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.count > ddof, self.m2 / (self.count - ddof), np.nan)
+
+    def std(self, ddof: int = 1) -> np.ndarray:
+        return np.sqrt(self.variance(ddof))
+
+    def to_dict(self) -> dict:
+        return {"count": self.count.tolist(), "mean": self.mean.tolist(), "m2": self.m2.tolist()}
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "RunningMoments":
+        moments = cls(len(state["count"]))
+        moments.count = np.asarray(state["count"], dtype=np.int64)
+        moments.mean = np.asarray(state["mean"], dtype=np.float64)
+        moments.m2 = np.asarray(state["m2"], dtype=np.float64)
+        return moments
+
+
+# Mergeable quantile sketch (KLL-style compactor hierarchy)
+class QuantileSketch:
+    def __init__(self, k: int = 200, seed: int = None):
+        """
+        Approximate quantiles of a stream in O(k log(n / k)) memory.
+
+        Values enter the level-0 compactor. When a level holds more than its capacity it is
+        sorted and every other item (random offset) is promoted to the next level with twice
+        the weight. Capacities shrink by 2/3 per level below the top, as in KLL.
+
+        Error bound: the rank of a returned quantile is within about eps * n of the requested
+        rank, with eps ~= 2.296 / k ** 0.9723 (1.3% at k=200, 0.4% at k=800) at 99% confidence,
+        following the KLL analysis and Apache DataSketches' empirical fit. Merging sketches
+        does not increase the error. min and max are tracked exactly.
+
+        Parameters:
+        - k (int): Accuracy parameter (capacity of the top compactor).
+        - seed (int): Seed of the offsets chosen during compaction.
+        """
+        self.k = k
+        self.levels = [np.empty(0, dtype=np.float64)]
+        self.n = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self._rng = np.random.default_rng(seed)
+
+    @staticmethod
+    def rank_error(k: int) -> float:
+        """
+        Normalized rank error of a single quantile query at 99% confidence.
+        """
+        return 2.296 / k ** 0.9723
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - 1 - level
+        return max(2, int(math.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0, dtype=np.float64))
+                items = np.sort(items)
+                # An odd leftover stays behind so the total weight is preserved exactly.
+                keep = items[-1:] if len(items) % 2 else items[:0]
+                pairs = items[: len(items) - len(keep)]
+                promoted = pairs[self._rng.integers(0, 2)::2]
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+                self.levels[level] = keep
+            level += 1
+
+    def update(self, values) -> "QuantileSketch":
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if len(values):
+            self.n += len(values)
+            self.min = min(self.min, values.min())
+            self.max = max(self.max, values.max())
+            self.levels[0] = np.concatenate([self.levels[0], values])
+            self._compress()
+        return self
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0, dtype=np.float64))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.n += other.n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+
+    def quantile(self, q):
+        """
+        Approximate quantile(s) q in [0, 1]. Returns NaN for an empty sketch.
+        """
+        q = np.asarray(q, dtype=np.float64)
+        if self.n == 0:
+            return np.full(q.shape, np.nan) if q.ndim else np.nan
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(items), 2 ** level) for level, items in enumerate(self.levels)])
+        order = np.argsort(items, kind="stable")
+        items, cumulative = items[order], np.cumsum(weights[order])
+        position = np.searchsorted(cumulative, q * cumulative[-1], side="left")
+        result = items[np.minimum(position, len(items) - 1)]
+        result = np.where(q <= 0, self.min, np.where(q >= 1, self.max, result))
+        return result if q.ndim else float(result)
+
+    def to_dict(self) -> dict:
+        return {
+            "k": self.k,
+            "n": self.n,
+            "min": float(self.min),
+            "max": float(self.max),
+            "levels": [items.tolist() for items in self.levels],
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "QuantileSketch":
+        sketch = cls(k=state["k"])
+        sketch.n = state["n"]
+        sketch.min = state["min"]
+        sketch.max = state["max"]
+        sketch.levels = [np.asarray(items, dtype=np.float64) for items in state["levels"]]
+        return sketch
+
+
+# Per-column streaming statistics of a DataFrame: moments and quantiles for numeric
+# columns, exact value counts for the others
+class StreamingStatistics:
+    def __init__(self, k: int = 200):
+        self.k = k
+        self.numeric_columns = None
+        self.other_columns = None
+        self.moments = None
+        self.sketches = None
+        self.counts = None
+
+    def _init_columns(self, numeric_columns: list, other_columns: list):
+        self.numeric_columns = list(numeric_columns)
+        self.other_columns = list(other_columns)
+        self.moments = RunningMoments(len(self.numeric_columns))
+        self.sketches = {col: QuantileSketch(self.k) for col in self.numeric_columns}
+        self.counts = {col: {} for col in self.other_columns}
+
+    def update(self, chunk: pd.DataFrame) -> "StreamingStatistics":
+        if self.numeric_columns is None:
+            numeric_columns = list(chunk.select_dtypes(include="number").columns)
+            self._init_columns(numeric_columns, [col for col in chunk.columns if col not in numeric_columns])
+        values = chunk[self.numeric_columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        self.moments.update(values)
+        for position, col in enumerate(self.numeric_columns):
+            self.sketches[col].update(values[:, position])
+        for col in self.other_columns:
+            counts = self.counts[col]
+            for value, count in chunk[col].value_counts(dropna=True, sort=False).items():
+                counts[value] = counts.get(value, 0) + int(count)
+        return self
+
+    def merge(self, other: "StreamingStatistics") -> "StreamingStatistics":
+        if other.numeric_columns is None:
+            return self
+        if self.numeric_columns is None:
+            self._init_columns(other.numeric_columns, other.other_columns)
+        if other.numeric_columns != self.numeric_columns:
+            raise ValueError("Cannot merge statistics computed over different numeric columns.")
+        self.moments.merge(other.moments)
+        for col in self.numeric_columns:
+            self.sketches[col].merge(other.sketches[col])
+        for col in self.other_columns:
+            counts = self.counts[col]
+            for value, count in other.counts.get(col, {}).items():
+                counts[value] = counts.get(value, 0) + count
+        return self
+
+    def mean(self) -> pd.Series:
+        return pd.Series(np.where(self.moments.count > 0, self.moments.mean, np.nan), index=self.numeric_columns)
+
+    def std(self, ddof: int = 1) -> pd.Series:
+        return pd.Series(self.moments.std(ddof), index=self.numeric_columns)
+
+    def quantile(self, q: float) -> pd.Series:
+        return pd.Series([self.sketches[col].quantile(q) for col in self.numeric_columns], index=self.numeric_columns)
+
+    def mode(self) -> pd.Series:
+        # Ties resolve to the smallest value, like Series.mode().iloc[0].
+        modes = {}
+        for col, counts in self.counts.items():
+            if counts:
+                top = max(counts.values())
+                modes[col] = min(value for value, count in counts.items() if count == top)
+        return pd.Series(modes, dtype=object)
+
+    def to_dict(self) -> dict:
+        return {
+            "k": self.k,
+            "numeric_columns": self.numeric_columns,
+            "other_columns": self.other_columns,
+            "moments": self.moments.to_dict() if self.moments is not None else None,
+            "sketches": {col: sketch.to_dict() for col, sketch in (self.sketches or {}).items()},
+            "counts": {col: [[value, count] for value, count in counts.items()] for col, counts in (self.counts or {}).items()},
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "StreamingStatistics":
+        stats = cls(k=state["k"])
+        if state["numeric_columns"] is None:
+            return stats
+        stats.numeric_columns = list(state["numeric_columns"])
+        stats.other_columns = list(state["other_columns"])
+        stats.moments = RunningMoments.from_dict(state["moments"])
+        stats.sketches = {col: QuantileSketch.from_dict(sketch) for col, sketch in state["sketches"].items()}
+        stats.counts = {col: {value: count for value, count in pairs} for col, pairs in state["counts"].items()}
+        return stats
+
+
+def _chunk_statistics(chunk: pd.DataFrame, k: int) -> StreamingStatistics:
+    return StreamingStatistics(k).update(chunk)
+
+
+def stream_statistics(chunks: Iterable[pd.DataFrame], k: int = 200, max_workers: int = None) -> StreamingStatistics:
+    """
+    Compute mergeable per-column statistics over a stream of chunks (e.g. DataIngestor.ingest_chunks),
+    holding one chunk at a time.
+
+    Parameters:
+    - chunks (Iterable[pd.DataFrame]): Chunks with the same columns.
+    - k (int): Quantile sketch accuracy (see QuantileSketch for the error bound).
+    - max_workers (int): If greater than 1, chunks are summarized in worker processes and the
+      partial sketches are merged.
+
+    Returns:
+    - StreamingStatistics: Merged statistics of all chunks.
+    """
+    stats = StreamingStatistics(k)
+    n_chunks = 0
+    if max_workers is not None and max_workers > 1:
+        # At most two chunks per worker are in flight, so memory stays bounded by the chunk size.
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            pending = set()
+            for chunk in chunks:
+                if len(pending) >= 2 * max_workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        stats.merge(future.result())
+                pending.add(executor.submit(_chunk_statistics, chunk, k))
+                n_chunks += 1
+            for future in pending:
+                stats.merge(future.result())
+    else:
+        for chunk in chunks:
+            stats.update(chunk)
+            n_chunks += 1
+    logging.info(f"Streaming statistics computed over {n_chunks} chunk(s).")
+    return stats
+
+
+if __name__ == "__main__":
+    pass
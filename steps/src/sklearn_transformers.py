@@ -0,0 +1,254 @@
+import copy
+import logging
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+from sklearn.utils import murmurhash3_32
+
+from .feature_engineering import FeatureEngineeringStrategy, FeaturePlan
+from .ingest_data import optimize_dtypes
+from .outlier_detection import BoundsValidator, FeatureBounds
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+# Wrapper: a single feature engineering strategy as a scikit-learn transformer
+class FeatureStrategyTransformer(BaseEstimator, TransformerMixin):
+    def __init__(self, strategy: FeatureEngineeringStrategy):
+        """
+        Parameters:
+        - strategy (FeatureEngineeringStrategy): Strategy to fit on training data and apply frozen afterwards.
+        """
+        self.strategy = strategy
+
+    def fit(self, X: pd.DataFrame, y=None):
+        self.strategy_ = copy.deepcopy(self.strategy).fit(X)
+        return self
+
+    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+        return self.strategy_.transform(pd.DataFrame(X))
+
+
+# Wrapper: a whole feature plan as a scikit-learn transformer for raw listings
+class FeaturePlanTransformer(BaseEstimator, TransformerMixin):
+    def __init__(
+        self,
+        strategies: list,
+        state: dict = None,
+        schema: dict = None,
+        target_column: str = None,
+        output_columns: list = None,
+    ):
+        """
+        Turn raw listings (e.g. '23.4 kmpl', 'Maruti Swift') into the engineered frame a model was trained on.
+
+        Parameters:
+        - strategies (list): FeatureEngineeringStrategy instances, in plan order.
+        - state (dict): Fitted plan state (FeaturePlan.get_state). If given, fit() restores it instead of refitting.
+        - schema (dict): Ingestion dtype schema applied to raw inputs first (see optimize_dtypes),
+          so serving inputs get the same dtypes as training data.
+        - target_column (str): Target read by some strategies (e.g. log transform). It is filled with NaN
+          when absent from a request and dropped from the output.
+        - output_columns (list): Columns the downstream estimator expects; missing ones are added as NaN.
+        """
+        self.strategies = strategies
+        self.state = state
+        self.schema = schema
+        self.target_column = target_column
+        self.output_columns = output_columns
+
+    def _prepare(self, X) -> pd.DataFrame:
+        if isinstance(X, np.ndarray) and X.ndim == 1:
+            # Records as sent by the predictor step: an array of {column: value} dicts
+            X = list(X)
+        # The plan runs with copy=False; a shallow copy keeps it from replacing the caller's columns
+        X = X.copy(deep=False) if isinstance(X, pd.DataFrame) else pd.DataFrame(X)
+        if self.schema is not None:
+            X = optimize_dtypes(X, self.schema)
+        if self.target_column is not None and self.target_column not in X.columns:
+            X = X.assign(**{self.target_column: np.nan})
+        return X
+
+    def _finish(self, X: pd.DataFrame) -> pd.DataFrame:
+        if self.target_column is not None:
+            X = X.drop(columns=[self.target_column], errors="ignore")
+        if self.output_columns is not None:
+            X = X.reindex(columns=self.output_columns)
+        return X
+
+    def fit(self, X, y=None):
+        self.plan_ = FeaturePlan(copy.deepcopy(self.strategies))
+        if self.state is not None:
+            self.plan_.set_state(self.state)
+        else:
+            self.plan_.fit_transform(self._prepare(X))
+        return self
+
+    def transform(self, X) -> pd.DataFrame:
+        return self._finish(self.plan_.transform(self._prepare(X), copy=False))
+
+    def transform_labeled(self, X) -> tuple[pd.DataFrame, pd.Series]:
+        """
+        Engineer labelled raw rows (e.g. new training data). Returns the features and the engineered target.
+        """
+        engineered = self.plan_.transform(self._prepare(X), copy=False)
+        return self._finish(engineered), engineered[self.target_column]
+
+
+# Wrapper: enforce fitted feature bounds on every batch scored by a pipeline
+class BoundsGuard(BaseEstimator, TransformerMixin):
+    def __init__(self, bounds: dict, policy: str = "clip"):
+        """
+        Parameters:
+        - bounds (dict): FeatureBounds.to_dict() artifact from training.
+        - policy (str): 'flag' (report only) or 'clip' (clip to the bounds). Violation totals are kept
+          on validator_ (rows_seen_, violation_counts_) for monitoring.
+        """
+        self.bounds = bounds
+        self.policy = policy
+
+    def fit(self, X, y=None):
+        self.validator_ = BoundsValidator(FeatureBounds.from_dict(self.bounds), policy=self.policy)
+        return self
+
+    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+        return self.validator_.validate(X)[0]
+
+
+def sparse_frame_to_csr(X: pd.DataFrame) -> sparse.csr_matrix:
+    """
+    Convert a frame holding pandas SparseDtype (and optionally dense numeric) columns to CSR
+    without densifying the sparse columns.
+    """
+    if not isinstance(X, pd.DataFrame):
+        return sparse.csr_matrix(X)
+    is_sparse = np.array([isinstance(dtype, pd.SparseDtype) for dtype in X.dtypes])
+    blocks = []
+    if is_sparse.any():
+        blocks.append(X.loc[:, is_sparse].sparse.to_coo())
+    if not is_sparse.all():
+        blocks.append(sparse.csr_matrix(X.loc[:, ~is_sparse].to_numpy(dtype=np.float32)))
+    matrix = sparse.hstack(blocks, format="csr")
+    # Restore the frame's column order when the two blocks were interleaved
+    order = np.argsort(np.concatenate([np.flatnonzero(is_sparse), np.flatnonzero(~is_sparse)]))
+    return matrix[:, order] if (order != np.arange(len(order))).any() else matrix
+
+
+# Wrapper: pass SparseDtype columns to an estimator as CSR (ColumnTransformer would densify them)
+class SparseFrameToCSR(BaseEstimator, TransformerMixin):
+    def fit(self, X, y=None):
+        return self
+
+    def transform(self, X) -> sparse.csr_matrix:
+        return sparse_frame_to_csr(X)
+
+    def get_feature_names_out(self, input_features=None):
+        return np.asarray(input_features, dtype=object)
+
+
+# Scale each column by its maximum absolute value; keeps CSR input sparse
+class SparseMaxAbsScaler(BaseEstimator, TransformerMixin):
+    """
+    Same scaling as sklearn's MaxAbsScaler, computed with scipy's own sparse reductions: the sparse
+    path of scikit-learn 1.3 relies on matrix.A, which SciPy 1.14 removed.
+    """
+
+    def fit(self, X, y=None):
+        if sparse.issparse(X):
+            max_abs = abs(sparse.csr_matrix(X)).max(axis=0).toarray().ravel()
+        else:
+            max_abs = np.nanmax(np.abs(np.asarray(X, dtype=np.float64)), axis=0)
+        self.max_abs_ = np.asarray(max_abs, dtype=np.float64)
+        # All-zero columns are left unchanged
+        self.scale_ = np.where(self.max_abs_ == 0, 1.0, self.max_abs_)
+        self.n_features_in_ = X.shape[1]
+        return self
+
+    def transform(self, X):
+        if sparse.issparse(X):
+            return sparse.csr_matrix(X) @ sparse.diags(1.0 / self.scale_)
+        return np.asarray(X) / self.scale_
+
+
+def hash_categoricals(X: pd.DataFrame, columns: list, n_features: int = 2**16) -> sparse.csr_matrix:
+    """
+    Hash 'column=value' of every categorical cell into one of n_features CSR columns (value 1.0).
+    Only the distinct values of a chunk are hashed; missing values produce no entry. No vocabulary
+    is fitted, so any chunk is encoded the same way regardless of which chunks came before it.
+    """
+    rows, cols = [], []
+    for col in columns:
+        values = X[col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            codes, categories = values.cat.codes.to_numpy(), values.cat.categories
+        else:
+            codes, categories = pd.factorize(values)
+        table = np.array(
+            [murmurhash3_32(f"{col}={value}", positive=True) % n_features for value in categories], dtype=np.int64
+        )
+        present = np.flatnonzero(codes >= 0)
+        rows.append(present)
+        cols.append(table[codes[present]])
+    rows, cols = np.concatenate(rows or [np.empty(0, np.int64)]), np.concatenate(cols or [np.empty(0, np.int64)])
+    # Colliding cells of the same row are summed by the COO -> CSR conversion
+    return sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(len(X), n_features))
+
+
+# Stateless categorical encoding plus incrementally fitted scaling, for models trained chunk by chunk
+class HashedFeatureEncoder(BaseEstimator, TransformerMixin):
+    def __init__(self, numeric_columns: list, categorical_columns: list, n_features: int = 2**16):
+        """
+        Parameters:
+        - numeric_columns (list): Standardized with running statistics (partial_fit); missing values become 0 (the mean).
+        - categorical_columns (list): Hashed with hash_categoricals.
+        - n_features (int): Hashed columns.
+        """
+        self.numeric_columns = numeric_columns
+        self.categorical_columns = categorical_columns
+        self.n_features = n_features
+
+    def partial_fit(self, X: pd.DataFrame, y=None):
+        if not hasattr(self, "scaler_"):
+            self.scaler_ = StandardScaler()
+        if self.numeric_columns:
+            self.scaler_.partial_fit(X[self.numeric_columns].to_numpy(dtype=np.float64, na_value=np.nan))
+        return self
+
+    def fit(self, X: pd.DataFrame, y=None):
+        self.scaler_ = StandardScaler()
+        return self.partial_fit(X)
+
+    def transform(self, X: pd.DataFrame) -> sparse.csr_matrix:
+        blocks = []
+        if self.numeric_columns:
+            numeric = self.scaler_.transform(X[self.numeric_columns].to_numpy(dtype=np.float64, na_value=np.nan))
+            blocks.append(sparse.csr_matrix(np.nan_to_num(numeric, nan=0.0)))
+        blocks.append(hash_categoricals(X, self.categorical_columns, self.n_features))
+        return sparse.hstack(blocks, format="csr")
+
+    def get_feature_names_out(self, input_features=None):
+        hashed = [f"hashed_{i}" for i in range(self.n_features)]
+        return np.asarray(list(self.numeric_columns) + hashed, dtype=object)
+
+
+def make_serving_pipeline(
+    feature_transformer: FeaturePlanTransformer, model_pipeline: Pipeline, guard: BoundsGuard = None
+) -> Pipeline:
+    """
+    Prepend a fitted feature transformer (and optionally a fitted bounds guard) to an already fitted
+    model pipeline, without refitting either.
+
+    Returns:
+    - Pipeline: ('features', ...), ('guard', ...) if given, then the model pipeline's own steps.
+    """
+    head = [("features", feature_transformer)] + ([("guard", guard)] if guard is not None else [])
+    return Pipeline(head + list(model_pipeline.steps))
+
+
+if __name__ == "__main__":
+    pass
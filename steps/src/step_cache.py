@@ -0,0 +1,262 @@
+import ast
+import functools
+import hashlib
+import importlib.util
+import inspect
+import json
+import logging
+import os
+import sys
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+def fingerprint(value) -> str:
+    """
+    Content hash of a step argument. DataFrames and Series are hashed row by row (index, values,
+    column names and dtypes), anything else through joblib's pickle-based hash.
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        digest = hashlib.sha256(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+        columns = list(value.columns) if isinstance(value, pd.DataFrame) else [value.name]
+        dtypes = value.dtypes.astype(str).tolist() if isinstance(value, pd.DataFrame) else [str(value.dtype)]
+        digest.update(repr((columns, dtypes)).encode())
+        return digest.hexdigest()
+    if isinstance(value, np.ndarray):
+        return hashlib.sha256(value.tobytes() + repr((value.dtype, value.shape)).encode()).hexdigest()
+    return joblib.hash(value)
+
+
+@functools.lru_cache(maxsize=None)
+def _module_source(module_name: str) -> tuple:
+    """
+    Returns:
+    - tuple: (source, package used to resolve its relative imports), or None for modules without Python source
+    """
+    try:
+        module = sys.modules.get(module_name)
+        if module is not None:
+            return inspect.getsource(module), module.__package__
+        spec = importlib.util.find_spec(module_name)
+    except (ImportError, OSError, TypeError, ValueError):
+        return None
+    if spec is None or not spec.origin or not spec.origin.endswith(".py"):
+        return None
+    with open(spec.origin, encoding="utf-8") as f:
+        return f.read(), spec.parent
+
+
+@functools.lru_cache(maxsize=None)
+def _local_imports(module_name: str) -> frozenset:
+    """
+    Modules of the same top-level package that module_name imports, including imports inside functions.
+    """
+    source, package = _module_source(module_name)
+    root = module_name.split(".")[0]
+    imported = set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            imported.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            try:
+                parent = importlib.util.resolve_name("." * node.level + (node.module or ""), package)
+            except ImportError:
+                continue
+            # `from package import name` may import a submodule
+            imported.add(parent)
+            imported.update(f"{parent}.{alias.name}" for alias in node.names)
+    return frozenset(
+        name for name in imported if name.split(".")[0] == root and _module_source(name) is not None
+    )
+
+
+def _module_closure(module_names) -> list:
+    """
+    The given modules plus every package-local module they import, directly or transitively.
+    """
+    seen, pending = set(), [name for name in module_names if _module_source(name) is not None]
+    while pending:
+        name = pending.pop()
+        if name not in seen:
+            seen.add(name)
+            pending.extend(_local_imports(name) - seen)
+    return sorted(seen)
+
+
+@functools.lru_cache(maxsize=None)
+def _module_source_hash(module_name: str) -> str:
+    return hashlib.sha256(_module_source(module_name)[0].encode()).hexdigest()
+
+
+def code_version(*objects) -> str:
+    """
+    Hash of the source of the modules defining the given functions, classes or modules and of every
+    module of the same package they import (e.g. steps.src.text_transforms for FeaturePlan), so that
+    editing a step, one of its strategies or a helper they use invalidates its cached outputs.
+    """
+    names = _module_closure({obj.__name__ if inspect.ismodule(obj) else obj.__module__ for obj in objects})
+    return hashlib.sha256("|".join(f"{name}:{_module_source_hash(name)}" for name in names).encode()).hexdigest()
+
+
+# Content-addressed store of step outputs
+class StepCache:
+    def __init__(self, cache_dir: str = "tmp/step_cache", max_cache_bytes: int = 4 * 1024 ** 3, enabled: bool = True):
+        """
+        Keep step outputs keyed by the fingerprints of the step's arguments and the version of its code.
+        A step whose inputs, parameters and code are unchanged is not re-executed.
+
+        Parameters:
+        - cache_dir (str): Directory holding one joblib file per cached output.
+        - max_cache_bytes (int): Size limit of the cache; least recently used outputs are evicted first.
+        - enabled (bool): When False, every lookup is a miss and nothing is stored.
+        """
+        self.cache_dir = cache_dir
+        self.max_cache_bytes = max_cache_bytes
+        self.enabled = enabled
+        # Per-step counters for the current process: {step: {"hits": n, "misses": n}}
+        self.stats = {}
+
+    def key(self, step_name: str, arguments: dict, code: str) -> str:
+        fingerprints = {name: fingerprint(value) for name, value in arguments.items()}
+        payload = json.dumps({"step": step_name, "arguments": fingerprints, "code": code}, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.joblib")
+
+    def load(self, key: str) -> tuple:
+        """
+        Returns:
+        - tuple: (True, cached value) on a hit, (False, None) on a miss
+        """
+        path = self._path(key)
+        if not self.enabled or not os.path.exists(path):
+            return False, None
+        try:
+            value = joblib.load(path)
+        except Exception as e:
+            logging.warning(f"Discarding unreadable step cache entry {path}: {e}")
+            os.remove(path)
+            return False, None
+        os.utime(path)  # mark as recently used for LRU eviction
+        return True, value
+
+    def store(self, key: str, value):
+        if not self.enabled:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            joblib.dump(value, tmp_path)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logging.warning(f"Could not cache step output: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self._evict(keep=path)
+
+    def _evict(self, keep: str):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".joblib"):
+                path = os.path.join(self.cache_dir, name)
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_cache_bytes:
+                break
+            if path == keep:
+                continue
+            logging.info(f"Evicting cached step output: {path}")
+            os.remove(path)
+            total -= size
+
+    def record(self, step_name: str, hit: bool):
+        counts = self.stats.setdefault(step_name, {"hits": 0, "misses": 0})
+        counts["hits" if hit else "misses"] += 1
+
+    def lookup(self, step_name: str, key: str) -> tuple:
+        """
+        load() plus hit/miss logging and counting under step_name.
+        """
+        if not self.enabled:
+            return False, None
+        hit, value = self.load(key)
+        self.record(step_name, hit)
+        if hit:
+            logging.info(f"Step cache HIT  {step_name} [{key}]: skipping execution.")
+        else:
+            logging.info(f"Step cache MISS {step_name} [{key}]: executing.")
+        return hit, value
+
+    def get_or_compute(self, step_name: str, arguments: dict, code: str, compute):
+        """
+        Return the cached output for (arguments, code), or compute, store and return it.
+
+        Parameters:
+        - step_name (str): Step name, for the key and the log.
+        - arguments (dict): Every input and parameter that determines the output.
+        - code (str): code_version() of the step and the strategies it runs.
+        - compute: Zero-argument callable producing the output on a miss.
+        """
+        if not self.enabled:
+            return compute()
+        key = self.key(step_name, arguments, code)
+        hit, value = self.lookup(step_name, key)
+        if hit:
+            return value
+
+        start = time.perf_counter()
+        value = compute()
+        seconds = time.perf_counter() - start
+        self.store(key, value)
+        logging.info(f"Step cache stored {step_name} [{key}] after {seconds:.2f}s of execution.")
+        return value
+
+
+# Cache used by the cached_step decorator; set enabled=False to always execute steps
+step_cache = StepCache()
+
+
+def cached_step(*dependencies, bypass=None):
+    """
+    Decorator for step functions (below @step): the step body runs only when the fingerprints of its
+    arguments or the code of the step module and of the modules defining `dependencies` changed.
+    The step function must be pure; outputs are stored in step_cache.
+
+    Parameters:
+    - dependencies: Functions, classes or modules whose code determines the step output (e.g. its strategies).
+    - bypass: Optional predicate on the bound arguments (dict); when it returns True the step always
+      executes and its output is not cached (e.g. when the call has side effects a hit would skip).
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            if bypass is not None and bypass(bound.arguments):
+                logging.info(f"Step cache bypassed for {func.__name__}.")
+                return func(*args, **kwargs)
+            return step_cache.get_or_compute(
+                func.__name__, dict(bound.arguments), code_version(func, *dependencies), lambda: func(*args, **kwargs)
+            )
+
+        return wrapper
+
+    return decorator
+
+
+if __name__ == "__main__":
+    pass
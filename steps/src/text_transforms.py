@@ -0,0 +1,131 @@
+import logging
+import re
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+_NUMBER = r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+_CAPTURE_GROUP = re.compile(r"(?<!\\)\((?!\?)")
+
+
+def parse_numeric_with_unit(series: pd.Series, unit_pattern: str = None, dtype=np.float32) -> tuple:
+    """
+    Parse values such as '23.4 kmpl' or '1248 CC' straight into a float column.
+
+    A single anchored regex pulls out the number (an optional unit may follow it), and the
+    matches are cast to dtype in C. Unlike strip-then-to_numeric, this does not build an
+    intermediate stripped string column.
+
+    Parameters:
+    - series (pd.Series): Raw values.
+    - unit_pattern (str): Regex of the allowed unit suffix (e.g. 'kmpl|km/kg'). None accepts any
+      non-numeric suffix.
+    - dtype: Output float dtype.
+
+    Returns:
+    - Tuple of (parsed pd.Series, number of non-null values that could not be parsed).
+    """
+    if pd.api.types.is_numeric_dtype(series):
+        return series.astype(dtype), 0
+
+    if unit_pattern:
+        # Capture groups in the unit would make str.extract build a DataFrame, so make them non-capturing.
+        unit = "(?:" + _CAPTURE_GROUP.sub("(?:", unit_pattern) + ")?"
+    else:
+        unit = r"\D*"
+    matches = series.str.extract(rf"^\s*({_NUMBER})\s*{unit}\s*$", expand=False)
+    parsed = matches.astype(dtype)
+
+    unparsed = parsed.isna() & series.notna()
+    if unparsed.any():
+        # Non-string values (e.g. plain numbers in an object column) are not seen by the regex.
+        parsed[unparsed] = pd.to_numeric(series[unparsed], errors="coerce").astype(dtype)
+        unparsed = parsed.isna() & series.notna()
+
+    return parsed, int(unparsed.sum())
+
+
+
+class LRUMemo:
+    def __init__(self, maxsize: int = 100_000):
+        """
+        Bounded least-recently-used memo of per-value transform results, kept across batches.
+
+        Parameters:
+        - maxsize (int): Maximum number of distinct input values remembered.
+        """
+        self.maxsize = maxsize
+        self._values = OrderedDict()
+        self._dtype = None
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def transform(self, uniques: pd.Series, func) -> pd.Series:
+        """
+        Apply func to the distinct values not seen before and serve the rest from the memo.
+
+        Parameters:
+        - uniques (pd.Series): Distinct input values.
+        - func: Vectorized transform mapping a Series to a Series of the same length.
+
+        Returns:
+        - pd.Series: Transformed values aligned with uniques.
+        """
+        keys = uniques.tolist()
+        hit = np.fromiter((key in self._values for key in keys), dtype=bool, count=len(keys))
+        if hit.all():
+            for key in keys:
+                self._values.move_to_end(key)
+            return pd.Series([self._values[key] for key in keys], dtype=self._dtype)
+
+        computed = func(uniques[~hit].reset_index(drop=True))
+        self._dtype = computed.dtype
+        fresh = dict(zip((key for key, seen in zip(keys, hit) if not seen), computed.tolist()))
+
+        values = []
+        for key, seen in zip(keys, hit):
+            if seen:
+                self._values.move_to_end(key)
+                values.append(self._values[key])
+            else:
+                values.append(fresh[key])
+                if not pd.isna(key):  # NaN keys never compare equal, so they are not memoized
+                    self._values[key] = fresh[key]
+
+        while len(self._values) > self.maxsize:
+            self._values.popitem(last=False)
+        return pd.Series(values, dtype=self._dtype)
+
+
+def map_unique(series: pd.Series, func, memo: LRUMemo = None) -> pd.Series:
+    """
+    Run a vectorized transform on the distinct values of a Series only, then broadcast by codes.
+
+    For low-cardinality columns (brand names, owners, unit strings) the cost scales with the
+    number of distinct values instead of the number of rows. Missing values are treated as
+    one more distinct value, so the result matches func(series) exactly.
+
+    Parameters:
+    - series (pd.Series): Input values.
+    - func: Vectorized transform mapping a Series to a Series of the same length.
+    - memo (LRUMemo): Optional memo reused across batches.
+
+    Returns:
+    - pd.Series: func applied to every row, with the index and name of series.
+    """
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+    uniques = pd.Series(uniques)
+    if isinstance(uniques.dtype, pd.CategoricalDtype):
+        uniques = uniques.astype(uniques.cat.categories.dtype)
+
+    transformed = func(uniques) if memo is None else memo.transform(uniques, func)
+    return pd.Series(transformed.array.take(codes), index=series.index, name=series.name)
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,189 @@
+import copy
+import logging
+import time
+
+import pandas as pd
+from sklearn.base import RegressorMixin
+from sklearn.ensemble import GradientBoostingRegressor
+from sklearn.metrics import r2_score
+from sklearn.pipeline import Pipeline
+
+from .outlier_detection import BoundsValidator, FeatureBounds
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+def continue_training(model: RegressorMixin, X, y, n_new_estimators: int = 50) -> RegressorMixin:
+    """
+    Update a fitted regressor in place with new rows only.
+
+    GradientBoostingRegressor keeps its trees and adds n_new_estimators more, fitted to the residuals
+    of the current ensemble on the new rows (warm_start). Models with partial_fit take one more pass.
+    HistGradientBoostingRegressor is not updated: it refits its feature bins on every fit, so the
+    existing trees would be evaluated against bins of different data.
+
+    Raises:
+    - ValueError: If the model supports neither (e.g. LinearRegression); it needs a full refit.
+    """
+    if isinstance(model, GradientBoostingRegressor):
+        model.set_params(warm_start=True, n_estimators=len(model.estimators_) + n_new_estimators)
+        model.fit(X, y)
+        model.set_params(warm_start=False)
+    elif hasattr(model, "partial_fit"):
+        model.partial_fit(X, y)
+    else:
+        raise ValueError(f"{type(model).__name__} cannot be updated incrementally.")
+    return model
+
+
+def unknown_category_rates(preprocessor, X: pd.DataFrame) -> dict:
+    """
+    Share of rows per categorical column whose value the fitted encoder has never seen
+    (one-hot encodes them as all zeros, ordinal as the unknown code). Missing values are not counted.
+    """
+    rates = {}
+    for _, transformer, columns in getattr(preprocessor, "transformers_", []):
+        encoder = transformer.steps[-1][1] if isinstance(transformer, Pipeline) else transformer
+        if not hasattr(encoder, "categories_"):
+            continue
+        for col, categories in zip(columns, encoder.categories_):
+            values = X[col].astype(object)
+            unknown = values.notna() & ~values.isin(categories)
+            rates[col] = float(unknown.mean()) if len(values) else 0.0
+    return rates
+
+
+# Continues training a production pipeline on newly arrived rows, or reports that it needs a full refit
+class WarmStartRetrainer:
+    def __init__(
+        self,
+        n_new_estimators: int = 50,
+        max_unknown_rate: float = 0.05,
+        max_violation_rate: float = 0.05,
+        min_r2: float = 0.8,
+        min_rows: int = 20,
+    ):
+        """
+        The feature plan, bounds and preprocessor of the production pipeline stay frozen; only the
+        model is updated. That is only sound while new rows look like the training data, so a
+        drift check comes first and asks for a full refit when any of these hold:
+        - a categorical column has more than max_unknown_rate unseen categories,
+        - more than max_violation_rate of the rows fall outside the training outlier bounds,
+        - the production model scores below min_r2 on the new rows.
+
+        Parameters:
+        - n_new_estimators (int): Trees (boosting iterations) added per refresh.
+        - max_unknown_rate (float): Drift threshold on unseen categories per column.
+        - max_violation_rate (float): Drift threshold on rows outside the training bounds.
+        - min_r2 (float): Drift threshold on the production model's R2 on the new rows.
+        - min_rows (int): Fewer usable new rows than this leave the model unchanged.
+        """
+        self.n_new_estimators = n_new_estimators
+        self.max_unknown_rate = max_unknown_rate
+        self.max_violation_rate = max_violation_rate
+        self.min_r2 = min_r2
+        self.min_rows = min_rows
+
+    @staticmethod
+    def _stages(pipeline: Pipeline) -> tuple:
+        steps = dict(pipeline.steps)
+        head = [name for name in ("features", "guard") if name in steps]
+        return steps.get("features"), steps.get("guard"), pipeline[len(head):-1], pipeline.steps[-1][1]
+
+    def prepare(self, pipeline: Pipeline, new_data: pd.DataFrame, target_column: str) -> tuple:
+        """
+        Engineer new rows the way the production pipeline does and drop rows outside its training bounds.
+
+        Parameters:
+        - pipeline (Pipeline): Production pipeline. With a 'features' step, new_data holds raw listings;
+          otherwise it holds engineered rows.
+        - new_data (pd.DataFrame): New labelled rows, target included.
+        - target_column (str): Target column.
+
+        Returns:
+        - tuple: (X, y, share of rows outside the bounds)
+        """
+        features, guard, _, _ = self._stages(pipeline)
+        if features is not None:
+            X, y = features.transform_labeled(new_data)
+            engineered = X.assign(**{target_column: y})
+        else:
+            engineered = new_data
+            X, y = new_data.drop(columns=[target_column]), new_data[target_column]
+
+        violation_rate = 0.0
+        if guard is not None and len(engineered):
+            # Same bounds the training rows were filtered with, target included
+            validator = BoundsValidator(FeatureBounds.from_dict(guard.bounds), policy="flag")
+            outside = validator.validate(engineered)[1].any(axis=1)
+            violation_rate = float(outside.mean())
+            X, y = X[~outside], y[~outside]
+        return X, y, violation_rate
+
+    def retrain(
+        self, pipeline: Pipeline, new_data: pd.DataFrame, target_column: str, raw_input: bool = False
+    ) -> tuple[Pipeline, dict]:
+        """
+        Parameters:
+        - raw_input (bool): new_data holds raw listings. A pipeline without a 'features' step (e.g. one
+          trained on engineered rows only) cannot engineer them, so a full refit is reported instead.
+
+        Returns:
+        - tuple: (updated copy of the pipeline, or the production pipeline itself when it was not
+          updated; report with the drift metrics, 'updated' and 'needs_full_refit')
+        """
+        start = time.perf_counter()
+        if raw_input and "features" not in pipeline.named_steps:
+            logging.warning("The production pipeline has no 'features' step to engineer raw listings; a full refit is needed.")
+            return pipeline, {"n_rows": len(new_data), "n_used_rows": 0, "updated": False,
+                              "needs_full_refit": True, "drift_reasons": ["no serving steps for raw listings"]}
+
+        X, y, violation_rate = self.prepare(pipeline, new_data, target_column)
+        _, _, preprocessor, model = self._stages(pipeline)
+        report = {"n_rows": len(new_data), "n_used_rows": len(y), "violation_rate": violation_rate,
+                  "updated": False, "needs_full_refit": False}
+
+        if len(y) < self.min_rows:
+            logging.info(f"Only {len(y)} usable new row(s); keeping the production model unchanged.")
+            return pipeline, report
+
+        unknown_rates = unknown_category_rates(preprocessor[-1] if len(preprocessor) else None, X)
+        X_matrix = preprocessor.transform(X) if len(preprocessor) else X
+        report.update(
+            max_unknown_rate=max(unknown_rates.values(), default=0.0),
+            unknown_category_rates=unknown_rates,
+            r2_before=float(r2_score(y, model.predict(X_matrix))),
+        )
+        reasons = [
+            reason for reason, drifted in [
+                ("unknown categories", report["max_unknown_rate"] > self.max_unknown_rate),
+                ("rows outside training bounds", violation_rate > self.max_violation_rate),
+                ("accuracy on new rows", report["r2_before"] < self.min_r2),
+            ] if drifted
+        ]
+        if reasons:
+            report.update(needs_full_refit=True, drift_reasons=reasons)
+            logging.warning(f"Drift detected ({', '.join(reasons)}); a full refit is needed: {report}")
+            return pipeline, report
+
+        updated = copy.deepcopy(pipeline)
+        try:
+            continue_training(updated.steps[-1][1], X_matrix, y.to_numpy(), self.n_new_estimators)
+        except ValueError as e:
+            logging.warning(f"{e} A full refit is needed.")
+            report.update(needs_full_refit=True, drift_reasons=["model cannot be updated incrementally"])
+            return pipeline, report
+
+        report.update(
+            updated=True,
+            r2_after=float(r2_score(y, updated.steps[-1][1].predict(X_matrix))),
+            seconds=time.perf_counter() - start,
+        )
+        logging.info(f"Warm-started model on {len(y)} new row(s) in {report['seconds']:.2f}s: "
+                     f"R2 on new rows {report['r2_before']:.4f} -> {report['r2_after']:.4f}.")
+        return updated, report
+
+
+if __name__ == "__main__":
+    pass
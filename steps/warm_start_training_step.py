@@ -0,0 +1,76 @@
+import logging
+from typing import Annotated, Tuple
+
+import mlflow
+import pandas as pd
+from sklearn.pipeline import Pipeline
+from zenml import ArtifactConfig, Model, step
+from zenml.client import Client
+
+from .src.warm_start import WarmStartRetrainer
+
+# Active experiment tracker
+experiment_tracker = Client().active_stack.experiment_tracker
+
+
+@step(
+    enable_cache=False,
+    experiment_tracker=experiment_tracker.name,
+    model=Model(name="prices_predictor", version=None),
+)
+def warm_start_training_step(
+    production_model: Pipeline,
+    new_data: pd.DataFrame,
+    target_column: str = "selling_price",
+    n_new_estimators: int = 50,
+    max_unknown_rate: float = 0.05,
+    max_violation_rate: float = 0.05,
+    min_r2: float = 0.8,
+    min_rows: int = 20,
+) -> Tuple[
+    Annotated[Pipeline, ArtifactConfig(name="sklearn_pipeline", is_model_artifact=True)],
+    Annotated[bool, "deploy_decision"],
+    Annotated[bool, "needs_full_refit"],
+]:
+    """
+    Refreshes the production pipeline with newly arrived listings only: the model keeps its trees and
+    continues boosting on the new rows, while the feature plan, bounds and preprocessor stay as trained.
+
+    Parameters:
+    - production_model: Current production pipeline (model_loader).
+    - new_data: New labelled raw listings, target included. A production pipeline without a
+      'features' step cannot take them and is reported as needing a full refit.
+    - target_column: Target column.
+    - n_new_estimators: Trees added per refresh.
+    - max_unknown_rate, max_violation_rate, min_r2: Drift thresholds (see WarmStartRetrainer).
+    - min_rows: Fewer usable new rows leave the model unchanged.
+
+    Returns:
+    - Pipeline: Updated pipeline (the production pipeline itself if it was not updated).
+    - bool: Whether the updated pipeline should be deployed.
+    - bool: Whether drift was detected and a full training run is needed instead.
+    """
+    retrainer = WarmStartRetrainer(
+        n_new_estimators=n_new_estimators,
+        max_unknown_rate=max_unknown_rate,
+        max_violation_rate=max_violation_rate,
+        min_r2=min_r2,
+        min_rows=min_rows,
+    )
+
+    if not mlflow.active_run():
+        mlflow.start_run()
+
+    try:
+        pipeline, report = retrainer.retrain(production_model, new_data, target_column, raw_input=True)
+        mlflow.log_metrics({
+            key: float(value) for key, value in report.items() if isinstance(value, (bool, int, float))
+        })
+        mlflow.log_dict(report, "warm_start/report.json")
+        if report["updated"]:
+            mlflow.sklearn.log_model(pipeline, "model")
+    finally:
+        mlflow.end_run()
+
+    logging.info(f"Warm-start retraining report: {report}")
+    return pipeline, report["updated"], report["needs_full_refit"]
@@ -0,0 +1,37 @@
+import os
+import sys
+
+import pytest
+
+# The step modules are imported as steps.* / steps.src.* from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from steps.src.feature_engineering import FeaturePlan, pipeline_strategies, synthetic_listings
+
+
+@pytest.fixture
+def raw_listings():
+    # Raw car listings with the columns of data/archive.zip
+    return synthetic_listings(400, seed=0)
+
+
+@pytest.fixture
+def engineered_split(raw_listings):
+    # (X_train, y_train, X_test, y_test) of engineered listings, as the training pipeline builds them
+    df = FeaturePlan(pipeline_strategies()).fit_transform(raw_listings)
+    X, y = df.drop(columns=["selling_price"]), df["selling_price"]
+    return X.iloc[:320], y.iloc[:320], X.iloc[320:], y.iloc[320:]
+
+
+@pytest.fixture
+def make_preprocessed(engineered_split):
+    # PreprocessedData of the engineered split for a categorical encoding ('sparse', 'dense' or 'ordinal')
+    from steps.src.model_building import build_regression_pipeline
+    from steps.src.preprocessing import PreprocessedData
+
+    def make(categorical_encoding: str = "sparse") -> PreprocessedData:
+        X_train, y_train, X_test, y_test = engineered_split
+        preprocessor = build_regression_pipeline(X_train, categorical_encoding).named_steps["preprocessor"]
+        return PreprocessedData.fit(preprocessor, X_train, y_train, X_test, y_test)
+
+    return make
@@ -0,0 +1,104 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from joblib.externals.loky import get_reusable_executor
+from sklearn.linear_model import LinearRegression
+from sklearn.metrics import r2_score
+
+from steps.src.data_splitter import (
+    BinnedStratifiedKFoldStrategy,
+    DataSplitter,
+    KFoldStrategy,
+    SimpleTrainTestSplitStrategy,
+    StratifiedTrainTestSplitStrategy,
+    TimeOrderedSplitStrategy,
+    cross_validate,
+    split_positions,
+    take_split,
+)
+
+
+@pytest.fixture
+def df(raw_listings):
+    # Non-default index, so that positions and labels differ
+    return raw_listings.set_index(raw_listings.index * 3 + 7)
+
+
+@pytest.mark.parametrize("strategy", [SimpleTrainTestSplitStrategy, StratifiedTrainTestSplitStrategy])
+def test_split_spec_mask_round_trip(df, strategy):
+    splitter_strategy = strategy(test_size=0.25, random_state=1)
+    spec = DataSplitter(splitter_strategy).split_spec(df, "selling_price")
+    _, expected_test = splitter_strategy.split_indices(df, "selling_price")
+
+    # The spec is stored as a JSON artifact
+    spec = json.loads(json.dumps(spec))
+    train, test = split_positions(spec, "train"), split_positions(spec, "test")
+
+    np.testing.assert_array_equal(test, np.sort(expected_test))
+    assert len(np.intersect1d(train, test)) == 0
+    assert len(train) + len(test) == len(df)
+
+
+def test_take_split_materializes_rows(df):
+    spec = DataSplitter(SimpleTrainTestSplitStrategy(random_state=1)).split_spec(df, "selling_price")
+
+    X_train, y_train = take_split(df, spec, "train")
+    X_test, y_test = take_split(df, spec, "test")
+
+    assert "selling_price" not in X_train.columns
+    pd.testing.assert_frame_equal(X_train, df.iloc[split_positions(spec, "train")].drop(columns=["selling_price"]))
+    pd.testing.assert_series_equal(y_test, df["selling_price"].iloc[split_positions(spec, "test")])
+    assert sorted(X_train.index.append(X_test.index)) == sorted(df.index)
+
+
+def test_take_split_rejects_other_dataset(df):
+    spec = DataSplitter(SimpleTrainTestSplitStrategy()).split_spec(df, "selling_price")
+
+    with pytest.raises(ValueError):
+        take_split(df.iloc[:-1], spec)
+    with pytest.raises(ValueError):
+        split_positions(spec, "validation")
+
+
+@pytest.mark.parametrize("strategy", [KFoldStrategy(n_splits=4), BinnedStratifiedKFoldStrategy(n_splits=4, n_bins=5)])
+def test_folds_partition_the_rows(df, strategy):
+    folds = list(strategy.folds(df, "selling_price"))
+
+    assert len(folds) == 4
+    np.testing.assert_array_equal(np.sort(np.concatenate([test for _, test in folds])), np.arange(len(df)))
+    assert all(len(np.intersect1d(train, test)) == 0 and len(train) + len(test) == len(df) for train, test in folds)
+
+
+@pytest.mark.parametrize("ascending", [True, False])
+def test_time_ordered_folds_train_on_earlier_periods(df, ascending):
+    periods = df["year"] if ascending else 2025 - df["year"]
+    strategy = TimeOrderedSplitStrategy("year" if ascending else "age", n_splits=3, ascending=ascending)
+
+    folds = list(strategy.folds(df.assign(age=2025 - df["year"]), "selling_price"))
+
+    assert len(folds) == 3
+    for train, test in folds:
+        train_years, test_years = df["year"].iloc[train], df["year"].iloc[test]
+        # Whole periods on either side, the training ones strictly earlier
+        assert train_years.max() < test_years.min()
+        assert not set(periods.iloc[train]) & set(periods.iloc[test])
+
+
+def test_cross_validate_matches_fitting_each_fold(df):
+    numeric = df[["year", "km_driven", "selling_price"]]
+    strategy = KFoldStrategy(n_splits=3)
+
+    results = cross_validate(LinearRegression(), numeric, "selling_price", strategy, n_jobs=2, max_nbytes=None)
+    # joblib keeps its workers for reuse; stop them so later tests see no stray children
+    get_reusable_executor().shutdown(wait=True)
+
+    X, y = numeric[["year", "km_driven"]].to_numpy(), numeric["selling_price"].to_numpy(dtype=np.float64)
+    expected = [
+        r2_score(y[test], LinearRegression().fit(X[train], y[train]).predict(X[test]))
+        for train, test in strategy.folds(numeric, "selling_price")
+    ]
+    assert results["fold"].tolist() == [0, 1, 2]
+    np.testing.assert_allclose(results["R-Squared"], expected)
@@ -0,0 +1,103 @@
+import json
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from steps.src.feature_engineering import (
+    ColumnDropper,
+    ColumnReplacerWithDifference,
+    FeatureEngineer,
+    FeaturePlan,
+    LogTransformation,
+    OneHotEncoding,
+    StandardScaling,
+    pipeline_strategies,
+)
+
+
+def build_plan() -> FeaturePlan:
+    return FeaturePlan(pipeline_strategies() + [
+        StandardScaling(features=["km_driven"]),
+        OneHotEncoding(features=["fuel", "transmission"]),
+    ])
+
+
+def test_state_round_trip_reproduces_transform(raw_listings):
+    train, new = raw_listings.iloc[:300], raw_listings.iloc[300:]
+    fitted = build_plan()
+    fitted.fit_transform(train)
+
+    # The state is stored as a JSON artifact
+    state = json.loads(json.dumps(fitted.get_state()))
+    restored = build_plan().set_state(state)
+
+    pd.testing.assert_frame_equal(restored.transform(new), fitted.transform(new))
+
+
+def test_transform_does_not_refit(raw_listings):
+    plan = build_plan()
+    plan.fit_transform(raw_listings.iloc[:300])
+    state = plan.get_state()
+
+    # Only Diesel rows: a refit would change the scaler and the one-hot columns
+    plan.transform(raw_listings[raw_listings["fuel"] == "Diesel"])
+
+    assert plan.get_state() == state
+
+
+def test_set_state_rejects_other_strategies(raw_listings):
+    plan = build_plan()
+    plan.fit_transform(raw_listings)
+
+    with pytest.raises(ValueError):
+        FeaturePlan([LogTransformation(features=["selling_price"])]).set_state(plan.get_state())
+
+
+def chained(df: pd.DataFrame) -> pd.DataFrame:
+    frame = df.copy()
+    for strategy in pipeline_strategies():
+        frame = FeatureEngineer(strategy).apply_feature_engineering(frame)
+    return frame
+
+
+def test_plan_matches_chained_strategies_with_one_copy(raw_listings):
+    expected = chained(raw_listings)
+
+    with mock.patch.object(pd.DataFrame, "copy", autospec=True, side_effect=pd.DataFrame.copy) as copy:
+        result = FeaturePlan(pipeline_strategies()).apply(raw_listings)
+
+    pd.testing.assert_frame_equal(result, expected)
+    assert copy.call_count == 1
+    # The caller's frame is untouched
+    assert "brand" not in raw_listings.columns
+
+
+def test_adjacent_column_local_strategies_are_fused():
+    plan = FeaturePlan(pipeline_strategies())
+
+    assert [kind for kind, _ in plan.stages].count("fused") < len(plan.strategies)
+    assert sum(len(strategies) for _, strategies in plan.stages) == len(plan.strategies)
+
+
+def test_validate_reports_columns_read_before_they_exist(raw_listings):
+    FeaturePlan(pipeline_strategies()).validate(raw_listings.columns)
+
+    with pytest.raises(ValueError, match="year"):
+        FeaturePlan([ColumnDropper(columns=["year"]), ColumnReplacerWithDifference(2025, "year", "age")]).validate(
+            raw_listings.columns
+        )
+
+
+@pytest.mark.filterwarnings("ignore:Found unknown categories")
+def test_sparse_and_ordinal_encodings_match_dense(raw_listings):
+    features = ["fuel", "transmission"]
+    train, new = raw_listings.iloc[:300], raw_listings.iloc[300:].assign(fuel="Hydrogen")
+    encoders = {encoding: OneHotEncoding(features, encoding=encoding).fit(train) for encoding in OneHotEncoding.ENCODINGS}
+    dense, sparse, ordinal = (encoders[encoding].transform(new) for encoding in OneHotEncoding.ENCODINGS)
+
+    assert all(isinstance(sparse[col].dtype, pd.SparseDtype) for col in encoders["sparse"].output_columns())
+    pd.testing.assert_frame_equal(sparse.astype(dense.dtypes.to_dict()), dense)
+    # Ordinal codes stay in place of the categorical columns; the unseen fuel encodes as -1
+    assert list(ordinal.columns) == list(new.columns)
+    assert (ordinal["fuel"] == -1).all() and ordinal["transmission"].dtype == "int32"
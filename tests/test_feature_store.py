@@ -0,0 +1,79 @@
+import os
+
+import pandas as pd
+
+from steps.src.feature_engineering import FeaturePlan, pipeline_strategies
+from steps.src import feature_store as feature_store_module
+from steps.src.feature_store import IncrementalFeatureStore
+
+
+def plan() -> FeaturePlan:
+    return FeaturePlan(pipeline_strategies())
+
+
+def part_files(store_dir) -> list:
+    return [name for _, _, names in os.walk(store_dir) for name in names if name.endswith(".feather")]
+
+
+def test_reused_rows_match_direct_fit_transform(tmp_path, raw_listings):
+    store = IncrementalFeatureStore(store_dir=str(tmp_path))
+    history = raw_listings.iloc[:300]
+
+    first, state = store.transform(history, plan())
+    expected = plan().fit_transform(history)
+    pd.testing.assert_frame_equal(first, expected, check_dtype=False)
+
+    # Second run: history is reused, only the appended rows are engineered with the stored state
+    second, second_state = store.transform(raw_listings, plan())
+    assert second_state == state
+    pd.testing.assert_frame_equal(second, plan().set_state(state).transform(raw_listings), check_dtype=False)
+    assert len(part_files(tmp_path)) == 2
+
+
+def test_changed_rows_are_re_engineered(tmp_path, raw_listings):
+    store = IncrementalFeatureStore(store_dir=str(tmp_path))
+    store.transform(raw_listings, plan())
+
+    changed = raw_listings.copy()
+    changed.loc[changed.index[:5], "km_driven"] = 1
+    result, _ = store.transform(changed, plan())
+
+    assert (result["km_driven"].iloc[:5] == 1).all()
+    pd.testing.assert_frame_equal(result.iloc[5:], store.transform(raw_listings, plan())[0].iloc[5:], check_dtype=False)
+
+
+def test_compaction_keeps_only_current_rows(tmp_path, raw_listings):
+    store = IncrementalFeatureStore(store_dir=str(tmp_path), max_parts=1)
+    store.transform(raw_listings.iloc[:200], plan())
+    result, state = store.transform(raw_listings, plan())
+
+    assert len(part_files(tmp_path)) == 1
+    pd.testing.assert_frame_equal(result, plan().set_state(state).transform(raw_listings), check_dtype=False)
+    again, _ = store.transform(raw_listings, plan())
+    pd.testing.assert_frame_equal(again, result)
+
+
+def test_empty_input_with_compaction_due(tmp_path, raw_listings):
+    store = IncrementalFeatureStore(store_dir=str(tmp_path), max_parts=1)
+    store.transform(raw_listings.iloc[:200], plan())
+    store.transform(raw_listings, plan())
+    store.max_parts = 0
+
+    result, _ = store.transform(raw_listings.iloc[:0], plan())
+
+    assert len(result) == 0
+
+
+def test_code_change_invalidates_the_store(tmp_path, raw_listings, monkeypatch):
+    store = IncrementalFeatureStore(store_dir=str(tmp_path))
+    store.transform(raw_listings, plan())
+
+    # Same plan configuration, edited strategy source
+    code_version = feature_store_module.code_version
+    monkeypatch.setattr(feature_store_module, "code_version", lambda *objects: "edited" + code_version(*objects))
+    edited, engineered = plan(), []
+    edited.fit_transform = lambda df: engineered.append(len(df)) or FeaturePlan.fit_transform(edited, df)
+    store.transform(raw_listings, edited)
+
+    assert engineered == [len(raw_listings)]
+    assert len(os.listdir(tmp_path)) == 2
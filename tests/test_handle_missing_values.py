@@ -0,0 +1,47 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from steps.src.handle_missing_values import FillMissingValuesStrategy, FittedImputer, MissingValueHandler
+
+
+def listings_with_gaps() -> pd.DataFrame:
+    return pd.DataFrame({
+        "km_driven": [100.0, np.nan, 300.0, 400.0],
+        "mileage": np.array([20.0, 22.0, np.nan, 18.0], dtype=np.float32),
+        "fuel": pd.Categorical(["Diesel", None, "Diesel", "Petrol"]),
+        "owner": ["First Owner", "Second Owner", None, "Second Owner"],
+    })
+
+
+def test_statistics_match_pandas_and_keep_dtypes():
+    df = listings_with_gaps()
+
+    filled = MissingValueHandler(FittedImputer(numeric="median")).handle_missing_values(df)
+
+    assert not filled.isna().any().any()
+    assert filled.loc[1, "km_driven"] == df["km_driven"].median()
+    assert filled.loc[2, "mileage"] == df["mileage"].median() and filled["mileage"].dtype == np.float32
+    assert filled.loc[1, "fuel"] == "Diesel" and filled.loc[2, "owner"] == "Second Owner"
+    pd.testing.assert_frame_equal(FillMissingValuesStrategy("median").handle(df).drop(columns=["fuel", "owner"]),
+                                  filled.drop(columns=["fuel", "owner"]))
+
+
+def test_later_batches_are_filled_with_training_statistics():
+    imputer = FittedImputer().fit(listings_with_gaps())
+    # The state survives a JSON round trip, as it does between training and serving
+    restored = FittedImputer().set_state(json.loads(json.dumps(imputer.get_state())))
+    batch = pd.DataFrame({"km_driven": [np.nan], "fuel": pd.Categorical([None], categories=["CNG"])})
+
+    filled = restored.transform(batch)
+
+    assert filled.loc[0, "km_driven"] == pytest.approx(800 / 3)
+    # The training mode is added to the batch's categories
+    assert filled.loc[0, "fuel"] == "Diesel"
+
+
+def test_unfitted_imputer_refuses_to_transform():
+    with pytest.raises(RuntimeError):
+        FittedImputer().transform(listings_with_gaps())
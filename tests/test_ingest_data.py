@@ -0,0 +1,127 @@
+import zipfile
+
+import pandas as pd
+import pytest
+
+from steps.src.ingest_data import ZipDataIngestor, optimize_dtypes, parse_row_filter
+
+
+def write_zip(path, df: pd.DataFrame, member: str = "data.csv") -> str:
+    with zipfile.ZipFile(path, "w") as zip_ref:
+        zip_ref.writestr(member, df.to_csv(index=False))
+    return str(path)
+
+
+def test_auto_schema_is_inferred_once_for_all_chunks(tmp_path):
+    # First chunk: 'fuel' has few distinct values (category); second chunk: all distinct (object if inferred again)
+    df = pd.DataFrame({
+        "fuel": ["Diesel", "Petrol"] * 50 + [f"fuel_{i}" for i in range(100)],
+        "km": range(200),
+    })
+    path = write_zip(tmp_path / "data.zip", df)
+
+    ingestor = ZipDataIngestor(schema="auto")
+    chunks = list(ingestor.ingest_chunks(path, chunksize=100))
+
+    assert len(chunks) == 2
+    assert [str(chunk["fuel"].dtype) for chunk in chunks] == ["category", "category"]
+    assert ingestor.chunk_schema_["fuel"] == "category"
+    assert pd.concat(chunks)["fuel"].astype(str).tolist() == df["fuel"].tolist()
+
+
+def test_explicit_schema_applies_to_every_chunk(tmp_path):
+    df = pd.DataFrame({"fuel": ["Diesel", "Petrol", "CNG", "LPG"] * 25, "price": [1.5] * 100})
+    path = write_zip(tmp_path / "data.zip", df)
+
+    chunks = list(ZipDataIngestor(schema={"fuel": "category", "price": "float"}).ingest_chunks(path, chunksize=30))
+
+    assert {str(chunk["fuel"].dtype) for chunk in chunks} == {"category"}
+    assert {str(chunk["price"].dtype) for chunk in chunks} == {"float32"}
+
+
+def test_zip_member_is_read_without_extracting(tmp_path, monkeypatch):
+    df = pd.DataFrame({"name": ["Maruti Swift", "Honda City"], "km_driven": [12000, 45000]})
+    path = write_zip(tmp_path / "data.zip", df)
+    monkeypatch.chdir(tmp_path)
+
+    ingested = ZipDataIngestor().ingest(path)
+
+    pd.testing.assert_frame_equal(ingested, df)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["data.zip"]
+
+
+def test_zip_member_selection(tmp_path):
+    path = tmp_path / "data.zip"
+    with zipfile.ZipFile(path, "w") as zip_ref:
+        zip_ref.writestr("a.csv", "x\n1\n")
+        zip_ref.writestr("b.csv", "x\n2\n")
+        zip_ref.writestr("__MACOSX/._a.csv", "ignored")
+
+    with pytest.raises(ValueError, match="Multiple CSV files"):
+        ZipDataIngestor().ingest(str(path))
+    with pytest.raises(FileNotFoundError):
+        ZipDataIngestor(member="c.csv").ingest(str(path))
+    assert ZipDataIngestor(member="b.csv").ingest(str(path))["x"].tolist() == [2]
+    with pytest.raises(ValueError, match=".zip"):
+        ZipDataIngestor().ingest(str(tmp_path / "data.csv"))
+
+
+def test_chunks_stream_the_member_in_order(tmp_path):
+    df = pd.DataFrame({"km_driven": range(250)})
+    path = write_zip(tmp_path / "data.zip", df)
+
+    chunks = list(ZipDataIngestor().ingest_chunks(path, chunksize=100))
+
+    assert [len(chunk) for chunk in chunks] == [100, 100, 50]
+    assert pd.concat(chunks)["km_driven"].tolist() == list(range(250))
+
+
+def test_car_details_schema_keeps_listing_titles_as_strings(raw_listings):
+    from steps.data_ingestion_step import CAR_DETAILS_SCHEMA
+
+    df = optimize_dtypes(raw_listings, CAR_DETAILS_SCHEMA)
+
+    assert df["name"].dtype == object
+    assert str(df["fuel"].dtype) == "category"
+
+
+def test_projection_and_row_filters_are_pushed_into_the_read(tmp_path):
+    df = pd.DataFrame({
+        "year": [1998, 2005, 2012, 2019] * 25,
+        "fuel": ["Diesel", "Petrol"] * 50,
+        "seats": [5.0, None] * 50,
+        "km_driven": range(100),
+    })
+    path = write_zip(tmp_path / "data.zip", df)
+    ingestor = ZipDataIngestor(columns=["km_driven", "seats"], filters=["year >= 2005", "fuel == 'Diesel'"])
+
+    ingested = ingestor.ingest(path)
+    chunks = list(ingestor.ingest_chunks(path, chunksize=30))
+
+    expected = df[(df["year"] >= 2005) & (df["fuel"] == "Diesel")][["seats", "km_driven"]]
+    # Filter columns are parsed for the predicates but not returned
+    assert list(ingested.columns) == ["seats", "km_driven"]
+    assert ingested["km_driven"].tolist() == expected["km_driven"].tolist()
+    assert pd.concat(chunks)["km_driven"].tolist() == expected["km_driven"].tolist()
+
+
+def test_null_filters_and_unsupported_expressions(tmp_path):
+    df = pd.DataFrame({"seats": [5.0, None, 7.0], "km_driven": [1, 2, 3]})
+    path = write_zip(tmp_path / "data.zip", df)
+
+    assert ZipDataIngestor(filters=["seats not null"]).ingest(path)["km_driven"].tolist() == [1, 3]
+    assert ZipDataIngestor(filters=["seats is null"]).ingest(path)["km_driven"].tolist() == [2]
+    with pytest.raises(ValueError, match="Unsupported row filter"):
+        parse_row_filter("seats between 2 and 5")
+
+
+def test_required_columns_skip_columns_produced_by_earlier_strategies():
+    from steps.feature_engineering_step import build_strategies
+    from steps.src.feature_engineering import required_columns
+
+    strategies = build_strategies(["extract_column", "column_difference", "drop_column", "log_transform"])
+
+    columns = required_columns(strategies, ["km_driven"])
+
+    # 'age' is created from 'year' and 'brand' from 'name', so neither is requested from the source
+    assert columns == ["km_driven", "name", "year", "selling_price", "max_power"]
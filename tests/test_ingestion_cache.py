@@ -0,0 +1,82 @@
+import os
+import zipfile
+
+import pandas as pd
+import pytest
+
+from steps.src.ingest_data import CachedDataIngestor, ZipDataIngestor
+
+
+def write_zip(path, df: pd.DataFrame) -> str:
+    with zipfile.ZipFile(path, "w") as zip_ref:
+        zip_ref.writestr("data.csv", df.to_csv(index=False))
+    return str(path)
+
+
+# ZipDataIngestor that counts how often it parses its source
+class CountingIngestor(ZipDataIngestor):
+    def __init__(self, **options):
+        super().__init__(**options)
+        self.calls_ = 0
+
+    def ingest(self, file_path: str) -> pd.DataFrame:
+        self.calls_ += 1
+        return super().ingest(file_path)
+
+
+@pytest.fixture
+def listings_zip(tmp_path):
+    df = pd.DataFrame({"fuel": ["Diesel", "Petrol", "CNG"] * 10, "km_driven": range(30)})
+    return write_zip(tmp_path / "data.zip", df), df
+
+
+def test_repeated_ingestion_is_served_from_the_cache(tmp_path, listings_zip):
+    path, df = listings_zip
+    inner = CountingIngestor()
+    cached = CachedDataIngestor(inner, cache_dir=str(tmp_path / "cache"))
+
+    first, second = cached.ingest(path), cached.ingest(path)
+
+    assert inner.calls_ == 1
+    pd.testing.assert_frame_equal(first, df)
+    pd.testing.assert_frame_equal(second, df)
+
+
+def test_changed_content_or_options_miss_the_cache(tmp_path, listings_zip):
+    path, df = listings_zip
+    cache_dir = str(tmp_path / "cache")
+    inner = CountingIngestor()
+    CachedDataIngestor(inner, cache_dir=cache_dir).ingest(path)
+
+    write_zip(path, df.iloc[:10])
+    assert len(CachedDataIngestor(inner, cache_dir=cache_dir).ingest(path)) == 10
+    projected = CountingIngestor(columns=["km_driven"])
+    assert list(CachedDataIngestor(projected, cache_dir=cache_dir).ingest(path).columns) == ["km_driven"]
+
+    assert inner.calls_ == 2 and projected.calls_ == 1
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, listings_zip):
+    path, df = listings_zip
+    other = write_zip(tmp_path / "other.zip", df.iloc[:5])
+    cache_dir = tmp_path / "cache"
+    cached = CachedDataIngestor(ZipDataIngestor(), cache_dir=str(cache_dir), max_cache_bytes=1)
+
+    cached.ingest(path)
+    cached.ingest(other)
+
+    # Only the entry just written survives a limit smaller than one file
+    assert len([name for name in os.listdir(cache_dir) if name.endswith(".feather")]) == 1
+
+
+def test_cache_files_are_uncompressed_by_default(tmp_path, listings_zip):
+    import pyarrow.feather as feather
+
+    path, _ = listings_zip
+    cache_dir = tmp_path / "cache"
+    df = CachedDataIngestor(ZipDataIngestor(), cache_dir=str(cache_dir)).ingest(path)
+
+    # Same bytes as an explicitly uncompressed file, which memory mapping reads in place
+    reference = tmp_path / "reference.feather"
+    feather.write_feather(df, str(reference), compression="uncompressed")
+    assert next(cache_dir.glob("*.feather")).read_bytes() == reference.read_bytes()
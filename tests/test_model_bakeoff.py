@@ -0,0 +1,59 @@
+import multiprocessing
+
+import numpy as np
+import pytest
+from sklearn.base import clone
+
+from steps.src.model_building import (
+    GradientBoostingStrategy,
+    HistGradientBoostingStrategy,
+    LinearRegressionStrategy,
+    ModelBakeoff,
+    OutOfCoreSGDStrategy,
+)
+from steps.src.preprocessing import PreprocessedData
+
+
+def all_candidates():
+    return {
+        "linear_regression": LinearRegressionStrategy(),
+        "gradient_boosting": GradientBoostingStrategy(n_estimators=20, random_state=0),
+        "hist_gradient_boosting": HistGradientBoostingStrategy(max_iter=20),
+        "sgd": OutOfCoreSGDStrategy(),
+    }
+
+
+def test_sparse_matrix_skips_dense_only_candidates(make_preprocessed):
+    pipeline, report = ModelBakeoff(all_candidates(), max_workers=1).run_on_matrix(make_preprocessed("sparse"))
+
+    assert report["skipped"] == ["hist_gradient_boosting"]
+    assert {c["name"] for c in report["candidates"]} == {"linear_regression", "gradient_boosting", "sgd"}
+    assert set(report["test_metrics"]) == {"Mean Squared Error", "R-Squared"}
+    assert not multiprocessing.active_children()
+
+
+def test_only_dense_candidates_on_sparse_matrix_fail(make_preprocessed):
+    bakeoff = ModelBakeoff({"hist_gradient_boosting": HistGradientBoostingStrategy()}, max_workers=1)
+    with pytest.raises(ValueError, match="sparse"):
+        bakeoff.run_on_matrix(make_preprocessed("sparse"))
+
+
+def test_winner_is_selected_without_the_test_rows(make_preprocessed):
+    data = make_preprocessed("dense")
+    bakeoff = ModelBakeoff(all_candidates(), max_workers=1)
+    _, report = bakeoff.run_on_matrix(data)
+    # Same train rows, unrelated test targets
+    shuffled = PreprocessedData(
+        data.preprocessor, data.X_train, data.y_train, data.X_test, data.y_test.sample(frac=1, random_state=0)
+    )
+
+    pipeline, shuffled_report = bakeoff.run_on_matrix(shuffled)
+
+    assert report["skipped"] == []
+    assert shuffled_report["winner"] == report["winner"]
+    assert [c["metrics"] for c in shuffled_report["candidates"]] == [c["metrics"] for c in report["candidates"]]
+    assert shuffled_report["test_metrics"] != report["test_metrics"]
+    # The winner is refitted on all train rows
+    strategy = all_candidates()[report["winner"]]
+    refitted = clone(strategy.build_regressor()).fit(data.X_train, data.y_train.to_numpy())
+    assert np.allclose(pipeline.named_steps["model"].predict(data.X_test), refitted.predict(data.X_test))
@@ -0,0 +1,139 @@
+import multiprocessing
+import time
+
+import numpy as np
+import pytest
+from scipy import sparse
+from sklearn.ensemble import GradientBoostingRegressor
+from sklearn.preprocessing import MaxAbsScaler
+
+from steps.src.model_building import (
+    GradientBoostingStrategy,
+    HistGradientBoostingStrategy,
+    OutOfCoreSGDStrategy,
+    SuccessiveHalvingSearchStrategy,
+)
+from steps.src.step_cache import step_cache
+
+
+@pytest.mark.parametrize("n_candidates, factor, n_rungs", [(1, 3, 0), (3, 3, 1), (9, 3, 2), (10, 3, 3), (36, 3, 4), (8, 2, 3)])
+def test_search_rung_count(n_candidates, factor, n_rungs):
+    assert SuccessiveHalvingSearchStrategy(factor=factor)._n_rungs(n_candidates) == n_rungs
+
+
+def test_search_stops_at_one_survivor(engineered_split):
+    X_train, y_train, _, _ = engineered_split
+    strategy = SuccessiveHalvingSearchStrategy(
+        search_space={"n_estimators": [5, 10, 20], "max_depth": [1, 2, 3]},
+        estimator=GradientBoostingRegressor(random_state=0),
+        max_workers=1,
+    )
+
+    pipeline = strategy.build_and_train_model(X_train, y_train)
+
+    # 9 candidates on a third of the rows, then 3 on all of them; the survivor is only refitted
+    assert [trial["rung"] for trial in strategy.trials_] == [0] * 9 + [1] * 3
+    assert {trial["n_samples"] for trial in strategy.trials_ if trial["rung"] == 1} == {256}
+    assert pipeline.named_steps["model"].get_params()["n_estimators"] == strategy.best_params_["n_estimators"]
+    assert strategy.build_regressor().get_params()["max_depth"] == strategy.best_params_["max_depth"]
+    assert not multiprocessing.active_children()
+
+
+def test_search_time_budget_terminates_running_trials(engineered_split):
+    X_train, y_train, _, _ = engineered_split
+    strategy = SuccessiveHalvingSearchStrategy(
+        search_space={"n_estimators": [20_000, 20_001, 20_002]},
+        estimator=GradientBoostingRegressor(max_depth=1, random_state=0),
+        time_budget=1.0,
+        max_workers=1,
+    )
+    start = time.monotonic()
+
+    pipeline = strategy.build_and_train_model(X_train.iloc[:40], y_train.iloc[:40])
+
+    assert {trial["status"] for trial in strategy.trials_} == {"cancelled"}
+    assert strategy.best_score_ is None and pipeline.named_steps["model"].n_estimators == 20_000
+    # No worker keeps fitting in the background
+    assert not multiprocessing.active_children()
+    assert time.monotonic() - start < 60
+
+
+def test_sgd_trains_on_csr_matrix(make_preprocessed):
+    data = make_preprocessed("sparse")
+    assert data.is_sparse
+
+    model = OutOfCoreSGDStrategy().train_on_matrix(data).named_steps["model"]
+
+    # Scaling keeps the matrix CSR and matches sklearn's MaxAbsScaler on the dense matrix
+    scaled = model.named_steps["scaler"].transform(data.X_test)
+    assert sparse.issparse(scaled)
+    reference = MaxAbsScaler().fit(data.X_train.toarray()).transform(data.X_test.toarray())
+    assert np.allclose(scaled.toarray(), reference)
+    assert np.isfinite(model.predict(data.X_test)).all()
+
+
+# The strategies model_building_step builds for each model_type, with small settings
+MODEL_TYPES = {
+    "gradient_boosting": lambda: GradientBoostingStrategy(n_estimators=20, random_state=0),
+    "hist_gradient_boosting": lambda: HistGradientBoostingStrategy(max_iter=20),
+    "sgd": lambda: OutOfCoreSGDStrategy(),
+    "search": lambda: SuccessiveHalvingSearchStrategy(search_space={"n_estimators": [5, 10]}, max_workers=1),
+}
+
+
+@pytest.mark.parametrize("model_type", list(MODEL_TYPES))
+def test_model_types_on_default_preprocessing_output(model_type, engineered_split, monkeypatch):
+    from steps.preprocessing_step import preprocessing_step
+
+    monkeypatch.setattr(step_cache, "enabled", False)
+    X_train, y_train, X_test, y_test = engineered_split
+    data = preprocessing_step.entrypoint(X_train, y_train, X_test, y_test)
+    strategy = MODEL_TYPES[model_type]()
+
+    if not strategy.accepts_sparse:
+        with pytest.raises(ValueError, match="categorical_encoding='ordinal' or 'dense'"):
+            strategy.check_matrix(data)
+        with pytest.raises(ValueError, match="sparse"):
+            strategy.train_on_matrix(data)
+        return
+    pipeline = strategy.train_on_matrix(data)
+    assert np.isfinite(pipeline.predict(X_test)).all()
+
+
+@pytest.mark.parametrize("categorical_encoding", ["sparse", "dense", "ordinal"])
+@pytest.mark.parametrize("model_type", list(MODEL_TYPES))
+def test_model_types_on_preprocessed_data(model_type, categorical_encoding, make_preprocessed, engineered_split):
+    strategy = MODEL_TYPES[model_type]()
+    if categorical_encoding == "sparse" and not strategy.accepts_sparse:
+        pytest.skip("rejected before training, see test_model_types_on_default_preprocessing_output")
+    data = make_preprocessed(categorical_encoding)
+
+    pipeline = strategy.train_on_matrix(data)
+
+    assert np.isfinite(pipeline.predict(engineered_split[2])).all()
+    assert np.allclose(pipeline.named_steps["model"].predict(data.X_test), pipeline.predict(engineered_split[2]))
+
+
+def test_hist_gradient_boosting_keeps_ordinal_columns_categorical(make_preprocessed, engineered_split):
+    data = make_preprocessed("ordinal")
+    categorical = engineered_split[0].select_dtypes(include=["object", "category"]).columns
+
+    model = HistGradientBoostingStrategy(max_iter=20).train_on_matrix(data).named_steps["model"]
+
+    assert model.is_categorical_ is not None and model.is_categorical_.sum() == len(categorical) > 0
+    assert [name.startswith("cat__") for name in data.feature_names] == model.is_categorical_.tolist()
+
+
+def test_hist_gradient_boosting_scores_raw_categoricals_with_gaps(engineered_split):
+    X_train, y_train, X_test, _ = engineered_split
+    categorical = list(X_train.select_dtypes(include=["object", "category"]).columns)
+
+    pipeline = HistGradientBoostingStrategy(max_iter=20).build_and_train_model(X_train, y_train)
+
+    model = pipeline.named_steps["model"]
+    assert model.is_categorical_.sum() == len(categorical) > 0
+    assert model.n_iter_ <= 20
+    # Unseen categories and missing values are routed as missing, not rejected
+    unseen = X_test.astype({col: object for col in categorical}).assign(**{categorical[0]: "Unseen"})
+    unseen.iloc[:5, 0] = np.nan
+    assert np.isfinite(pipeline.predict(unseen)).all()
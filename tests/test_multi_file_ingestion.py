@@ -0,0 +1,49 @@
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+from steps.src.ingest_data import MultiFileDataIngestor, discover_shards, reconcile_frames
+
+
+def write_shards(directory):
+    # A ZIP with two CSV members and a plain CSV whose headers are spelled differently
+    with zipfile.ZipFile(directory / "part_a.zip", "w") as zip_ref:
+        zip_ref.writestr("1.csv", pd.DataFrame({"Km Driven": [1, 2], "fuel": ["Diesel", "Petrol"]}).to_csv(index=False))
+        zip_ref.writestr("2.csv", pd.DataFrame({"Km Driven": [3], "fuel": ["CNG"]}).to_csv(index=False))
+    pd.DataFrame({"km-driven": [4.5], "seats": [5]}).to_csv(directory / "part_b.csv", index=False)
+
+
+def test_shards_are_discovered_in_sorted_order(tmp_path):
+    write_shards(tmp_path)
+
+    shards = discover_shards(str(tmp_path))
+
+    assert [(path.split("/")[-1], member) for path, member in shards] == [
+        ("part_a.zip", "1.csv"), ("part_a.zip", "2.csv"), ("part_b.csv", None)
+    ]
+
+
+def test_shards_are_reconciled_on_normalized_headers(tmp_path):
+    write_shards(tmp_path)
+
+    df = MultiFileDataIngestor(max_workers=1).ingest(str(tmp_path))
+
+    assert list(df.columns) == ["km_driven", "fuel", "seats"]
+    # int and float shards promote to float; columns missing from a shard become NaN
+    assert df["km_driven"].dtype == np.float64
+    assert df["km_driven"].tolist() == [1.0, 2.0, 3.0, 4.5]
+    assert df["fuel"].isna().tolist() == [False, False, False, True]
+    assert df["seats"].dtype == np.float64 and df["seats"].isna().sum() == 3
+
+
+def test_reconcile_unions_categories_and_keeps_matching_frames():
+    first = pd.DataFrame({"fuel": pd.Categorical(["Diesel"]), "km": [1]})
+    second = pd.DataFrame({"fuel": pd.Categorical(["Petrol"]), "km": [2]})
+    third = pd.DataFrame({"fuel": ["CNG"], "km": [3]})
+
+    frames = reconcile_frames([first, second, third])
+
+    assert all(list(frame["fuel"].cat.categories) == ["Diesel", "Petrol", "CNG"] for frame in frames)
+    matching = pd.DataFrame({"km": [1]})
+    assert reconcile_frames([matching, pd.DataFrame({"km": [2]})])[0] is matching
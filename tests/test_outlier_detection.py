@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from steps.src.outlier_detection import (
+    BoundsValidator,
+    FeatureBounds,
+    IQROutlierDetection,
+    MultiColumnOutlierFilter,
+    OutlierDetector,
+    ZScoreOutlierDetection,
+)
+from steps.src.sklearn_transformers import BoundsGuard
+
+RULES = {"km_driven": {"method": "iqr", "threshold": 1.5}, "selling_price": "zscore"}
+
+
+def listings() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"km_driven": rng.normal(50_000, 5_000, 200), "selling_price": rng.normal(13.0, 0.5, 200)})
+    df.loc[3, "km_driven"] = 500_000
+    df.loc[7, "selling_price"] = 30.0
+    return df
+
+
+def test_one_pass_matches_the_chained_detectors():
+    df = listings()
+    expected = df
+    for col, strategy in (("km_driven", IQROutlierDetection(1.5)), ("selling_price", ZScoreOutlierDetection(3.0))):
+        expected = expected[~OutlierDetector(strategy).detect_outliers(expected[[col]]).any(axis=1)]
+
+    filtered, report = MultiColumnOutlierFilter(RULES).fit(df).filter(df)
+
+    # The chain refits on already filtered rows; here both drop the same rows, planted ones included
+    assert list(filtered.index) == list(expected.index)
+    assert 3 not in filtered.index and 7 not in filtered.index
+    assert report["rows_in"] == 200 and report["rows_removed"] == 200 - len(filtered)
+    assert report["flagged_per_column"]["km_driven"] >= 1 and report["flagged_per_column"]["selling_price"] >= 1
+
+
+def test_fitted_bounds_are_reused_on_later_batches():
+    outlier_filter = MultiColumnOutlierFilter(RULES).fit(listings())
+    bounds = outlier_filter.export_bounds()
+
+    batch = pd.DataFrame({"km_driven": [bounds.upper[0] + 1, 50_000.0], "selling_price": [13.0, np.nan]})
+
+    assert outlier_filter.outlier_flags(batch).tolist() == [[True, False], [False, False]]
+    with pytest.raises(RuntimeError):
+        MultiColumnOutlierFilter(RULES).filter(batch)
+    with pytest.raises(ValueError, match="Unknown outlier method"):
+        MultiColumnOutlierFilter({"km_driven": "isolation_forest"}).fit(listings())
+
+
+def batch() -> pd.DataFrame:
+    return pd.DataFrame({
+        "km_driven": np.array([10.0, 500.0, 50.0], dtype=np.float32),
+        "seats": [5, 5, 14],
+        "fuel": ["Diesel", "Petrol", "CNG"],
+    })
+
+
+def test_exported_bounds_round_trip():
+    bounds = OutlierDetector(IQROutlierDetection()).export_bounds(listings())
+
+    restored = FeatureBounds.from_dict(bounds.to_dict())
+
+    assert restored.columns == ["km_driven", "selling_price"]
+    np.testing.assert_array_equal(restored.lower, bounds.lower)
+    np.testing.assert_array_equal(restored.upper, bounds.upper)
+
+
+def test_flag_policy_reports_without_changing_the_batch():
+    validator = BoundsValidator(FeatureBounds(["km_driven", "seats", "mileage"], [0, 2, 5], [100, 10, 40]))
+    df = batch()
+
+    checked, violations, counts = validator.validate(df)
+    validator.validate(df)
+
+    assert checked is df
+    # Columns missing from the batch (mileage) are skipped
+    assert violations.tolist() == [[False, False], [True, False], [False, True]]
+    assert counts == {"km_driven": 1, "seats": 1}
+    assert validator.rows_seen_ == 6 and validator.violation_counts_ == {"km_driven": 2, "seats": 2, "mileage": 0}
+
+
+def test_guard_clips_to_the_bounds_and_keeps_dtypes():
+    bounds = FeatureBounds(["km_driven", "seats"], [0, 2], [100, 10]).to_dict()
+
+    clipped = BoundsGuard(bounds).fit(None).transform(batch())
+
+    assert clipped["km_driven"].tolist() == [10.0, 100.0, 50.0] and clipped["km_driven"].dtype == np.float32
+    assert clipped["seats"].tolist() == [5, 5, 10] and clipped["seats"].dtype == batch()["seats"].dtype
+    with pytest.raises(ValueError, match="policy"):
+        BoundsValidator(FeatureBounds.from_dict(bounds), policy="drop")
@@ -0,0 +1,80 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from steps.src.sketches import QuantileSketch, RunningMoments, StreamingStatistics, stream_statistics
+
+
+@pytest.fixture
+def values():
+    rng = np.random.default_rng(0)
+    values = rng.lognormal(mean=10, sigma=1, size=(20_000, 3))
+    values[rng.random(values.shape) < 0.05] = np.nan
+    return values
+
+
+def test_running_moments_match_numpy(values):
+    moments = RunningMoments(3)
+    for chunk in np.array_split(values, 7):
+        moments.update(chunk)
+
+    np.testing.assert_array_equal(moments.count, (~np.isnan(values)).sum(axis=0))
+    np.testing.assert_allclose(moments.mean, np.nanmean(values, axis=0), rtol=1e-10)
+    np.testing.assert_allclose(moments.std(), np.nanstd(values, axis=0, ddof=1), rtol=1e-10)
+
+
+def test_running_moments_merge_equals_single_pass(values):
+    left, right = RunningMoments(3).update(values[:5_000]), RunningMoments(3).update(values[5_000:])
+    merged = RunningMoments.from_dict(json.loads(json.dumps(left.to_dict()))).merge(right)
+    whole = RunningMoments(3).update(values)
+
+    np.testing.assert_array_equal(merged.count, whole.count)
+    np.testing.assert_allclose(merged.mean, whole.mean, rtol=1e-10)
+    np.testing.assert_allclose(merged.variance(), whole.variance(), rtol=1e-10)
+
+
+def rank_error(sketch: QuantileSketch, data: np.ndarray, qs) -> float:
+    data = np.sort(data)
+    ranks = np.searchsorted(data, sketch.quantile(qs), side="right") / len(data)
+    return float(np.max(np.abs(ranks - qs)))
+
+
+def test_quantile_sketch_within_rank_error(values):
+    data = values[:, 0][~np.isnan(values[:, 0])]
+    sketch = QuantileSketch(k=200, seed=0)
+    for chunk in np.array_split(data, 10):
+        sketch.update(chunk)
+    qs = np.linspace(0.01, 0.99, 99)
+
+    assert sketch.n == len(data)
+    assert rank_error(sketch, data, qs) <= QuantileSketch.rank_error(200)
+    assert sketch.quantile(0.0) == data.min() and sketch.quantile(1.0) == data.max()
+    # Far fewer items than values are kept
+    assert sum(len(items) for items in sketch.levels) < len(data) / 10
+
+
+def test_merged_quantile_sketches_within_rank_error(values):
+    data = values[:, 1][~np.isnan(values[:, 1])]
+    parts = [QuantileSketch(k=200, seed=seed).update(chunk) for seed, chunk in enumerate(np.array_split(data, 4))]
+    merged = QuantileSketch.from_dict(json.loads(json.dumps(parts[0].to_dict())))
+    for part in parts[1:]:
+        merged.merge(part)
+
+    assert merged.n == len(data)
+    assert rank_error(merged, data, np.linspace(0.01, 0.99, 99)) <= QuantileSketch.rank_error(200)
+
+
+def test_empty_sketch_returns_nan():
+    assert np.isnan(QuantileSketch().quantile(0.5))
+
+
+def test_streaming_statistics_match_pandas(raw_listings):
+    df = raw_listings[["km_driven", "year", "fuel", "seller_type"]]
+    stats = stream_statistics(np.array_split(df, 4))
+    restored = StreamingStatistics.from_dict(json.loads(json.dumps(stats.to_dict())))
+
+    pd.testing.assert_series_equal(restored.mean(), df[["km_driven", "year"]].mean(), check_names=False)
+    assert restored.mode().to_dict() == {"fuel": df["fuel"].mode()[0], "seller_type": df["seller_type"].mode()[0]}
+    assert abs(restored.quantile(0.5)["year"] - df["year"].median()) <= 1
@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+
+from steps.src.feature_engineering import FeaturePlan, pipeline_strategies
+from steps.src.model_building import build_regression_pipeline
+from steps.src.sklearn_transformers import FeaturePlanTransformer, make_serving_pipeline
+
+
+def test_serving_pipeline_scores_raw_listings_like_engineered_rows(raw_listings):
+    plan = FeaturePlan(pipeline_strategies())
+    engineered = plan.fit_transform(raw_listings)
+    X, y = engineered.drop(columns=["selling_price"]), engineered["selling_price"]
+    model_pipeline = build_regression_pipeline(X).fit(X, y)
+
+    features = FeaturePlanTransformer(
+        pipeline_strategies(), state=plan.get_state(), target_column="selling_price", output_columns=list(X.columns)
+    ).fit(None)
+    serving = make_serving_pipeline(features, model_pipeline)
+
+    # Requests carry no target
+    raw = raw_listings.drop(columns=["selling_price"]).iloc[:20]
+    np.testing.assert_allclose(serving.predict(raw), model_pipeline.predict(X.iloc[:20]))
+
+
+def test_transform_labeled_returns_engineered_target(raw_listings):
+    features = FeaturePlanTransformer(pipeline_strategies(), target_column="selling_price").fit(raw_listings)
+    original = raw_listings.copy()
+
+    X, y = features.transform_labeled(raw_listings)
+
+    pd.testing.assert_frame_equal(raw_listings, original)
+
+    assert "selling_price" not in X.columns
+    np.testing.assert_allclose(y, np.log1p(raw_listings["selling_price"]))
+    pd.testing.assert_frame_equal(X, features.transform(raw_listings))
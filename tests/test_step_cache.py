@@ -0,0 +1,111 @@
+import importlib
+import os
+import sys
+
+import pytest
+
+from steps.src import step_cache as step_cache_module
+from steps.src.step_cache import StepCache, cached_step, code_version
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    # cached_step looks the cache up by name at call time
+    cache = StepCache(str(tmp_path / "step_cache"))
+    monkeypatch.setattr(step_cache_module, "step_cache", cache)
+    return cache
+
+
+def clear_source_hashes():
+    for cached in (step_cache_module._module_source, step_cache_module._local_imports, step_cache_module._module_source_hash):
+        cached.cache_clear()
+
+
+@pytest.fixture
+def local_package(tmp_path, monkeypatch):
+    # cachepkg.step imports cachepkg.helpers only inside a function
+    package = tmp_path / "cachepkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "helpers.py").write_text("FACTOR = 2\n")
+    (package / "step.py").write_text(
+        "def scale(x):\n    from .helpers import FACTOR\n    return x * FACTOR\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield importlib.import_module("cachepkg.step"), package
+    for name in ("cachepkg", "cachepkg.step", "cachepkg.helpers"):
+        sys.modules.pop(name, None)
+    clear_source_hashes()
+
+
+def test_hit_on_same_arguments_miss_on_changed_ones(cache):
+    calls = []
+
+    @cached_step()
+    def double(x, factor=2):
+        calls.append(x)
+        return x * factor
+
+    assert double(3) == 6 and double(3) == 6
+    assert double(3, factor=3) == 9
+    assert calls == [3, 3]
+    assert cache.stats["double"] == {"hits": 1, "misses": 2}
+
+
+def test_disabled_cache_always_executes(cache):
+    cache.enabled = False
+    calls = []
+
+    @cached_step()
+    def double(x):
+        calls.append(x)
+        return x * 2
+
+    double(3), double(3)
+    assert calls == [3, 3] and not os.path.exists(cache.cache_dir)
+
+
+def test_code_version_covers_package_local_imports(local_package):
+    module, package = local_package
+    assert step_cache_module._module_closure({module.__name__}) == ["cachepkg.helpers", "cachepkg.step"]
+
+    before = code_version(module.scale)
+    (package / "helpers.py").write_text("FACTOR = 3\n")
+    clear_source_hashes()
+
+    assert code_version(module.scale) != before
+
+
+def test_editing_an_imported_helper_invalidates_the_entry(cache, local_package):
+    module, package = local_package
+    scale = cached_step()(module.scale)
+    scale(5), scale(5)
+    (package / "helpers.py").write_text("FACTOR = 3\n")
+    clear_source_hashes()
+
+    scale(5)
+
+    assert cache.stats["scale"] == {"hits": 1, "misses": 2}
+
+
+def test_step_closures_include_helper_modules():
+    import steps.feature_engineering_step
+    import steps.preprocessing_step
+
+    assert "steps.src.text_transforms" in step_cache_module._module_closure({steps.feature_engineering_step.__name__})
+    assert "steps.src.preprocessing" in step_cache_module._module_closure({steps.preprocessing_step.__name__})
+
+
+def test_incremental_feature_engineering_bypasses_the_cache(cache, raw_listings, tmp_path):
+    from steps.feature_engineering_step import feature_engineering_step
+
+    strategies = ["extract_column", "column_difference", "drop_column"]
+    store_dir = str(tmp_path / "feature_store")
+    for _ in range(2):
+        feature_engineering_step.entrypoint(raw_listings, strategies, incremental=True, store_dir=store_dir)
+    assert "feature_engineering_step" not in cache.stats
+    assert os.listdir(store_dir)
+
+    for _ in range(2):
+        feature_engineering_step.entrypoint(raw_listings, strategies)
+    assert cache.stats["feature_engineering_step"] == {"hits": 1, "misses": 1}
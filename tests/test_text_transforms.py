@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from steps.feature_engineering_step import build_strategies
+from steps.src.feature_engineering import NumericUnitParser, TypeCaster, UnitRemover
+from steps.src.text_transforms import LRUMemo, map_unique, parse_numeric_with_unit
+
+UNIT_PATTERNS = {"mileage": r"(kmpl|km/kg)", "engine": r"CC", "max_power": r"b(h)?p"}
+
+
+def test_numbers_are_parsed_with_and_without_units():
+    series = pd.Series(["23.4 kmpl", " 17 km/kg ", "1e2kmpl", "-.5", None, "n/a", "12 mph"], dtype=object)
+
+    parsed, unparsed = parse_numeric_with_unit(series, r"kmpl|km/kg", dtype=np.float64)
+
+    assert parsed.tolist()[:4] == [23.4, 17.0, 100.0, -0.5]
+    # Missing values stay missing; unknown text and units are reported
+    assert parsed.iloc[4:].isna().all() and unparsed == 2
+
+
+def test_capturing_unit_groups_and_plain_numbers_are_accepted():
+    series = pd.Series(["74 bhp", "80 bp", 90.5], dtype=object)
+
+    parsed, unparsed = parse_numeric_with_unit(series, r"b(h)?p", dtype=np.float64)
+
+    assert parsed.tolist() == [74.0, 80.0, 90.5] and unparsed == 0
+
+
+def test_parser_matches_strip_then_cast(raw_listings):
+    df = raw_listings[list(UNIT_PATTERNS)]
+    chained = TypeCaster({col: "float" for col in UNIT_PATTERNS}).apply_transformation(
+        UnitRemover(UNIT_PATTERNS).apply_transformation(df)
+    )
+
+    parser = NumericUnitParser(UNIT_PATTERNS)
+    parsed = parser.apply_transformation(df)
+
+    pd.testing.assert_frame_equal(parsed, chained.astype("float32"))
+    assert parser.unparsed_counts_ == {col: 0 for col in UNIT_PATTERNS}
+
+
+def test_unknown_strategy_keys_are_rejected():
+    assert len(build_strategies(["parse_units", "cast_seats"])) == 2
+
+    with pytest.raises(ValueError, match="one_hot_encode"):
+        build_strategies(["parse_units", "one_hot_encode"])
+
+
+def recording(func, seen):
+    # Vectorized transform that records the values it was called on
+    def transform(values):
+        seen.append(values.tolist())
+        return func(values)
+    return transform
+
+
+def test_map_unique_transforms_each_distinct_value_once():
+    series = pd.Series(["Maruti Swift", None, "Honda City", "Maruti Swift", None], index=[5, 4, 3, 2, 1], name="name")
+    seen = []
+
+    result = map_unique(series, recording(lambda values: values.str.split().str[0], seen))
+
+    pd.testing.assert_series_equal(result, series.str.split().str[0])
+    assert len(seen) == 1 and len(seen[0]) == 3
+
+
+def test_memo_only_computes_new_values_and_evicts_the_oldest():
+    memo, seen = LRUMemo(maxsize=2), []
+    double = recording(lambda values: values * 2, seen)
+
+    map_unique(pd.Series([1, 2, 1]), double, memo)
+    assert map_unique(pd.Series([2, 3]), double, memo).tolist() == [4, 6]
+    map_unique(pd.Series([1]), double, memo)
+
+    # 1 was the least recently used value when 3 came in
+    assert seen == [[1, 2], [3], [1]]
+    assert len(memo) == 2
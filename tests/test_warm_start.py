@@ -0,0 +1,48 @@
+import copy
+
+import pytest
+from sklearn.ensemble import GradientBoostingRegressor
+
+from steps.src.feature_engineering import FeaturePlan, pipeline_strategies
+from steps.src.model_building import build_regression_pipeline
+from steps.src.sklearn_transformers import FeaturePlanTransformer, make_serving_pipeline
+from steps.src.warm_start import WarmStartRetrainer
+
+
+@pytest.fixture
+def pipelines(raw_listings):
+    # (model-only pipeline, serving pipeline that takes raw listings), trained on the first 300 listings
+    plan = FeaturePlan(pipeline_strategies())
+    engineered = plan.fit_transform(raw_listings.iloc[:300])
+    X, y = engineered.drop(columns=["selling_price"]), engineered["selling_price"]
+    model_pipeline = build_regression_pipeline(
+        X, regressor=GradientBoostingRegressor(n_estimators=20, random_state=0)
+    ).fit(X, y)
+    features = FeaturePlanTransformer(
+        pipeline_strategies(), state=plan.get_state(), target_column="selling_price", output_columns=list(X.columns)
+    ).fit(None)
+    return model_pipeline, make_serving_pipeline(features, copy.deepcopy(model_pipeline))
+
+
+def test_raw_listings_need_serving_steps(pipelines, raw_listings):
+    model_pipeline, _ = pipelines
+
+    pipeline, report = WarmStartRetrainer(min_r2=float("-inf")).retrain(
+        model_pipeline, raw_listings.iloc[300:], "selling_price", raw_input=True
+    )
+
+    assert pipeline is model_pipeline
+    assert report["needs_full_refit"] and not report["updated"]
+
+
+def test_serving_pipeline_is_warm_started(pipelines, raw_listings):
+    _, serving = pipelines
+
+    updated, report = WarmStartRetrainer(n_new_estimators=5, min_r2=float("-inf"), max_unknown_rate=1.0).retrain(
+        serving, raw_listings.iloc[300:], "selling_price", raw_input=True
+    )
+
+    assert report["updated"] and not report["needs_full_refit"]
+    assert len(updated.named_steps["model"].estimators_) == 25
+    # The production pipeline itself is left untouched
+    assert len(serving.named_steps["model"].estimators_) == 20